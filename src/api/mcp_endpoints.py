@@ -438,28 +438,28 @@ class MCPEndpoints(LoggerMixin):
             created_tasks = []
             failed_tasks = []
 
-            for i, task_data in enumerate(tasks):
-                try:
-                    # Create context-aware task
-                    created_task = await self.mcp_service.create_context_aware_task(
-                        project_key, task_data, project_context
-                    )
-
-                    created_tasks.append({
-                        'index': i,
-                        'original_summary': task_data.get('summary', ''),
-                        'created_key': created_task.get('key', ''),
-                        'status': 'created'
-                    })
+            # Create all context-aware tasks together so JIRA sees bulk requests
+            results = await self.mcp_service.create_context_aware_tasks(
+                project_key, tasks, project_context
+            )
 
-                except Exception as e:
-                    self.logger.error(f"Failed to create task {i}: {e}")
+            for i, (task_data, created_task) in enumerate(zip(tasks, results)):
+                if isinstance(created_task, Exception):
+                    self.logger.error(f"Failed to create task {i}: {created_task}")
                     failed_tasks.append({
                         'index': i,
                         'original_summary': task_data.get('summary', ''),
-                        'error': str(e),
+                        'error': str(created_task),
                         'status': 'failed'
                     })
+                    continue
+
+                created_tasks.append({
+                    'index': i,
+                    'original_summary': task_data.get('summary', ''),
+                    'created_key': created_task.get('key', ''),
+                    'status': 'created'
+                })
 
             return jsonify({
                 'success': True,
@@ -1,5 +1,7 @@
 """API routes for the JIRA CSV Generator application."""
 
+import json
+
 from flask import Blueprint, request, jsonify, Response
 from typing import Dict, Any
 
@@ -37,8 +39,10 @@ class APIRoutes(LoggerMixin):
         
         # Task extraction endpoints
         api.add_url_rule('/parse-transcript', 'parse_transcript', self.parse_transcript, methods=['POST'])
+        api.add_url_rule('/parse-transcript/stream', 'parse_transcript_stream', self.parse_transcript_stream, methods=['POST'])
         api.add_url_rule('/extract-qa', 'extract_qa', self.extract_qa, methods=['POST'])
         api.add_url_rule('/process-enhanced', 'process_enhanced', self.process_enhanced, methods=['POST'])
+        api.add_url_rule('/process-enhanced/batch', 'process_enhanced_batch', self.process_enhanced_batch, methods=['POST'])
         
         # CSV generation endpoint (legacy)
         api.add_url_rule('/generate-csv', 'generate_csv', self.generate_csv, methods=['POST'])
@@ -122,6 +126,35 @@ class APIRoutes(LoggerMixin):
             self.logger.error(f"Unexpected error in parse_transcript: {e}")
             return jsonify({'error': 'Internal server error'}), 500
     
+    def parse_transcript_stream(self) -> Response:
+        """Stream tasks and Q&A from transcript as server-sent events."""
+        data = request.get_json()
+        if not data or 'transcript' not in data:
+            return jsonify({'error': 'Transcript text is required'}), 400
+        
+        transcript = data['transcript']
+        context = data.get('context', '')
+        
+        is_valid, error_msg = self.transcript_service.validate_transcript(transcript)
+        if not is_valid:
+            return jsonify({'error': error_msg}), 400
+        
+        def generate():
+            try:
+                for event in self.transcript_service.analyze_transcript_stream(transcript, context):
+                    yield f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+            except TranscriptError as e:
+                self.logger.error(f"Transcript error: {e}")
+                yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+            except AIServiceError as e:
+                self.logger.error(f"AI service error: {e}")
+                yield f"event: error\ndata: {json.dumps({'error': 'AI service temporarily unavailable'})}\n\n"
+            except Exception as e:
+                self.logger.error(f"Unexpected error in parse_transcript_stream: {e}")
+                yield f"event: error\ndata: {json.dumps({'error': 'Internal server error'})}\n\n"
+        
+        return Response(generate(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+    
     def extract_qa(self) -> Dict[str, Any]:
         """Extract Q&A from transcript."""
         try:
@@ -186,6 +219,27 @@ class APIRoutes(LoggerMixin):
             self.logger.error(f"Unexpected error in process_enhanced: {e}")
             return jsonify({'error': 'Internal server error'}), 500
     
+    def process_enhanced_batch(self) -> Dict[str, Any]:
+        """Process several transcripts, each with both tasks and Q&A extraction."""
+        try:
+            data = request.get_json()
+            items = data.get('transcripts') if data else None
+            if not isinstance(items, list) or not items:
+                return jsonify({'error': 'A non-empty transcripts list is required'}), 400
+            if not all(isinstance(item, dict) and 'transcript' in item for item in items):
+                return jsonify({'error': 'Each item needs transcript text'}), 400
+            
+            # Invalid transcripts are reported per item rather than failing the batch
+            results = self.transcript_service.analyze_transcripts_batch(
+                [(item['transcript'], item.get('context', '')) for item in items]
+            )
+            
+            return jsonify({'results': results})
+            
+        except Exception as e:
+            self.logger.error(f"Unexpected error in process_enhanced_batch: {e}")
+            return jsonify({'error': 'Internal server error'}), 500
+    
     def generate_csv(self) -> Response:
         """Generate CSV file from tasks."""
         try:
@@ -696,24 +750,25 @@ class APIRoutes(LoggerMixin):
             # Get project context for task enhancement
             context = asyncio.run(self.jira_service.get_project_context(project_key))
 
+            # Submit all tasks in one event loop so their creates share bulk requests
+            results = asyncio.run(self.jira_service.create_context_aware_tasks(
+                project_key=project_key,
+                task_datas=tasks,
+                context=context
+            ))
+
             created_tasks = []
             errors = []
 
-            for task in tasks:
-                try:
-                    # Create enhanced task with context
-                    enhanced_task = asyncio.run(self.jira_service.create_context_aware_task(
-                        project_key=project_key,
-                        task_data=task,
-                        context=context
-                    ))
-                    created_tasks.append(enhanced_task)
-                except Exception as task_error:
-                    self.logger.error(f"Failed to create task {task.get('summary', 'unknown')}: {task_error}")
+            for task, result in zip(tasks, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Failed to create task {task.get('summary', 'unknown')}: {result}")
                     errors.append({
                         'task': task.get('summary', 'unknown'),
-                        'error': str(task_error)
+                        'error': str(result)
                     })
+                else:
+                    created_tasks.append(result)
 
             return jsonify({
                 'success': len(created_tasks) > 0,
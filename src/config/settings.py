@@ -14,6 +14,7 @@ class OllamaConfig:
     timeout: int = 120
     temperature: float = 0.1
     top_p: float = 0.9
+    max_concurrent_requests: int = 4
 
 
 @dataclass
@@ -69,6 +70,10 @@ class AppConfig:
     max_tasks_per_transcript: int = 10
     max_questions_per_transcript: int = 8
     max_transcript_length: int = 50000
+    # Analyze long transcripts chunk by chunk so re-submitted edits reuse cached
+    # chunk results; off by default since chunks are extracted without each
+    # other's context and near-duplicate tasks across chunks aren't merged
+    chunked_transcript_analysis: bool = False
 
     # Legacy JIRA Configuration (for backward compatibility)
     default_reporter: str = "meeting@example.com"
@@ -97,11 +102,13 @@ class AppConfig:
         self.ollama.model_name = os.getenv("OLLAMA_MODEL", self.ollama.model_name)
         self.ollama.base_url = os.getenv("OLLAMA_URL", self.ollama.base_url)
         self.ollama.timeout = int(os.getenv("OLLAMA_TIMEOUT", self.ollama.timeout))
+        self.ollama.max_concurrent_requests = int(os.getenv("OLLAMA_MAX_CONCURRENT", self.ollama.max_concurrent_requests))
         
         # Processing limits
         self.max_tasks_per_transcript = int(os.getenv("MAX_TASKS", self.max_tasks_per_transcript))
         self.max_questions_per_transcript = int(os.getenv("MAX_QUESTIONS", self.max_questions_per_transcript))
         self.max_transcript_length = int(os.getenv("MAX_TRANSCRIPT_LENGTH", self.max_transcript_length))
+        self.chunked_transcript_analysis = os.getenv("CHUNKED_TRANSCRIPT_ANALYSIS", "false").lower() == "true"
 
         # MCP configuration
         self.mcp.atlassian_server_url = os.getenv("MCP_ATLASSIAN_URL", self.mcp.atlassian_server_url)
@@ -113,7 +113,7 @@ class ContextFactors:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SimilarIssue:
     """Existing JIRA issue that may be related to extracted task."""
     issue_key: str
@@ -40,7 +40,7 @@ class TaskSuggestion:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EnhancedTask(JiraTask):
     """Task enriched with JIRA project context and AI suggestions."""
 
@@ -60,8 +60,8 @@ class EnhancedTask(JiraTask):
 
     def __post_init__(self):
         """Enhanced validation including project context."""
-        # Call parent validation first
-        super().__post_init__()
+        # Call parent validation first (zero-arg super() breaks with slots=True)
+        JiraTask.__post_init__(self)
 
         # Additional validation for enhanced features
         if self.project_context_score < 0.0 or self.project_context_score > 1.0:
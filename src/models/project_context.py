@@ -1,11 +1,21 @@
 """Project context data models for JIRA project metadata and context awareness."""
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, FrozenSet
 from enum import Enum
 
 
+# Epic summary words must be longer than this to be used as link keywords
+EPIC_KEYWORD_MIN_LENGTH = 3
+
+
+def _keyword_tokens(text: str) -> List[str]:
+    """Split text into lowercase word tokens, ignoring punctuation."""
+    return re.findall(r'\w+', text.lower())
+
+
 class SprintState(Enum):
     """Sprint state enumeration."""
     FUTURE = "future"
@@ -155,7 +165,7 @@ class ComponentInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectContext:
     """Comprehensive JIRA project context for AI-enhanced task creation."""
 
@@ -174,10 +184,41 @@ class ProjectContext:
     last_updated: datetime = field(default_factory=datetime.now)
     cache_expires: datetime = field(default_factory=lambda: datetime.now() + timedelta(minutes=30))
 
+    # Derived: lowercased epic summary word -> epics containing it
+    epic_keyword_index: Dict[str, List[EpicInfo]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Derived: issue types and components by name for O(1) lookups
+    issue_type_by_name: Dict[str, IssueTypeInfo] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    component_by_name: Dict[str, ComponentInfo] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    issue_type_names: FrozenSet[str] = field(
+        default_factory=frozenset, init=False, repr=False, compare=False
+    )
+    component_names: FrozenSet[str] = field(
+        default_factory=frozenset, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Validate project context after initialization."""
         if not self.project_key or not self.project_name:
             raise ValueError("Project key and name are required")
+        self.rebuild_epic_index()
+        self.issue_type_by_name = {it.name: it for it in self.issue_types}
+        self.component_by_name = {component.name: component for component in self.components}
+        self.issue_type_names = frozenset(self.issue_type_by_name)
+        self.component_names = frozenset(self.component_by_name)
+
+    def rebuild_epic_index(self) -> None:
+        """Rebuild the epic keyword index; call after changing available_epics."""
+        index: Dict[str, List[EpicInfo]] = {}
+        for epic in self.available_epics:
+            for word in {word for word in _keyword_tokens(epic.summary) if len(word) > EPIC_KEYWORD_MIN_LENGTH}:
+                index.setdefault(word, []).append(epic)
+        self.epic_keyword_index = index
 
     def is_cache_valid(self) -> bool:
         """Check if cached project context is still valid."""
@@ -221,6 +262,20 @@ class ProjectContext:
 
         return matches
 
+    def find_epics_for_text(self, text: str) -> List[EpicInfo]:
+        """
+        Find every epic sharing a keyword with text, in order of first match.
+
+        A text word matches an epic keyword it starts with, so "payments" and
+        "payment." both match an epic about "Payment processing".
+        """
+        matches: Dict[str, EpicInfo] = {}
+        for token in _keyword_tokens(text):
+            for end in range(EPIC_KEYWORD_MIN_LENGTH + 1, len(token) + 1):
+                for epic in self.epic_keyword_index.get(token[:end], ()):
+                    matches.setdefault(epic.key, epic)
+        return list(matches.values())
+
     def get_issue_type_by_name(self, name: str) -> Optional[IssueTypeInfo]:
         """Get issue type by name (case-insensitive)."""
         name_lower = name.lower()
@@ -3,7 +3,7 @@
 import json
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 
 import requests
 
@@ -12,6 +12,245 @@ from ..exceptions import AIServiceError, TranscriptError
 from ..utils import LoggerMixin
 from .cache_service import CacheService, cached_ai_response
 
+# Prompt templates are rendered once per service with a placeholder for the
+# document, then split around it so each request is a plain concatenation
+PROMPT_TEXT_MARKER = "\x00TEXT\x00"
+
+TASK_PROMPT_TEMPLATES = {
+    "refinement": """Extract actionable tasks from this refinement document. Return results as a JSON array.
+
+REFINEMENT DOCUMENT:
+{text}
+
+Find ALL implementable tasks, development items, and technical requirements. Each task should be a separate JSON object.
+
+Return ONLY a JSON array in this exact format:
+[
+  {{
+    "summary": "Task title (clear and actionable)",
+    "description": "Detailed task description with acceptance criteria",
+    "issue_type": "Story"
+  }}
+]
+
+Look for:
+- User stories and feature requirements
+- Technical specifications to implement
+- Bug fixes and improvements mentioned
+- API endpoints to create/modify
+- UI/UX changes needed
+- Database schema changes
+- Testing requirements
+- Documentation updates
+
+Focus on breaking down large features into specific, implementable tasks.
+Return multiple objects in the array - one for each task found. If no tasks, return [].""",
+    "meeting": """Extract actionable tasks from this meeting transcript or document. Return results as a JSON array.
+
+DOCUMENT:
+{text}
+
+Find ALL tasks, action items, and assignments mentioned. Each task should be a separate JSON object.
+
+Return ONLY a JSON array in this exact format:
+[
+  {{
+    "summary": "Task title (clear and actionable)",
+    "description": "Task description with context and details",
+    "issue_type": "Task"
+  }}
+]
+
+Look for:
+- Explicit assignments ("John will do X")
+- Work items mentioned ("We need to update Y")
+- Bug reports ("There's an issue with Z")
+- Follow-up tasks from decisions
+- Action items and deliverables
+- Research tasks and investigations
+
+Return multiple objects in the array - one for each task found. If no tasks, return [].""",
+}
+
+# Appended to task extraction prompts when the caller supplies context
+TASK_CONTEXT_TEMPLATE = """
+
+ADDITIONAL CONTEXT:
+{context}
+
+Use this context to:
+- Better understand technical terms and project-specific language
+- Improve task descriptions with relevant background
+- Categorize tasks more accurately based on project context
+- Add appropriate details based on team roles and project requirements"""
+
+# Single-call tasks + Q&A prompt; issue_type and reporter are bound per service
+COMBINED_PROMPT_TEMPLATE = """Extract actionable tasks and all questions asked from this meeting transcript or document. Return results as a JSON object.
+
+DOCUMENT:
+{text}
+
+Return ONLY a JSON object in this exact format:
+{{
+  "tasks": [
+    {{
+      "summary": "Task title (clear and actionable)",
+      "description": "Task description with context and details",
+      "issue_type": "{issue_type}"
+    }}
+  ],
+  "qa_items": [
+    {{
+      "question": "Question text?",
+      "context": "Background context about what was being discussed when this question was asked",
+      "answer": "The answer text if found, or empty string if no answer",
+      "asked_by": "{reporter}",
+      "answered_by": "{reporter} or empty if no answer"
+    }}
+  ]
+}}
+
+For tasks, look for assignments, work items, bug reports, follow-ups from decisions,
+requirements to implement and research items. For qa_items, only include actual questions.
+Use an empty array for either key if nothing is found."""
+
+# Appended to the combined prompt when the caller supplies context
+COMBINED_CONTEXT_TEMPLATE = """
+
+ADDITIONAL CONTEXT:
+{context}
+
+Use this context to better understand project-specific language, improve task
+descriptions and provide richer background for each question."""
+
+
+# Characters skipped between tokens while incrementally parsing a streamed JSON response
+JSON_STREAM_WHITESPACE = frozenset(' \t\r\n')
+JSON_STREAM_ITEM_SEPARATORS = JSON_STREAM_WHITESPACE | {','}
+# Before the top-level value the model may also emit a markdown fence
+JSON_STREAM_PREAMBLE = JSON_STREAM_WHITESPACE | {'`'}
+
+
+class _JSONStreamReader:
+    """Buffer over streamed text fragments that decodes JSON values as they complete."""
+    
+    def __init__(self, fragments: Iterable[str]):
+        self._fragments = iter(fragments)
+        self._decoder = json.JSONDecoder()
+        self.text = ""
+        self.pos = 0
+    
+    def _read_more(self) -> bool:
+        fragment = next(self._fragments, None)
+        if fragment is None:
+            return False
+        self.text = self.text[self.pos:] + fragment
+        self.pos = 0
+        return True
+    
+    def peek(self, skip: frozenset) -> Optional[str]:
+        """Skip characters in skip and return the next one, or None at end of stream."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in skip:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self._read_more():
+                return None
+    
+    def decode(self) -> Any:
+        """Decode the value at the current position, reading until it is complete."""
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+            # A number ending the buffer may continue in the next fragment
+            if (end == len(self.text) and isinstance(value, (int, float))
+                    and not isinstance(value, bool) and self._read_more()):
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_json_array(reader: _JSONStreamReader) -> Iterator[Any]:
+    """Yield the items of the array starting at the reader's position."""
+    reader.pos += 1
+    while True:
+        char = reader.peek(JSON_STREAM_ITEM_SEPARATORS)
+        if char is None:
+            return
+        if char == ']':
+            reader.pos += 1
+            return
+        yield reader.decode()
+
+
+def _iter_json_object_items(reader: _JSONStreamReader) -> Iterator[Any]:
+    """
+    Yield items from the object starting at the reader's position.
+    
+    Objects found in an array value (the {"tasks": [...]} wrapper) are yielded
+    as they complete; an object without any is itself the single item.
+    """
+    reader.pos += 1
+    obj: Dict[str, Any] = {}
+    found_nested = False
+    while True:
+        char = reader.peek(JSON_STREAM_ITEM_SEPARATORS)
+        if char is None or char == '}':
+            break
+        key = reader.decode()
+        if reader.peek(JSON_STREAM_WHITESPACE) != ':':
+            return
+        reader.pos += 1
+        if reader.peek(JSON_STREAM_WHITESPACE) == '[':
+            values = []
+            for item in _iter_json_array(reader):
+                values.append(item)
+                if isinstance(item, dict):
+                    found_nested = True
+                    yield item
+            obj[key] = values
+        else:
+            obj[key] = reader.decode()
+    
+    if not found_nested:
+        yield obj
+
+
+def _iter_json_stream_items(fragments: Iterable[str]) -> Iterator[Any]:
+    """
+    Yield items of a streamed JSON response as soon as each one is complete.
+    
+    Accepts a top-level array, an object wrapping the array in one of its
+    keys, or a single object, matching what models return in JSON mode.
+    Parsing stops quietly at the first malformed or truncated value.
+    """
+    reader = _JSONStreamReader(fragments)
+    char = reader.peek(JSON_STREAM_PREAMBLE)
+    # Markdown fence language tag
+    if char == 'j' and reader.text.startswith('json', reader.pos):
+        reader.pos += 4
+        char = reader.peek(JSON_STREAM_PREAMBLE)
+    
+    try:
+        if char == '[':
+            yield from _iter_json_array(reader)
+        elif char == '{':
+            yield from _iter_json_object_items(reader)
+    except json.JSONDecodeError:
+        return
+
+
+def _split_template(template: str, **values: str) -> Tuple[str, str]:
+    """Render a template around PROMPT_TEXT_MARKER and return the text before and after it."""
+    rendered = template.format(text=PROMPT_TEXT_MARKER, context=PROMPT_TEXT_MARKER, **values)
+    head, _, tail = rendered.partition(PROMPT_TEXT_MARKER)
+    return head, tail
+
 
 class AIService(ABC, LoggerMixin):
     """Abstract base class for AI services."""
@@ -26,6 +265,22 @@ class AIService(ABC, LoggerMixin):
         """Extract questions and answers from transcript."""
         pass
     
+    def parse_transcript_and_questions(self, transcript: str, context: str = "") -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Extract tasks and Q&A from transcript; services may fuse both into one call."""
+        return self.parse_transcript(transcript, context), self.extract_questions(transcript, context)
+    
+    def parse_transcript_chunk(self, chunk: str, context: str = "") -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Extract tasks and Q&A from one chunk of a longer transcript; services may skip per-call fallbacks."""
+        return self.parse_transcript_and_questions(chunk, context)
+    
+    def extract_tasks_iteratively(self, transcript: str, context: str = "") -> List[Dict[str, Any]]:
+        """Extract tasks with the service's slower fallback strategy, for when too few were found."""
+        return self.parse_transcript(transcript, context)
+    
+    def parse_transcript_stream(self, transcript: str, context: str = "") -> Iterator[Dict[str, Any]]:
+        """Yield tasks as they are extracted; services may stream them from the model."""
+        yield from self.parse_transcript(transcript, context)
+    
     @abstractmethod
     def test_connection(self) -> bool:
         """Test if the AI service is available."""
@@ -44,6 +299,22 @@ class OllamaService(AIService):
         """
         self.config = config
         self.api_url = f"{config.ollama.base_url}/api/generate"
+        
+        # Pre-render prompt templates; only the document and context vary per call
+        self._task_prompt_parts = {
+            doc_type: _split_template(template)
+            for doc_type, template in TASK_PROMPT_TEMPLATES.items()
+        }
+        self._task_context_parts = _split_template(TASK_CONTEXT_TEMPLATE)
+        self._combined_prompt_parts = {
+            doc_type: _split_template(
+                COMBINED_PROMPT_TEMPLATE,
+                issue_type="Story" if doc_type == "refinement" else "Task",
+                reporter=config.default_reporter
+            )
+            for doc_type in TASK_PROMPT_TEMPLATES
+        }
+        self._combined_context_parts = _split_template(COMBINED_CONTEXT_TEMPLATE)
         self._cache_service = CacheService()
     
     @cached_ai_response("parse_transcript")
@@ -72,14 +343,7 @@ class OllamaService(AIService):
             self.logger.info("Starting task extraction from transcript")
             
             # Try multi-task extraction first with context
-            prompt = self._create_task_extraction_prompt(transcript, context)
-            response_text = self._call_ollama(prompt)
-            
-            if not response_text:
-                raise AIServiceError("No response received from Ollama")
-            
-            tasks = self._parse_ollama_response(response_text)
-            validated_tasks = self._validate_tasks(tasks)
+            validated_tasks = self._extract_tasks_single_call(transcript, context)
             
             # If only one task found, try iterative approach
             if len(validated_tasks) <= 1:
@@ -124,6 +388,160 @@ class OllamaService(AIService):
             self.logger.error(f"Error extracting Q&A: {e}")
             raise AIServiceError(f"Failed to extract Q&A: {str(e)}")
     
+    def parse_transcript_stream(self, transcript: str, context: str = "") -> Iterator[Dict[str, Any]]:
+        """
+        Yield tasks from transcript as soon as the model has generated each one.
+        
+        Uses the same prompt as parse_transcript but with a streamed response.
+        The iterative fallback only runs when nothing was streamed, because
+        tasks already yielded can't be replaced.
+        
+        Args:
+            transcript: Raw meeting transcript text
+            context: Additional context to enhance AI processing
+            
+        Yields:
+            Validated task dictionaries
+            
+        Raises:
+            TranscriptError: If transcript is invalid
+            AIServiceError: If AI service fails
+        """
+        if not transcript.strip():
+            raise TranscriptError("Transcript text cannot be empty")
+        
+        if len(transcript) > self.config.max_transcript_length:
+            raise TranscriptError(f"Transcript too long (max {self.config.max_transcript_length} chars)")
+        
+        cached_tasks = self._cache_service.get_ai_response(transcript, context, "parse_transcript")
+        if cached_tasks is not None:
+            yield from cached_tasks
+            return
+        
+        self.logger.info("Starting streamed task extraction from transcript")
+        prompt = self._create_task_extraction_prompt(transcript, context)
+        tasks = []
+        
+        for item in _iter_json_stream_items(self._call_ollama_stream(prompt)):
+            if not isinstance(item, dict):
+                continue
+            validated = self._validate_tasks([item])
+            if not validated:
+                continue
+            tasks.append(validated[0])
+            yield validated[0]
+            if len(tasks) >= self.config.max_tasks_per_transcript:
+                break
+        
+        # Nothing has been yielded yet, so the iterative fallback can still run
+        if not tasks:
+            self.logger.info("No tasks streamed, trying iterative extraction")
+            for task in self._extract_tasks_iteratively(transcript, context)[:self.config.max_tasks_per_transcript]:
+                tasks.append(task)
+                yield task
+        
+        self.logger.info(f"Streamed {len(tasks)} tasks")
+        
+        # parse_transcript would have kept this result as-is only with several tasks
+        if len(tasks) > 1:
+            self._cache_service.cache_ai_response(transcript, context, "parse_transcript", tasks)
+    
+    @cached_ai_response("parse_transcript_and_questions")
+    def parse_transcript_and_questions(self, transcript: str, context: str = "") -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Extract tasks and Q&A from transcript with a single model call.
+        
+        Falls back to the separate extraction calls if the combined
+        response can't be parsed.
+        
+        Args:
+            transcript: Raw meeting transcript text
+            context: Additional context to enhance AI processing
+            
+        Returns:
+            Tuple of (task dictionaries, Q&A dictionaries)
+            
+        Raises:
+            TranscriptError: If transcript is invalid
+            AIServiceError: If AI service fails
+        """
+        validated_tasks, qa_items = self._extract_combined(transcript, context)
+        
+        # If only one task found, try iterative approach
+        if len(validated_tasks) <= 1:
+            self.logger.info("Trying iterative extraction for more tasks")
+            iterative_tasks = self._extract_tasks_iteratively(transcript, context)
+            if len(iterative_tasks) > len(validated_tasks):
+                validated_tasks = iterative_tasks
+        
+        return (validated_tasks[:self.config.max_tasks_per_transcript],
+                qa_items[:self.config.max_questions_per_transcript])
+    
+    @cached_ai_response("parse_transcript_chunk")
+    def parse_transcript_chunk(self, chunk: str, context: str = "") -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Extract tasks and Q&A from one chunk of a longer transcript.
+        
+        Same single model call as parse_transcript_and_questions, but without
+        the iterative fallback: a chunk often holds only one task, and the
+        caller applies the fallback once to the merged result instead.
+        
+        Args:
+            chunk: Part of a meeting transcript
+            context: Additional context to enhance AI processing
+            
+        Returns:
+            Tuple of (task dictionaries, Q&A dictionaries)
+            
+        Raises:
+            TranscriptError: If chunk is invalid
+            AIServiceError: If AI service fails
+        """
+        return self._extract_combined(chunk, context)
+    
+    def extract_tasks_iteratively(self, transcript: str, context: str = "") -> List[Dict[str, Any]]:
+        """Extract tasks by listing them first and then detailing each one."""
+        return self._extract_tasks_iteratively(transcript, context)
+    
+    def _extract_combined(self, transcript: str, context: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Run the combined extraction call and return validated tasks and Q&A items."""
+        if not transcript.strip():
+            raise TranscriptError("Transcript text cannot be empty")
+        
+        if len(transcript) > self.config.max_transcript_length:
+            raise TranscriptError(f"Transcript too long (max {self.config.max_transcript_length} chars)")
+        
+        self.logger.info("Starting combined task and Q&A extraction from transcript")
+        prompt = self._create_combined_extraction_prompt(transcript, context)
+        # Connection errors and timeouts propagate; retrying as separate calls would
+        # only wait through the same failure twice more
+        response_text = self._call_ollama(prompt)
+        
+        try:
+            tasks_data, qa_data = self._parse_combined_response(response_text or '')
+        except AIServiceError as e:
+            self.logger.warning(f"Combined response unusable, using separate calls: {e}")
+            return self._extract_tasks_single_call(transcript, context), self.extract_questions(transcript, context)
+        
+        validated_tasks = self._validate_tasks(tasks_data)
+        qa_items = [
+            validated_qa for validated_qa in (self._validate_qa_item(qa) for qa in qa_data)
+            if validated_qa
+        ]
+        
+        self.logger.info(f"Extracted {len(validated_tasks)} tasks and {len(qa_items)} Q&A items")
+        return validated_tasks, qa_items
+    
+    def _extract_tasks_single_call(self, transcript: str, context: str) -> List[Dict[str, Any]]:
+        """Extract tasks with one task-list model call and validate them."""
+        prompt = self._create_task_extraction_prompt(transcript, context)
+        response_text = self._call_ollama(prompt)
+        
+        if not response_text:
+            raise AIServiceError("No response received from Ollama")
+        
+        return self._validate_tasks(self._parse_ollama_response(response_text))
+    
     def test_connection(self) -> bool:
         """Test if Ollama service is available."""
         try:
@@ -169,79 +587,63 @@ class OllamaService(AIService):
             self.logger.error(f"Ollama API call failed: {e}, URL: {self.api_url}, Payload: {payload}")
             raise AIServiceError(f"Ollama API call failed: {e}")
     
+    def _call_ollama_stream(self, prompt: str, use_json_format: bool = True) -> Iterator[str]:
+        """Make a streaming API call to Ollama, yielding response text fragments."""
+        payload = {
+            "model": self.config.ollama.model_name,
+            "prompt": prompt,
+            "stream": True,
+            "options": {
+                "temperature": self.config.ollama.temperature,
+                "top_p": self.config.ollama.top_p
+            }
+        }
+        
+        if use_json_format:
+            payload["format"] = "json"
+        
+        try:
+            with requests.post(
+                self.api_url,
+                json=payload,
+                timeout=self.config.ollama.timeout,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    if chunk.get('response'):
+                        yield chunk['response']
+                    if chunk.get('done'):
+                        break
+                        
+        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+            self.logger.error(f"Ollama streaming call failed: {e}, URL: {self.api_url}")
+            raise AIServiceError(f"Ollama streaming call failed: {e}")
+    
     def _create_task_extraction_prompt(self, text: str, context: str = "") -> str:
         """Create prompt for task extraction from various document types."""
-        document_type = self._detect_document_type(text)
+        head, tail = self._task_prompt_parts[self._detect_document_type(text)]
+        prompt = head + text + tail
 
-        if document_type == "refinement":
-            base_prompt = f"""Extract actionable tasks from this refinement document. Return results as a JSON array.
-
-REFINEMENT DOCUMENT:
-{text}
-
-Find ALL implementable tasks, development items, and technical requirements. Each task should be a separate JSON object.
-
-Return ONLY a JSON array in this exact format:
-[
-  {{
-    "summary": "Task title (clear and actionable)",
-    "description": "Detailed task description with acceptance criteria",
-    "issue_type": "Story"
-  }}
-]
-
-Look for:
-- User stories and feature requirements
-- Technical specifications to implement
-- Bug fixes and improvements mentioned
-- API endpoints to create/modify
-- UI/UX changes needed
-- Database schema changes
-- Testing requirements
-- Documentation updates
-
-Focus on breaking down large features into specific, implementable tasks.
-Return multiple objects in the array - one for each task found. If no tasks, return []."""
-        else:
-            base_prompt = f"""Extract actionable tasks from this meeting transcript or document. Return results as a JSON array.
-
-DOCUMENT:
-{text}
-
-Find ALL tasks, action items, and assignments mentioned. Each task should be a separate JSON object.
-
-Return ONLY a JSON array in this exact format:
-[
-  {{
-    "summary": "Task title (clear and actionable)",
-    "description": "Task description with context and details",
-    "issue_type": "Task"
-  }}
-]
+        if context.strip():
+            context_head, context_tail = self._task_context_parts
+            return prompt + context_head + context + context_tail
 
-Look for:
-- Explicit assignments ("John will do X")
-- Work items mentioned ("We need to update Y")
-- Bug reports ("There's an issue with Z")
-- Follow-up tasks from decisions
-- Action items and deliverables
-- Research tasks and investigations
+        return prompt
 
-Return multiple objects in the array - one for each task found. If no tasks, return []."""
+    def _create_combined_extraction_prompt(self, text: str, context: str = "") -> str:
+        """Create prompt extracting both tasks and Q&A in one response."""
+        head, tail = self._combined_prompt_parts[self._detect_document_type(text)]
+        prompt = head + text + tail
 
         if context.strip():
-            return f"""{base_prompt}
+            context_head, context_tail = self._combined_context_parts
+            return prompt + context_head + context + context_tail
 
-ADDITIONAL CONTEXT:
-{context}
-
-Use this context to:
-- Better understand technical terms and project-specific language
-- Improve task descriptions with relevant background
-- Categorize tasks more accurately based on project context
-- Add appropriate details based on team roles and project requirements"""
-
-        return base_prompt
+        return prompt
 
     def _detect_document_type(self, text: str) -> str:
         """
@@ -477,16 +879,8 @@ Use this additional context to provide richer background information and better
                 try:
                     qa_response = self._call_ollama(qa_prompt)
                     if qa_response:
-                        qa_data = self._parse_single_task(qa_response)
-                        if qa_data and qa_data.get('question'):
-                            validated_qa = {
-                                'question': qa_data.get('question', '').strip(),
-                                'context': qa_data.get('context', '').strip(),
-                                'answer': qa_data.get('answer', '').strip(),
-                                'asked_by': self._validate_email(qa_data.get('asked_by', self.config.default_reporter)),
-                                'answered_by': self._validate_email(qa_data.get('answered_by', '')),
-                                'status': 'answered' if qa_data.get('answer', '').strip() else 'unanswered'
-                            }
+                        validated_qa = self._validate_qa_item(self._parse_single_task(qa_response))
+                        if validated_qa:
                             all_qa.append(validated_qa)
                 except (json.JSONDecodeError, KeyError, AIServiceError) as e:
                     self.logger.debug(f"Failed to parse Q&A for '{question[:50]}...': {e}")
@@ -524,6 +918,19 @@ Use this additional context to provide richer background information and better
         except json.JSONDecodeError as e:
             raise AIServiceError(f"Invalid JSON response: {e}")
     
+    def _parse_combined_response(self, response_text: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Parse combined tasks and Q&A JSON object from Ollama."""
+        data = self._parse_single_task(response_text)
+        if data is None:
+            raise AIServiceError("Invalid combined JSON response")
+        
+        tasks_data = data.get('tasks', [])
+        qa_data = data.get('qa_items', [])
+        if not isinstance(tasks_data, list) or not isinstance(qa_data, list):
+            raise AIServiceError("Combined response must contain 'tasks' and 'qa_items' arrays")
+        
+        return tasks_data, qa_data
+    
     def _parse_single_task(self, response_text: str) -> Optional[Dict[str, Any]]:
         """Parse single task JSON object."""
         try:
@@ -567,6 +974,20 @@ Use this additional context to provide richer background information and better
         
         return validated_tasks
     
+    def _validate_qa_item(self, qa_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Validate and clean a single Q&A item."""
+        if not isinstance(qa_data, dict) or not qa_data.get('question'):
+            return None
+        
+        return {
+            'question': qa_data.get('question', '').strip(),
+            'context': qa_data.get('context', '').strip(),
+            'answer': qa_data.get('answer', '').strip(),
+            'asked_by': self._validate_email(qa_data.get('asked_by', self.config.default_reporter)),
+            'answered_by': self._validate_email(qa_data.get('answered_by', '')),
+            'status': 'answered' if qa_data.get('answer', '').strip() else 'unanswered'
+        }
+    
     def _validate_issue_type(self, issue_type: str) -> str:
         """Validate issue type."""
         if issue_type in self.config.valid_issue_types:
@@ -1,9 +1,11 @@
 """Advanced caching service with multiple backends and performance optimization."""
 
+import asyncio
 import hashlib
 import json
 import time
-from typing import Any, Optional, Dict, List, Union
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, Dict, List, Union
 from datetime import datetime, timedelta
 import threading
 from functools import wraps
@@ -20,10 +22,43 @@ try:
 except ImportError:
     DISKCACHE_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 from ..utils import LoggerMixin
 from ..config import get_config
 
 
+def _encode_value(value: Any) -> Union[bytes, str]:
+    """Serialize a cache value, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value)
+
+
+def _hash_key_bytes(data: bytes) -> str:
+    """Hash cache key material, using xxh3 when available."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.sha256(data).hexdigest()
+
+
+def _decode_value(raw: Union[bytes, str]) -> Any:
+    """Deserialize a cache value written by _encode_value."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class CacheService(LoggerMixin):
     """Advanced caching service with multiple backends and performance optimization."""
     
@@ -85,13 +120,15 @@ class CacheService(LoggerMixin):
         """Generate consistent cache key from data."""
         if isinstance(data, dict):
             # Sort dict keys for consistent hashing
-            data_str = json.dumps(data, sort_keys=True)
+            if ORJSON_AVAILABLE:
+                data_bytes = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+            else:
+                data_bytes = json.dumps(data, sort_keys=True).encode('utf-8')
         else:
-            data_str = str(data)
+            data_bytes = str(data).encode('utf-8')
         
         # Create hash for consistent key length
-        hash_obj = hashlib.sha256(data_str.encode('utf-8'))
-        return f"{prefix}:{hash_obj.hexdigest()[:16]}"
+        return f"{prefix}:{_hash_key_bytes(data_bytes)[:16]}"
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache with fallback strategy."""
@@ -102,7 +139,7 @@ class CacheService(LoggerMixin):
                     value = self._redis_client.get(key)
                     if value is not None:
                         self.cache_stats['hits'] += 1
-                        return json.loads(value)
+                        return _decode_value(value)
                 except Exception as e:
                     self.logger.warning(f"Redis get failed: {e}")
             
@@ -144,7 +181,7 @@ class CacheService(LoggerMixin):
             # Try Redis first
             if self._redis_client:
                 try:
-                    self._redis_client.setex(key, ttl, json.dumps(value))
+                    self._redis_client.setex(key, ttl, _encode_value(value))
                     success = True
                 except Exception as e:
                     self.logger.warning(f"Redis set failed: {e}")
@@ -396,6 +433,104 @@ class CacheService(LoggerMixin):
         }
 
 
+_MISSING = object()
+
+
+class AsyncTTLCache:
+    """
+    Small in-process cache for async loaders with TTL expiry and LRU eviction.
+
+    Concurrent misses for the same key share one load: the first caller runs the
+    loader under a per-key lock and later callers pick up its result. Locks are
+    held per event loop, so the cache can be shared by threads that each run
+    their own loop; a failed load is not cached.
+    """
+
+    def __init__(self, ttl: float = 300, maxsize: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            maxsize: Maximum number of entries before least recently used are evicted
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        # Per (event loop, key): [lock, number of callers holding or waiting on it]
+        self._locks: Dict[tuple, list] = {}
+        # Guards _data and _locks across threads; never held across an await
+        self._mutex = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a live entry for key, or default if missing or expired."""
+        with self._mutex:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                self._data.pop(key, None)
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value for key, evicting the least recently used entries if full."""
+        with self._mutex:
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, running loader once on a miss."""
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        # asyncio locks bind to one event loop, so each loop gets its own
+        lock_key = (asyncio.get_running_loop(), key)
+        with self._mutex:
+            slot = self._locks.setdefault(lock_key, [asyncio.Lock(), 0])
+            slot[1] += 1
+        try:
+            async with slot[0]:
+                # Another caller may have loaded it while we waited
+                value = self.get(key, _MISSING)
+                if value is _MISSING:
+                    self.misses += 1
+                    value = await loader()
+                    self.set(key, value)
+                else:
+                    self.hits += 1
+                return value
+        finally:
+            # Drop the lock only once no caller holds or waits on it
+            with self._mutex:
+                slot[1] -= 1
+                if slot[1] == 0:
+                    self._locks.pop(lock_key, None)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry."""
+        with self._mutex:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._mutex:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 def cached_ai_response(response_type: str, ttl: Optional[int] = None):
     """Decorator for caching AI responses."""
     def decorator(func):
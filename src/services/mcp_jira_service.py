@@ -1,27 +1,178 @@
 """MCP-enhanced JIRA integration service with enhanced data models."""
 
 import asyncio
+import concurrent.futures
+import functools
 import json
+import random
+import re
+import threading
 import time
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from atlassian import Jira
+    from atlassian.errors import ApiError
+except ImportError:
+    Jira = None
+    ApiError = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from rapidfuzz import fuzz
+    from rapidfuzz.utils import default_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 from ..config import AppConfig
 from ..exceptions import (
     JiraIntegrationError, JiraConnectionError, JiraAuthenticationError,
-    JiraAPIError, MCPError, DatabaseError
+    JiraAPIError, JiraRateLimitError, MCPError, DatabaseError, ProjectContextError,
+    DuplicateDetectionError
 )
 from ..utils import LoggerMixin, get_database_manager
 from ..utils.mcp_client import get_mcp_client
 from ..utils.encryption import SecureCredentialManager
+from ..utils.concurrency import AsyncBatcher, AsyncTokenBucket
 from ..models.jira_connection import JiraConnection
 from ..models.project_context import ProjectContext
 from ..models.enhanced_task import EnhancedTask, TaskSuggestion
 from ..models.duplicate_analysis import (
     DuplicateAnalysis, SimilarIssue, SimilarityScores, MatchType
 )
-from .cache_service import CacheService
+from .cache_service import CacheService, AsyncTTLCache
+
+
+# Common words excluded from similarity search terms
+SEARCH_STOP_WORDS = frozenset({
+    'that', 'this', 'with', 'from', 'they', 'been', 'have', 'were',
+    'said', 'each', 'which', 'their', 'time', 'will', 'about', 'when',
+    'where', 'what', 'there', 'these', 'those', 'into', 'also', 'should',
+    'would', 'could', 'need', 'needs', 'make', 'some', 'more', 'than',
+    'then', 'them', 'just', 'like', 'only', 'over', 'such', 'very'
+})
+
+# Suffixes folded when deduplicating search terms, longest first
+SEARCH_STEM_SUFFIXES = ('ing', 'ed', 's')
+
+SECONDS_PER_DAY = 86400
+
+# Token Jaccard scores in this band are cross-checked with a fuzzy string match,
+# which tolerates typos and word-form variants ("crash" vs "crashes")
+FUZZY_RECHECK_MIN = 0.5
+FUZZY_RECHECK_MAX = 0.9
+
+# Recently tokenized texts kept so a task compared against many issues is split once
+TOKENIZE_CACHE_SIZE = 512
+
+# Below this many candidates plain set operations beat building a matrix
+BULK_SIMILARITY_MIN_ISSUES = 16
+
+# Upper bound on JIRA requests a single fan-out keeps in flight
+MAX_CONCURRENT_JIRA_CALLS = 5
+
+# Client-side throttle for MCP calls, with backoff when JIRA answers 429
+API_RATE_PER_SECOND = 10
+API_RATE_BURST = 20
+MAX_RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF_BASE = 0.5
+RATE_LIMIT_BACKOFF_CAP = 8.0
+RATE_LIMIT_JITTER = 0.25
+
+# Authenticated clients are reused without re-checking credentials while recently
+# used, and dropped from the pool once this old
+CONNECTION_REUSE_WINDOW = timedelta(minutes=30)
+CONNECTION_MAX_AGE = timedelta(hours=1)
+
+# Verified /myself lookups are reused for this many seconds per set of credentials
+USER_INFO_CACHE_TTL = 300
+
+# Keep-alive connections held per JIRA host; sized above the calls that can be in
+# flight at once (bundle fan-out times parallel search pages) so none are discarded
+JIRA_HTTP_POOL_SIZE = 20
+
+# JIRA Cloud caps search pages at 100 results
+JQL_PAGE_SIZE = 100
+
+# Slow-changing JIRA lookups served from an in-process TTL cache
+CACHEABLE_OPS = frozenset({
+    'get_projects_enriched', 'get_project_details', 'get_project_epics', 'get_project_metadata'
+})
+API_CACHE_TTL = 300
+API_CACHE_MAXSIZE = 256
+
+# Similar-issue searches for one project arriving within this window share a JQL query
+SIMILAR_SEARCH_BATCH_WINDOW = 0.01
+SIMILAR_SEARCH_MAX_BATCH = 20
+SIMILAR_SEARCH_BATCH_CAP = 200
+
+# Similar-issue searches only consider issues created within this many days
+SIMILAR_SEARCH_MAX_AGE_DAYS = 90
+
+# Issue creates for one project arriving within this window share a bulk request;
+# JIRA accepts at most 50 issues per bulk create
+ISSUE_CREATE_BATCH_WINDOW = 0.02
+ISSUE_CREATE_MAX_BATCH = 50
+
+# Only the fields read by the similarity scorers are requested from JIRA
+SIMILAR_ISSUE_FIELDS = 'summary,description,status,assignee,issuetype,created,components'
+RECENT_ISSUE_FIELDS = 'summary,status,assignee,issuetype,created,components'
+EPIC_FIELDS = 'summary,status'
+
+
+def _dumps_json(data: Any) -> str:
+    """Serialize data to a JSON string, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
+def _loads_json(data: Union[bytes, str]) -> Any:
+    """Parse JSON text, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=TOKENIZE_CACHE_SIZE)
+def _tokenize_text(text: str) -> Tuple[frozenset, frozenset]:
+    """Split text into (all lowercased tokens, tokens longer than 4 characters)."""
+    tokens = frozenset(text.lower().split())
+    return tokens, frozenset(word for word in tokens if len(word) > 4)
+
+
+def _jql_quote(value: str) -> str:
+    """Quote a value as a JQL string literal."""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _parse_jira_datetime(value: Any) -> Optional[datetime]:
+    """Parse a JIRA ISO timestamp, returning None for missing or malformed values."""
+    # Cheap shape check keeps the common bad cases off the exception path
+    if not isinstance(value, str) or len(value) < 19 or value[4] != '-' or value[10] != 'T':
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
 
 
 @dataclass
@@ -54,8 +205,62 @@ class MCPJiraService(LoggerMixin):
         self._connection_pool = {}
         self._jira_client = None
         self._current_connection_id = None
+        # Connection pool key ("url:username") of the client in use; distinct from
+        # _current_connection_id, the stored connection's database id
+        self._current_pool_key = None
         self._active_connections = {}
 
+        # Thread-safe futures so refreshes coalesce across Flask request threads,
+        # each of which runs its own event loop
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
+        # asyncio primitives bind to one event loop and each Flask request thread
+        # runs its own, so the fan-out semaphore is kept per loop
+        self._jira_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._api_cache = AsyncTTLCache(ttl=API_CACHE_TTL, maxsize=API_CACHE_MAXSIZE)
+        self._context_cache = AsyncTTLCache(ttl=config.jira.cache_ttl, maxsize=API_CACHE_MAXSIZE)
+        self._user_info_cache = AsyncTTLCache(ttl=USER_INFO_CACHE_TTL, maxsize=API_CACHE_MAXSIZE)
+        self._rate_limiter = AsyncTokenBucket(API_RATE_PER_SECOND, API_RATE_BURST)
+        self._rate_limited_count = 0
+        self._similar_search_batcher = AsyncBatcher(
+            self._run_similar_search_batch,
+            window=SIMILAR_SEARCH_BATCH_WINDOW,
+            max_batch=SIMILAR_SEARCH_MAX_BATCH
+        )
+        self._issue_create_batcher = AsyncBatcher(
+            self._run_issue_create_batch,
+            window=ISSUE_CREATE_BATCH_WINDOW,
+            max_batch=ISSUE_CREATE_MAX_BATCH
+        )
+
+        # Real JIRA handler for each MCP operation, looked up by _route_mcp_call
+        self._operation_handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {
+            'get_projects_enriched': lambda p: self._cached_real_call(
+                'get_projects_enriched', None, self._get_projects_enriched_real
+            ),
+            'get_project_details': lambda p: self._cached_real_call(
+                'get_project_details', p['project_key'], self._get_project_details_real
+            ),
+            'get_active_sprint': lambda p: self._get_active_sprint_real(p['project_key']),
+            'get_project_epics': lambda p: self._cached_real_call(
+                'get_project_epics', p['project_key'], self._get_project_epics_real
+            ),
+            'get_project_metadata': lambda p: self._cached_real_call(
+                'get_project_metadata', p['project_key'], self._get_project_metadata_real
+            ),
+            'get_recent_issues': lambda p: self._get_recent_issues_real(
+                p['project_key'], p.get('limit', 50)
+            ),
+            'get_project_context_bundle': lambda p: self._get_project_context_bundle_real(
+                p['project_key'], p.get('limit', 50)
+            ),
+            'search_similar_issues': lambda p: self._search_similar_issues_real(p),
+            'create_issue': lambda p: self._create_issue_real(p),
+            'create_issues_bulk': lambda p: self._create_issues_bulk_real(p),
+        }
+
     async def initialize_mcp_client(self):
         """Initialize MCP client connection with enhanced error handling."""
         with self.log_operation("mcp_client_initialization") as logger:
@@ -104,8 +309,9 @@ class MCPJiraService(LoggerMixin):
                     api_token=api_token
                 )
 
-                # Encrypt and store credentials
-                encrypted_credentials = self._credential_manager.store_jira_credentials(
+                # Encrypt and store credentials (CPU-bound, keep it off the event loop)
+                encrypted_credentials = await asyncio.to_thread(
+                    self._credential_manager.store_jira_credentials,
                     username=username,
                     api_token=api_token,
                     base_url=base_url
@@ -187,7 +393,8 @@ class MCPJiraService(LoggerMixin):
                     raise JiraConnectionError(f"Connection {connection_id} not found")
 
                 # Decrypt credentials
-                credentials = self._credential_manager.retrieve_jira_credentials(
+                credentials = await asyncio.to_thread(
+                    self._credential_manager.retrieve_jira_credentials,
                     connection_data['encrypted_credentials']
                 )
 
@@ -211,17 +418,14 @@ class MCPJiraService(LoggerMixin):
                     }
                 else:
                     # Use direct authentication
-                    from atlassian import Jira
-
-                    jira_client = Jira(
-                        url=credentials['base_url'],
-                        username=credentials['username'],
-                        password=credentials['api_token'],
-                        cloud=True
+                    jira_client = self._create_jira_client(
+                        credentials['base_url'], credentials['username'], credentials['api_token']
                     )
 
                     # Test connection
-                    user_info = jira_client.myself()
+                    user_info = await self._get_user_info(
+                        jira_client, credentials['base_url'], credentials['username'], credentials['api_token']
+                    )
                     logger.info(f"Authenticated as: {user_info.get('displayName', credentials['username'])}")
 
                     self._current_connection_id = connection_id
@@ -242,32 +446,56 @@ class MCPJiraService(LoggerMixin):
                 # Update validation status to failed
                 try:
                     self._db_manager.update_connection_validation(connection_id, "failed")
-                except:
-                    pass
+                except Exception as db_error:
+                    logger.warning(f"Could not record failed validation for {connection_id}: {db_error}")
 
                 if "authentication" in str(e).lower():
                     raise JiraAuthenticationError(f"Authentication failed: {str(e)}")
                 raise JiraConnectionError(f"Connection activation failed: {str(e)}")
 
+    def _create_jira_client(self, base_url: str, username: str, api_token: str) -> Any:
+        """
+        Create an atlassian-python-api client for JIRA Cloud.
+
+        The client's requests session gets a connection pool large enough for
+        the concurrent worker-thread calls, so connections are reused rather
+        than opened and discarded per request.
+        """
+        if Jira is None:
+            raise JiraConnectionError(
+                "atlassian-python-api is not installed. Install it with: pip install atlassian-python-api"
+            )
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=JIRA_HTTP_POOL_SIZE, pool_maxsize=JIRA_HTTP_POOL_SIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        return Jira(
+            url=base_url,
+            username=username,
+            password=api_token,
+            cloud=True,
+            session=session
+        )
+
     async def _test_connection(self, connection: JiraConnection) -> bool:
         """Test JIRA connection validity."""
         try:
             # Decrypt credentials for testing
-            credentials = self._credential_manager.retrieve_jira_credentials(
+            credentials = await asyncio.to_thread(
+                self._credential_manager.retrieve_jira_credentials,
                 connection.encrypted_credentials
             )
 
-            from atlassian import Jira
-
-            jira_client = Jira(
-                url=credentials['base_url'],
-                username=credentials['username'],
-                password=credentials['api_token'],
-                cloud=True
+            jira_client = self._create_jira_client(
+                credentials['base_url'], credentials['username'], credentials['api_token']
             )
 
             # Test with a simple API call
-            user_info = jira_client.myself()
+            user_info = await self._get_user_info(
+                jira_client, credentials['base_url'], credentials['username'], credentials['api_token']
+            )
             return bool(user_info and user_info.get('accountId'))
 
         except Exception as e:
@@ -289,25 +517,30 @@ class MCPJiraService(LoggerMixin):
         Raises:
             JiraIntegrationError: If authentication fails
         """
+        connection_key = f"{jira_url}:{username}"
+        now = datetime.now()
+        self._prune_connection_pool(now)
+
+        # Reuse a recently verified client for the same credentials
+        entry = self._connection_pool.get(connection_key)
+        if entry and entry['api_token'] == api_token and now - entry['last_used'] < CONNECTION_REUSE_WINDOW:
+            entry['last_used'] = now
+            self._jira_client = entry['client']
+            self._current_pool_key = connection_key
+            self.logger.info(f"Reusing authenticated JIRA client for {jira_url}")
+            return True
+
         try:
             self.logger.info(f"Authenticating with JIRA: {jira_url}")
 
             # Test authentication with real JIRA API call
-            from atlassian import Jira
-
-            jira_client = Jira(
-                url=jira_url,
-                username=username,
-                password=api_token,
-                cloud=True
-            )
+            jira_client = self._create_jira_client(jira_url, username, api_token)
 
             # Test connection by getting current user
-            user_info = jira_client.myself()
+            user_info = await self._get_user_info(jira_client, jira_url, username, api_token)
             self.logger.info(f"Authenticated as: {user_info.get('displayName', username)}")
 
             # Store credentials and client in connection pool
-            connection_key = f"{jira_url}:{username}"
             self._connection_pool[connection_key] = {
                 'url': jira_url,
                 'username': username,
@@ -319,7 +552,7 @@ class MCPJiraService(LoggerMixin):
 
             # Store default client for this session
             self._jira_client = jira_client
-            self._current_connection = connection_key
+            self._current_pool_key = connection_key
 
             self.logger.info("JIRA authentication successful")
             return True
@@ -328,6 +561,28 @@ class MCPJiraService(LoggerMixin):
             self.logger.error(f"JIRA authentication failed: {e}")
             raise JiraIntegrationError(f"Authentication failed: {str(e)}")
 
+    async def _get_user_info(self, jira_client: Any, base_url: str, username: str,
+                             api_token: str) -> Dict[str, Any]:
+        """
+        Get the authenticated user, reusing a recent lookup for the same credentials.
+
+        Keyed by the API token as well as the user so a changed token is always
+        verified against JIRA. Failed lookups are not cached.
+        """
+        return await self._user_info_cache.get_or_load(
+            (base_url, username, api_token),
+            lambda: asyncio.to_thread(jira_client.myself)
+        )
+
+    def _prune_connection_pool(self, now: datetime) -> None:
+        """Drop pooled clients authenticated more than CONNECTION_MAX_AGE ago."""
+        expired = [
+            key for key, entry in self._connection_pool.items()
+            if now - entry['authenticated_at'] >= CONNECTION_MAX_AGE
+        ]
+        for key in expired:
+            del self._connection_pool[key]
+
     async def get_enriched_projects(self) -> List[Dict[str, Any]]:
         """
         Get enriched project list with context data and caching.
@@ -347,36 +602,63 @@ class MCPJiraService(LoggerMixin):
                 logger.info("Returning cached enriched projects")
                 return cached_data
 
-            try:
-                projects_data = await self._make_mcp_call('get_projects_enriched', {})
-
-                enriched_projects = []
-                for project in projects_data.get('projects', []):
-                    enriched_project = {
-                        'key': project['key'],
-                        'name': project['name'],
-                        'description': project.get('description', ''),
-                        'project_type': project.get('projectTypeKey', 'software'),
-                        'lead': project.get('lead', {}).get('displayName', ''),
-                        'active_sprint_count': project.get('active_sprints', 0),
-                        'total_issues': project.get('issue_count', 0),
-                        'recent_activity': project.get('recent_activity_score', 0),
-                        'team_size': len(project.get('assignable_users', [])),
-                        'last_updated': project.get('last_updated', ''),
-                        'connection_id': self._current_connection_id
-                    }
-                    enriched_projects.append(enriched_project)
+            # Coalesce concurrent cache misses into a single MCP request
+            with self._inflight_lock:
+                inflight = self._inflight.get(cache_key)
+                if inflight is None:
+                    future = self._inflight[cache_key] = concurrent.futures.Future()
 
-                # Cache for configured TTL
-                self._cache_service.set(cache_key, enriched_projects, ttl=self.config.jira.cache_ttl)
+            if inflight is not None:
+                logger.info("Waiting on in-flight enriched projects request")
+                # Shielded so a cancelled waiter doesn't cancel the shared request
+                return await asyncio.shield(asyncio.wrap_future(inflight))
 
-                logger.info(f"Retrieved {len(enriched_projects)} enriched projects")
+            try:
+                enriched_projects = await self._fetch_enriched_projects(cache_key, logger)
+                future.set_result(enriched_projects)
                 return enriched_projects
-
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
             except Exception as e:
-                logger.error(f"Failed to get enriched projects: {e}")
-                # Fallback to basic project list
-                return await self._get_basic_projects()
+                future.set_exception(e)
+                raise
+            finally:
+                with self._inflight_lock:
+                    del self._inflight[cache_key]
+
+    async def _fetch_enriched_projects(self, cache_key: str, logger) -> List[Dict[str, Any]]:
+        """Fetch enriched projects via MCP and populate the cache."""
+        try:
+            projects_data = await self._make_mcp_call('get_projects_enriched', {})
+
+            enriched_projects = []
+            for project in projects_data.get('projects', []):
+                enriched_project = {
+                    'key': project['key'],
+                    'name': project['name'],
+                    'description': project.get('description', ''),
+                    'project_type': project.get('projectTypeKey', 'software'),
+                    'lead': project.get('lead', {}).get('displayName', ''),
+                    'active_sprint_count': project.get('active_sprints', 0),
+                    'total_issues': project.get('issue_count', 0),
+                    'recent_activity': project.get('recent_activity_score', 0),
+                    'team_size': len(project.get('assignable_users', [])),
+                    'last_updated': project.get('last_updated', ''),
+                    'connection_id': self._current_connection_id
+                }
+                enriched_projects.append(enriched_project)
+
+            # Cache for configured TTL
+            self._cache_service.set(cache_key, enriched_projects, ttl=self.config.jira.cache_ttl)
+
+            logger.info(f"Retrieved {len(enriched_projects)} enriched projects")
+            return enriched_projects
+
+        except Exception as e:
+            logger.error(f"Failed to get enriched projects: {e}")
+            # Fallback to basic project list
+            return await self._get_basic_projects()
 
     async def get_project_context(self, project_key: str) -> ProjectContext:
         """
@@ -389,7 +671,7 @@ class MCPJiraService(LoggerMixin):
             Enhanced project context data
 
         Raises:
-            JiraConnectionError: If no active connection
+            JiraConnectionError: If no active connection or JIRA cannot be reached
             ProjectContextError: If context retrieval fails
         """
         if not self._current_connection_id:
@@ -398,52 +680,40 @@ class MCPJiraService(LoggerMixin):
         with self.log_operation("get_project_context", project_key=project_key,
                                connection_id=self._current_connection_id) as logger:
             try:
-                # Check database cache first
+                # Live instances are reused as-is, skipping the database read and rebuild
+                cache_key = (self._current_connection_id, project_key)
+                context = self._context_cache.get(cache_key)
+                if context is not None:
+                    logger.info(f"Returning in-memory context for project {project_key}")
+                    return context
+
+                # Check database cache next
                 cached_context = self._db_manager.get_project_context(
                     self._current_connection_id, project_key
                 )
 
                 if cached_context and cached_context.get('cache_expires_at'):
                     expires_at = datetime.fromisoformat(cached_context['cache_expires_at'])
-                    if datetime.now() < expires_at:
+                    remaining = (expires_at - datetime.now()).total_seconds()
+                    if remaining > 0:
                         logger.info(f"Returning cached context for project {project_key}")
-                        return ProjectContext.from_database(cached_context)
+                        context = ProjectContext.from_database(cached_context)
+                        self._context_cache.set(cache_key, context, ttl=remaining)
+                        return context
 
                 logger.info(f"Fetching fresh project context for {project_key}")
 
-                # Gather context data concurrently for performance
-                context_tasks = [
-                    self._make_mcp_call('get_project_details', {'project_key': project_key}),
-                    self._make_mcp_call('get_active_sprint', {'project_key': project_key}),
-                    self._make_mcp_call('get_project_epics', {'project_key': project_key}),
-                    self._make_mcp_call('get_project_metadata', {'project_key': project_key}),
-                    self._make_mcp_call('get_recent_issues', {'project_key': project_key, 'limit': 50})
-                ]
-
-                project_data, sprint_data, epics_data, metadata, recent_issues = await asyncio.gather(
-                    *context_tasks, return_exceptions=True
-                )
-
-                # Handle potential exceptions from individual calls
-                if isinstance(project_data, Exception):
-                    logger.warning(f"Failed to get project details: {project_data}")
-                    project_data = {}
-
-                if isinstance(sprint_data, Exception):
-                    logger.warning(f"Failed to get sprint data: {sprint_data}")
-                    sprint_data = {}
-
-                if isinstance(epics_data, Exception):
-                    logger.warning(f"Failed to get epics: {epics_data}")
-                    epics_data = {'epics': []}
-
-                if isinstance(metadata, Exception):
-                    logger.warning(f"Failed to get metadata: {metadata}")
-                    metadata = {'issue_types': [], 'custom_fields': [], 'workflows': []}
-
-                if isinstance(recent_issues, Exception):
-                    logger.warning(f"Failed to get recent issues: {recent_issues}")
-                    recent_issues = {'issues': []}
+                # Fetch all context data in one concurrent bundle; a failure is raised
+                # rather than caching mock data as this project's context
+                bundle = await self._make_mcp_call('get_project_context_bundle', {
+                    'project_key': project_key,
+                    'limit': 50
+                }, fallback_to_mock=False)
+                project_data = bundle['details']
+                sprint_data = bundle['sprint']
+                epics_data = bundle['epics']
+                metadata = bundle['metadata']
+                recent_issues = bundle['recent']
 
                 # Create enhanced project context
                 context = ProjectContext.create(
@@ -481,10 +751,13 @@ class MCPJiraService(LoggerMixin):
                 }
 
                 self._db_manager.save_project_context(context_data)
+                self._context_cache.set(cache_key, context)
 
                 logger.info(f"Project context loaded and cached for {project_key}")
                 return context
 
+            except JiraConnectionError:
+                raise
             except Exception as e:
                 logger.error(f"Failed to get project context: {e}")
                 raise ProjectContextError(
@@ -530,16 +803,35 @@ class MCPJiraService(LoggerMixin):
                     'summary': task_summary,
                     'description': task_description,
                     'include_resolved': False,
-                    'limit': self.config.jira.max_search_results
+                    'limit': self.config.jira.max_search_results,
+                    'issue_types': sorted(project_context.issue_type_names)
                 })
 
                 similar_issues = []
-                total_searched = len(search_results.get('issues', []))
-
-                for issue in search_results.get('issues', []):
-                    similar_issue = await self._analyze_issue_similarity(
-                        task_summary, task_description, issue, project_context
+                candidate_issues = search_results.get('issues', [])
+                total_searched = len(candidate_issues)
+                pre_filtered = search_results.get('pre_filtered', False)
+
+                # Tokenize the task once and each candidate once, not per scorer call
+                task_tokens = self._build_token_sets(task_summary, task_description)
+                for issue in candidate_issues:
+                    self._attach_token_sets(issue)
+                    self._attach_created_ts(issue)
+
+                # Score all titles in one pass; one clock read for the whole pass
+                title_scores = self._bulk_similarity_scores(
+                    task_tokens['summary'],
+                    [issue['_tokens']['summary'] for issue in candidate_issues]
+                )
+                now_ts = time.time()
+                for issue, title_score in zip(candidate_issues, title_scores):
+                    similar_issue = self._analyze_issue_similarity(
+                        task_summary, task_description, issue, project_context,
+                        task_tokens=task_tokens, now_ts=now_ts,
+                        title_similarity=title_score, pre_filtered=pre_filtered
                     )
+                    if similar_issue is None:
+                        continue
                     if similar_issue.similarity_scores.overall_score >= 0.3:  # Lower threshold for analysis
                         similar_issues.append(similar_issue)
 
@@ -563,8 +855,8 @@ class MCPJiraService(LoggerMixin):
                     'project_key': project_key,
                     'connection_id': self._current_connection_id,
                     'search_query': search_query,
-                    'similar_issues': json.dumps([issue.to_dict() for issue in similar_issues]),
-                    'best_match_data': json.dumps(analysis.best_match.to_dict()) if analysis.best_match else None,
+                    'similar_issues': _dumps_json([issue.to_dict() for issue in similar_issues]),
+                    'best_match_data': _dumps_json(analysis.best_match.to_dict()) if analysis.best_match else None,
                     'confidence': analysis.confidence,
                     'recommended_action': analysis.recommended_action,
                     'reasoning': analysis.reasoning,
@@ -603,33 +895,59 @@ class MCPJiraService(LoggerMixin):
                     project_key=project_key
                 )
 
-    async def _analyze_issue_similarity(self, task_summary: str, task_description: str,
-                                      existing_issue: Dict[str, Any],
-                                      project_context: ProjectContext) -> SimilarIssue:
-        """Analyze similarity between task and existing issue using enhanced algorithms."""
+    def _analyze_issue_similarity(self, task_summary: str, task_description: str,
+                                  existing_issue: Dict[str, Any],
+                                  project_context: ProjectContext,
+                                  task_tokens: Optional[Dict[str, Any]] = None,
+                                  now_ts: Optional[float] = None,
+                                  title_similarity: Optional[float] = None,
+                                  pre_filtered: bool = False) -> Optional[SimilarIssue]:
+        """
+        Analyze similarity between task and existing issue using enhanced algorithms.
+
+        Returns None when the issue cannot reach the analysis threshold, so callers
+        can skip it without paying for the remaining scorers. Callers scoring many
+        issues should pass precomputed task_tokens and attach issue token sets.
+        Set pre_filtered when the issue came from a search that already restricted
+        issue type and age in JQL.
+        """
         fields = existing_issue.get('fields', {})
         existing_summary = fields.get('summary', '')
-        existing_description = fields.get('description', '')
+        existing_description = fields.get('description') or ''
 
-        # Calculate detailed similarity scores
-        title_similarity = self._calculate_text_similarity(task_summary, existing_summary)
-        content_similarity = self._calculate_text_similarity(task_description, existing_description)
+        if task_tokens is None:
+            task_tokens = self._build_token_sets(task_summary, task_description)
+        existing_tokens = self._attach_token_sets(existing_issue)
+
+        # Title similarity carries the largest weight, so score it first
+        if title_similarity is None:
+            title_similarity = self._calculate_text_similarity_sets(
+                task_tokens['summary'], existing_tokens['summary']
+            )
+
+        # Without a title match or any shared token, content, semantic and keyword
+        # scores are all zero and context alone (weight 0.10) can't pass the threshold
+        if title_similarity == 0.0 and not task_tokens['all'] & existing_tokens['all']:
+            return None
+
+        # Remaining scorers ordered from cheapest to most expensive
+        keyword_overlap = self._calculate_keyword_overlap_sets(
+            task_tokens['keywords'], existing_tokens['keywords']
+        )
 
         # Calculate semantic similarity (simplified - in production use ML models)
-        semantic_similarity = self._calculate_semantic_similarity(
-            f"{task_summary} {task_description}",
-            f"{existing_summary} {existing_description}"
+        semantic_similarity = self._calculate_semantic_similarity_sets(
+            task_tokens['all'], existing_tokens['all'],
+            task_tokens['length'], existing_tokens['length']
         )
 
-        # Calculate context similarity
-        context_similarity = self._calculate_context_similarity(
-            existing_issue, project_context
+        content_similarity = self._calculate_text_similarity_sets(
+            task_tokens['description'], existing_tokens['description']
         )
 
-        # Calculate keyword overlap
-        keyword_overlap = self._calculate_keyword_overlap(
-            task_summary + " " + task_description,
-            existing_summary + " " + existing_description
+        # Calculate context similarity
+        context_similarity = self._calculate_context_similarity(
+            existing_issue, project_context, now_ts=now_ts, pre_filtered=pre_filtered
         )
 
         # Overall score (weighted average)
@@ -652,12 +970,8 @@ class MCPJiraService(LoggerMixin):
         )
 
         # Create similar issue object
-        created_date = None
-        if fields.get('created'):
-            try:
-                created_date = datetime.fromisoformat(fields['created'].replace('Z', '+00:00'))
-            except:
-                pass
+        self._attach_created_ts(existing_issue)
+        created_date = existing_issue['_created_at']
 
         similar_issue = SimilarIssue(
             issue_key=existing_issue.get('key', ''),
@@ -680,8 +994,7 @@ class MCPJiraService(LoggerMixin):
         words = [word.strip().lower() for word in text.split() if len(word) > 3]
 
         # Remove common stop words
-        stop_words = {'that', 'this', 'with', 'from', 'they', 'been', 'have', 'were', 'said', 'each', 'which', 'their', 'time', 'will'}
-        meaningful_words = [word for word in words if word not in stop_words]
+        meaningful_words = [word for word in words if word not in SEARCH_STOP_WORDS]
 
         # Return top 5 words for search
         return ' '.join(meaningful_words[:5])
@@ -690,63 +1003,144 @@ class MCPJiraService(LoggerMixin):
         """Calculate semantic similarity (simplified implementation)."""
         # This is a simplified version. In production, use proper ML models
         # like sentence transformers or word embeddings
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+        return self._calculate_semantic_similarity_sets(
+            frozenset(text1.lower().split()), frozenset(text2.lower().split()),
+            len(text1), len(text2)
+        )
 
+    def _calculate_semantic_similarity_sets(self, words1: frozenset, words2: frozenset,
+                                            length1: int, length2: int) -> float:
+        """Calculate semantic similarity from pre-tokenized word sets and text lengths."""
         if not words1 or not words2:
             return 0.0
 
-        # Simple Jaccard similarity with length penalty
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-
-        jaccard = len(intersection) / len(union) if union else 0.0
+        # Simple Jaccard similarity with length penalty; the union size comes from
+        # inclusion-exclusion rather than building the union set
+        shared = len(words1 & words2)
+        jaccard = shared / (len(words1) + len(words2) - shared)
 
         # Apply length penalty for very different text lengths
-        length_ratio = min(len(text1), len(text2)) / max(len(text1), len(text2))
+        length_ratio = min(length1, length2) / max(length1, length2)
         return jaccard * (0.5 + 0.5 * length_ratio)
 
     def _calculate_context_similarity(self, existing_issue: Dict[str, Any],
-                                    project_context: ProjectContext) -> float:
-        """Calculate context-based similarity factors."""
+                                    project_context: ProjectContext,
+                                    now_ts: Optional[float] = None,
+                                    pre_filtered: bool = False) -> float:
+        """
+        Calculate context-based similarity factors.
+
+        Pass now_ts when scoring many issues so the clock is read once per pass.
+        With pre_filtered, the JQL search already guaranteed a project issue type
+        and an age within SIMILAR_SEARCH_MAX_AGE_DAYS, so those bonuses are given
+        without re-checking them.
+        """
         fields = existing_issue.get('fields', {})
         context_score = 0.0
 
         # Same issue type
-        issue_type = fields.get('issuetype', {}).get('name', '')
-        if issue_type in [it.get('name', '') for it in project_context.issue_types]:
+        if pre_filtered:
             context_score += 0.3
-
-        # Recent issue (within 30 days)
-        if fields.get('created'):
-            try:
-                created_date = datetime.fromisoformat(fields['created'].replace('Z', '+00:00'))
-                days_old = (datetime.now(timezone.utc) - created_date.replace(tzinfo=timezone.utc)).days
-                if days_old <= 30:
-                    context_score += 0.4
-                elif days_old <= 90:
-                    context_score += 0.2
-            except:
-                pass
+        else:
+            issue_type = fields.get('issuetype', {}).get('name', '')
+            if issue_type in project_context.issue_type_names:
+                context_score += 0.3
+
+        # Recent issue (within 30 days); the date is parsed once per issue, not per score
+        if (created_ts := self._attach_created_ts(existing_issue)) is not None:
+            age_seconds = (time.time() if now_ts is None else now_ts) - created_ts
+            if age_seconds < 31 * SECONDS_PER_DAY:
+                context_score += 0.4
+            elif pre_filtered or age_seconds < 91 * SECONDS_PER_DAY:
+                context_score += 0.2
 
         # Same component/epic context
-        components = fields.get('components', [])
-        if components and project_context.components:
+        components = fields.get('components') or []
+        if any(component.get('name') in project_context.component_names for component in components):
             context_score += 0.3
 
         return min(context_score, 1.0)
 
     def _calculate_keyword_overlap(self, text1: str, text2: str) -> float:
         """Calculate keyword overlap similarity."""
-        # Extract keywords (words longer than 4 characters)
-        keywords1 = set(word.lower() for word in text1.split() if len(word) > 4)
-        keywords2 = set(word.lower() for word in text2.split() if len(word) > 4)
+        return self._calculate_keyword_overlap_sets(
+            self._tokenize(text1)[1], self._tokenize(text2)[1]
+        )
 
+    def _calculate_keyword_overlap_sets(self, keywords1: frozenset, keywords2: frozenset) -> float:
+        """Calculate keyword overlap similarity from pre-extracted keyword sets."""
         if not keywords1 or not keywords2:
             return 0.0
 
-        intersection = keywords1.intersection(keywords2)
-        return len(intersection) / max(len(keywords1), len(keywords2))
+        return len(keywords1 & keywords2) / max(len(keywords1), len(keywords2))
+
+    def _tokenize(self, text: str) -> Tuple[frozenset, frozenset]:
+        """
+        Tokenize text into lowercased word sets.
+
+        Results are memoized, so repeated texts (the task side of every
+        comparison) are split only once.
+
+        Returns:
+            Tuple of (all tokens, keywords) where keywords are tokens longer
+            than 4 characters
+        """
+        return _tokenize_text(text)
+
+    def _build_token_sets(self, summary: str, description: str) -> Dict[str, Any]:
+        """Build the token sets used by the similarity scorers for one issue or task."""
+        summary_tokens = self._tokenize(summary)[0]
+        description_tokens = self._tokenize(description)[0]
+        all_tokens = summary_tokens | description_tokens
+        return {
+            'summary': summary_tokens,
+            'description': description_tokens,
+            'all': all_tokens,
+            'keywords': frozenset(word for word in all_tokens if len(word) > 4),
+            'length': len(summary) + 1 + len(description)
+        }
+
+    def _normalize_summary(self, summary: str) -> str:
+        """Lowercase a summary and collapse whitespace for exact-match checks."""
+        return ' '.join(summary.lower().split())
+
+    def _summary_hash(self, summary: str) -> int:
+        """Hash a normalized summary; only meaningful within this process."""
+        return hash(self._normalize_summary(summary))
+
+    def _attach_summary_hash(self, issue: Dict[str, Any]) -> int:
+        """Hash an issue's summary once and stash it on the issue under '_sum_hash'."""
+        summary_hash = issue.get('_sum_hash')
+        if summary_hash is None:
+            summary_hash = self._summary_hash(issue.get('fields', {}).get('summary', ''))
+            issue['_sum_hash'] = summary_hash
+        return summary_hash
+
+    def _attach_created_ts(self, issue: Dict[str, Any]) -> Optional[float]:
+        """
+        Parse an issue's created date once and stash it on the issue.
+
+        Stores the datetime under '_created_at' and its POSIX timestamp under
+        '_created_ts' (both None if missing or malformed), returning the timestamp.
+        """
+        if '_created_ts' not in issue:
+            created_at = _parse_jira_datetime(issue.get('fields', {}).get('created'))
+            if created_at is not None and created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            issue['_created_at'] = created_at
+            issue['_created_ts'] = created_at.timestamp() if created_at else None
+        return issue['_created_ts']
+
+    def _attach_token_sets(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Tokenize an issue once and stash the sets on it under '_tokens'."""
+        token_sets = issue.get('_tokens')
+        if token_sets is None:
+            fields = issue.get('fields', {})
+            token_sets = self._build_token_sets(
+                fields.get('summary', ''), fields.get('description') or ''
+            )
+            issue['_tokens'] = token_sets
+        return token_sets
 
     async def create_context_aware_task(self, project_key: str, task_data: Dict[str, Any],
                                       context: ProjectContext) -> Dict[str, Any]:
@@ -767,11 +1161,8 @@ class MCPJiraService(LoggerMixin):
             # Enhance task data with context
             enhanced_task = await self._enhance_task_data(task_data, context)
 
-            # Create task via MCP
-            result = await self._make_mcp_call('create_issue', {
-                'project_key': project_key,
-                'issue_data': enhanced_task
-            })
+            # Create task via MCP; concurrent creates in this event loop share one bulk request
+            result = await self._issue_create_batcher.submit(project_key, enhanced_task)
 
             if result.get('success'):
                 created_task = result.get('issue')
@@ -788,16 +1179,98 @@ class MCPJiraService(LoggerMixin):
             self.logger.error(f"Context-aware task creation failed: {e}")
             raise JiraIntegrationError(f"Task creation failed: {str(e)}")
 
-    async def _make_mcp_call(self, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def create_context_aware_tasks(self, project_key: str, task_datas: List[Dict[str, Any]],
+                                         context: ProjectContext) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Create several tasks with context-aware enhancements.
+
+        The creates are coalesced into JIRA bulk requests and epic links run
+        concurrently, instead of two round trips per task in sequence.
+
+        Args:
+            project_key: JIRA project key
+            task_datas: Basic task data for each task
+            context: Project context for enhancements
+
+        Returns:
+            Created task data for each input, in order, or the JiraIntegrationError
+            raised for a task that could not be created
+        """
+        return await asyncio.gather(
+            *(self.create_context_aware_task(project_key, task_data, context)
+              for task_data in task_datas),
+            return_exceptions=True
+        )
+
+    async def _run_issue_create_batch(self, project_key: str,
+                                      issues_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create queued issues for one project, returning one create result per issue.
+
+        A lone issue goes through the single-issue endpoint; several are sent
+        as one bulk create.
+        """
+        if len(issues_data) == 1:
+            return [await self._make_mcp_call('create_issue', {
+                'project_key': project_key,
+                'issue_data': issues_data[0]
+            })]
+
+        result = await self._make_mcp_call('create_issues_bulk', {
+            'project_key': project_key,
+            'issues_data': issues_data
+        })
+        if not result.get('success'):
+            return [{'success': False, 'error': result.get('error', 'Bulk create failed')}] * len(issues_data)
+        return result['results']
+
+    async def _cached_real_call(self, operation: str, project_key: Optional[str],
+                                loader: Callable[..., Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Run a real JIRA lookup through the TTL cache, keyed by (operation, project_key)."""
+        args = () if project_key is None else (project_key,)
+        return await self._api_cache.get_or_load(
+            (self._current_connection_id, operation, project_key),
+            lambda: loader(*args)
+        )
+
+    def clear_cache(self) -> None:
+        """Drop all cached JIRA lookups so the next calls hit the API."""
+        self._api_cache.clear()
+        self._context_cache.clear()
+
+    async def warm_cache(self, project_keys: List[str]) -> None:
+        """
+        Pre-load project context data for the given projects.
+
+        Args:
+            project_keys: JIRA project keys to warm
+        """
+        results = await asyncio.gather(
+            *(self._make_mcp_call('get_project_context_bundle', {'project_key': key},
+                                  fallback_to_mock=False)
+              for key in project_keys),
+            return_exceptions=True
+        )
+        for key, result in zip(project_keys, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Failed to warm cache for project {key}: {result}")
+
+    async def _make_mcp_call(self, operation: str, params: Dict[str, Any],
+                             fallback_to_mock: bool = True) -> Dict[str, Any]:
         """
         Make JIRA API call with retry logic.
 
         Args:
             operation: Operation name
             params: Operation parameters
+            fallback_to_mock: Return mock data when the JIRA call fails; when False
+                the failure is raised instead, for callers that persist the result
 
         Returns:
             Operation result
+
+        Raises:
+            JiraConnectionError: If the call fails and fallback_to_mock is False
         """
         if not self._jira_client:
             # Use environment credentials if available
@@ -811,57 +1284,116 @@ class MCPJiraService(LoggerMixin):
                 # Return mock data if no real credentials
                 return await self._get_mock_response(operation, params)
 
-        try:
-            # Route to appropriate JIRA API call
-            if operation == 'get_projects_enriched':
-                return await self._get_projects_enriched_real()
-            elif operation == 'get_project_details':
-                return await self._get_project_details_real(params['project_key'])
-            elif operation == 'get_active_sprint':
-                return await self._get_active_sprint_real(params['project_key'])
-            elif operation == 'get_project_epics':
-                return await self._get_project_epics_real(params['project_key'])
-            elif operation == 'get_project_metadata':
-                return await self._get_project_metadata_real(params['project_key'])
-            elif operation == 'get_recent_issues':
-                return await self._get_recent_issues_real(params['project_key'], params.get('limit', 50))
-            elif operation == 'search_similar_issues':
-                return await self._search_similar_issues_real(params)
-            elif operation == 'create_issue':
-                return await self._create_issue_real(params)
-            else:
-                return {'success': True}
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            try:
+                async with self._rate_limiter:
+                    return await self._route_mcp_call(operation, params)
 
-        except Exception as e:
-            self.logger.error(f"JIRA API call failed for {operation}: {e}")
-            # Fallback to mock data
-            return await self._get_mock_response(operation, params)
+            except Exception as e:
+                if self._is_rate_limited(e):
+                    self._rate_limited_count += 1
+                    if attempt < MAX_RATE_LIMIT_RETRIES:
+                        backoff = self._rate_limit_backoff(e, attempt)
+                        self.logger.warning(
+                            f"JIRA rate limited {operation}, retrying in {backoff:.2f}s "
+                            f"(attempt {attempt + 1}/{MAX_RATE_LIMIT_RETRIES})"
+                        )
+                        await asyncio.sleep(backoff)
+                        continue
+
+                if self._is_unauthorized(e):
+                    # Credentials were revoked; force the next authentication to re-verify
+                    self._user_info_cache.clear()
+                    self._connection_pool.pop(self._current_pool_key, None)
+
+                if not self._is_jira_api_error(e):
+                    # A bug on our side must surface, not be masked as demo data
+                    raise
+
+                self.logger.error(f"JIRA API call failed for {operation}: {e}")
+                if not fallback_to_mock:
+                    raise JiraConnectionError(f"JIRA API call failed for {operation}: {e}") from e
+                # Fallback to mock data
+                return await self._get_mock_response(operation, params)
+
+    async def _route_mcp_call(self, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Route an operation to the matching real JIRA API call."""
+        handler = self._operation_handlers.get(operation)
+        if handler is None:
+            return {'success': True}
+        return await handler(params)
+
+    def _jira_semaphore(self) -> asyncio.Semaphore:
+        """Get the running event loop's semaphore bounding concurrent JIRA calls."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._jira_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._jira_semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_JIRA_CALLS)
+        return semaphore
+
+    def _is_jira_api_error(self, error: Exception) -> bool:
+        """Check whether an error came from talking to JIRA rather than from our own code."""
+        if isinstance(error, (requests.RequestException, JiraIntegrationError)):
+            return True
+        if self._is_rate_limited(error) or self._is_unauthorized(error):
+            return True
+        return ApiError is not None and isinstance(error, ApiError)
+
+    def _is_rate_limited(self, error: Exception) -> bool:
+        """Check whether an API error is a JIRA 429 response."""
+        if isinstance(error, JiraRateLimitError):
+            return True
+        response = getattr(error, 'response', None)
+        return getattr(response, 'status_code', None) == 429
+
+    def _is_unauthorized(self, error: Exception) -> bool:
+        """Check whether an API error is a JIRA 401 response."""
+        if isinstance(error, JiraAuthenticationError):
+            return True
+        response = getattr(error, 'response', None)
+        return getattr(response, 'status_code', None) == 401
+
+    def _rate_limit_backoff(self, error: Exception, attempt: int) -> float:
+        """Exponential backoff with jitter, honouring an explicit retry-after."""
+        backoff = min(
+            RATE_LIMIT_BACKOFF_CAP,
+            RATE_LIMIT_BACKOFF_BASE * 2 ** attempt + random.uniform(0, RATE_LIMIT_JITTER)
+        )
+        retry_after = getattr(error, 'retry_after', None)
+        return max(backoff, retry_after) if retry_after else backoff
+
+    def metrics(self) -> Dict[str, int]:
+        """Get API cache and rate limiting counters."""
+        return {
+            'hits': self._api_cache.hits,
+            'misses': self._api_cache.misses,
+            'rate_limited': self._rate_limited_count,
+            'throttled': self._rate_limiter.waits
+        }
 
     async def _get_projects_enriched_real(self) -> Dict[str, Any]:
         """Get real project data from JIRA."""
-        projects = self._jira_client.projects()
-        enriched_projects = []
-
-        for project in projects:
-            enriched_project = {
-                'key': project['key'],
-                'name': project['name'],
-                'description': project.get('description', ''),
-                'projectTypeKey': project.get('projectTypeKey', 'software'),
-                'lead': project.get('lead', {}),
-                'active_sprints': 0,  # Would need additional API calls
-                'issue_count': 0,     # Would need additional API calls
-                'recent_activity_score': 5,
-                'assignable_users': [],
-                'last_updated': datetime.now().isoformat()
-            }
-            enriched_projects.append(enriched_project)
+        projects = await asyncio.to_thread(self._jira_client.projects)
+        return {'projects': [self._enrich_project_real(project) for project in projects]}
 
-        return {'projects': enriched_projects}
+    def _enrich_project_real(self, project: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the enriched entry for one project from its JIRA listing."""
+        return {
+            'key': project['key'],
+            'name': project['name'],
+            'description': project.get('description', ''),
+            'projectTypeKey': project.get('projectTypeKey', 'software'),
+            'lead': project.get('lead', {}),
+            'active_sprints': 0,  # Would need additional API calls
+            'issue_count': 0,     # Would need additional API calls
+            'recent_activity_score': 5,
+            'assignable_users': [],
+            'last_updated': datetime.now().isoformat()
+        }
 
     async def _get_project_details_real(self, project_key: str) -> Dict[str, Any]:
         """Get real project details from JIRA."""
-        project = self._jira_client.project(project_key)
+        project = await asyncio.to_thread(self._jira_client.project, project_key)
         return {
             'name': project['name'],
             'description': project.get('description', ''),
@@ -879,50 +1411,167 @@ class MCPJiraService(LoggerMixin):
             return {'sprint': None}
 
     async def _get_project_epics_real(self, project_key: str) -> Dict[str, Any]:
-        """Get project epics from JIRA."""
-        try:
-            # Search for epics in the project
-            jql = f'project = {project_key} AND issuetype = Epic ORDER BY created DESC'
-            epics = self._jira_client.jql(jql, limit=20)['issues']
-
-            epic_list = []
-            for epic in epics:
-                epic_list.append({
-                    'key': epic['key'],
-                    'summary': epic['fields']['summary'],
-                    'status': epic['fields']['status']['name']
-                })
+        """
+        Get project epics from JIRA.
 
-            return {'epics': epic_list}
-        except Exception as e:
-            self.logger.warning(f"Failed to get epics for {project_key}: {e}")
-            return {'epics': []}
+        Errors are raised rather than defaulted so an empty result from a failed
+        call is never stored in the API cache.
+        """
+        # Search for epics in the project
+        jql = f'project = {project_key} AND issuetype = Epic ORDER BY created DESC'
+        epics = await self._jql_parallel(jql, 20, fields=EPIC_FIELDS)
+
+        epic_list = []
+        for epic in epics:
+            epic_list.append({
+                'key': epic['key'],
+                'summary': epic['fields']['summary'],
+                'status': epic['fields']['status']['name']
+            })
+
+        return {'epics': epic_list}
 
     async def _get_project_metadata_real(self, project_key: str) -> Dict[str, Any]:
-        """Get project metadata from JIRA."""
-        try:
-            # Get issue types for the project
-            issue_types = self._jira_client.project_issue_types(project_key)
+        """
+        Get project metadata from JIRA.
 
-            return {
-                'issue_types': [{'id': it['id'], 'name': it['name']} for it in issue_types],
-                'custom_fields': [],  # Would need additional API calls
-                'workflows': []       # Would need additional API calls
-            }
-        except Exception as e:
-            self.logger.warning(f"Failed to get metadata for {project_key}: {e}")
-            return {'issue_types': [], 'custom_fields': [], 'workflows': []}
+        Errors are raised rather than defaulted so an empty result from a failed
+        call is never stored in the API cache.
+        """
+        # Get issue types for the project
+        issue_types = await asyncio.to_thread(self._jira_client.project_issue_types, project_key)
+
+        return {
+            'issue_types': [{'id': it['id'], 'name': it['name']} for it in issue_types],
+            'custom_fields': [],  # Would need additional API calls
+            'workflows': []       # Would need additional API calls
+        }
+
+    def _search_issues_page(self, jql: str, fields: str, start: int, limit: int) -> Dict[str, Any]:
+        """
+        Fetch one page of JQL search results (blocking; run in a worker thread).
+
+        With orjson installed the raw response body is decoded with orjson
+        instead of the client's stdlib json, which dominates on large pages.
+        """
+        if not ORJSON_AVAILABLE:
+            return self._jira_client.jql(jql, fields=fields, start=start, limit=limit)
+
+        raw = self._jira_client.get(
+            self._jira_client.resource_url('search'),
+            params={'jql': jql, 'fields': fields, 'startAt': start, 'maxResults': limit},
+            not_json_response=True
+        )
+        return _loads_json(raw)
+
+    async def _jql_parallel(self, jql: str, total_cap: int, page: int = JQL_PAGE_SIZE,
+                            concurrency: int = MAX_CONCURRENT_JIRA_CALLS,
+                            fields: str = '*all') -> List[Dict[str, Any]]:
+        """
+        Run a JQL search, fetching result pages concurrently.
+
+        The first page tells us the total; the remaining startAt windows are
+        fetched in parallel, at most `concurrency` at a time, in worker threads
+        so the blocking client doesn't stall the event loop.
+
+        Args:
+            jql: JQL query
+            total_cap: Maximum number of issues to return
+            page: Requested page size (JIRA may cap it lower)
+            concurrency: Maximum page requests in flight
+            fields: Comma-separated fields to return
+
+        Returns:
+            Issues in result order
+        """
+        if total_cap <= 0:
+            return []
+
+        first_size = min(page, total_cap)
+        first = await asyncio.to_thread(self._search_issues_page, jql, fields, 0, first_size)
+        issues = list(first.get('issues', []))
+        fetched = len(issues)
+        total = min(first.get('total', fetched), total_cap)
+        if fetched == 0 or fetched >= total:
+            return issues[:total]
+
+        # The server may return fewer than requested per page; step by what it gave
+        page = min(page, fetched)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(start: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                result = await asyncio.to_thread(
+                    self._search_issues_page, jql, fields, start, min(page, total - start)
+                )
+            return result.get('issues', [])
+
+        pages = await asyncio.gather(*(fetch_page(start) for start in range(fetched, total, page)))
+        for page_issues in pages:
+            issues.extend(page_issues)
+        return issues[:total]
 
     async def _get_recent_issues_real(self, project_key: str, limit: int) -> Dict[str, Any]:
         """Get recent issues from JIRA."""
         try:
             jql = f'project = {project_key} ORDER BY created DESC'
-            issues = self._jira_client.jql(jql, limit=limit)['issues']
+            issues = await self._jql_parallel(jql, limit, fields=RECENT_ISSUE_FIELDS)
             return {'issues': issues}
         except Exception as e:
+            if self._is_rate_limited(e):
+                raise
             self.logger.warning(f"Failed to get recent issues for {project_key}: {e}")
             return {'issues': []}
 
+    async def _get_project_context_bundle_real(self, project_key: str,
+                                               recent_limit: int = 50) -> Dict[str, Any]:
+        """
+        Fetch everything needed for a project context concurrently.
+
+        Project details are required and re-raised on failure; the other parts
+        degrade to empty defaults so one flaky endpoint doesn't fail the build.
+        """
+        async def limited(coro):
+            async with self._jira_semaphore():
+                return await coro
+
+        details, sprint, epics, metadata, recent = await asyncio.gather(
+            limited(self._cached_real_call(
+                'get_project_details', project_key, self._get_project_details_real
+            )),
+            limited(self._get_active_sprint_real(project_key)),
+            limited(self._cached_real_call(
+                'get_project_epics', project_key, self._get_project_epics_real
+            )),
+            limited(self._cached_real_call(
+                'get_project_metadata', project_key, self._get_project_metadata_real
+            )),
+            limited(self._get_recent_issues_real(project_key, recent_limit)),
+            return_exceptions=True
+        )
+
+        if isinstance(details, Exception):
+            raise details
+        # Let _make_mcp_call back off and retry rather than building a partial context
+        for result in (sprint, epics, metadata, recent):
+            if isinstance(result, Exception) and self._is_rate_limited(result):
+                raise result
+
+        defaults = {
+            'sprint': (sprint, {}),
+            'epics': (epics, {'epics': []}),
+            'metadata': (metadata, {'issue_types': [], 'custom_fields': [], 'workflows': []}),
+            'recent': (recent, {'issues': []})
+        }
+        bundle = {'details': details}
+        for name, (result, default) in defaults.items():
+            if isinstance(result, Exception):
+                self.logger.warning(f"Failed to get {name} for project {project_key}: {result}")
+                result = default
+            bundle[name] = result
+
+        return bundle
+
     async def _search_similar_issues_real(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Search for similar issues in JIRA."""
         try:
@@ -930,39 +1579,118 @@ class MCPJiraService(LoggerMixin):
             summary = params['summary']
             description = params.get('description', '')
 
-            # Create search terms from summary and description
-            search_text = f'{summary} {description}'
-            words = [word for word in search_text.split() if len(word) > 3]
+            keywords = self._select_search_keywords(f'{summary} {description}')
 
-            if words:
-                # Create JQL query for text search
-                search_terms = ' OR '.join([f'text ~ "{word}"' for word in words[:5]])
-                jql = f'project = {project_key} AND ({search_terms}) ORDER BY created DESC'
-
-                issues = self._jira_client.jql(jql, limit=params.get('limit', 10))['issues']
-                return {'issues': issues}
+            if keywords:
+                issue_types = params.get('issue_types') or []
+                prefilter = self._build_search_prefilter(issue_types, params.get('components') or [])
+                limit = params.get('limit', self.config.jira.max_search_results)
+                # Searches only share a query when they share the same prefilter
+                issues = await self._similar_search_batcher.submit(
+                    (project_key, prefilter), (keywords, limit)
+                )
+                return {'issues': issues, 'pre_filtered': bool(issue_types)}
 
             return {'issues': []}
         except Exception as e:
+            if self._is_rate_limited(e):
+                raise
             self.logger.warning(f"Failed to search similar issues: {e}")
             return {'issues': []}
 
+    def _build_search_prefilter(self, issue_types: List[str], components: List[str]) -> str:
+        """
+        Build the JQL clauses restricting a similar-issue search.
+
+        Issue age, issue type and component are filtered by JIRA's indexes rather
+        than after the issues have been transferred and parsed.
+        """
+        clauses = [f'created >= -{SIMILAR_SEARCH_MAX_AGE_DAYS}d']
+        if issue_types:
+            clauses.append(f"issuetype in ({', '.join(_jql_quote(name) for name in issue_types)})")
+        if components:
+            clauses.append(f"component in ({', '.join(_jql_quote(name) for name in components)})")
+        return ' AND '.join(clauses)
+
+    async def _run_similar_search_batch(self, key: Tuple[str, str],
+                                        requests: List[Tuple[List[str], int]]) -> List[List[Dict[str, Any]]]:
+        """
+        Run queued similar-issue searches for one project as a single JQL query.
+
+        The key is (project_key, prefilter) and each request is (keywords, limit).
+        A lone request is sent as-is and gets exactly what JIRA returns. Several
+        are OR-ed together, and each request keeps the returned issues whose
+        summary contains all of its terms; this local match is stricter than
+        JIRA's own stemming, so a batched search can miss issues a lone search
+        would find. A request left short of its limit by a truncated combined
+        result is re-run on its own, so other requests can't crowd it out.
+        """
+        project_key, prefilter = key
+        if len(requests) == 1:
+            keywords, limit = requests[0]
+            return [await self._search_summary_phrases(project_key, prefilter, [' '.join(keywords)], limit)]
+
+        phrases = list(dict.fromkeys(' '.join(keywords) for keywords, _ in requests))
+        cap = min(sum(limit for _, limit in requests), SIMILAR_SEARCH_BATCH_CAP)
+        issues = await self._search_summary_phrases(project_key, prefilter, phrases, cap)
+        truncated = len(issues) >= cap
+        summary_stems = [self._summary_search_stems(issue) for issue in issues]
+
+        results = []
+        for keywords, limit in requests:
+            wanted = {self._stem_search_term(keyword) for keyword in keywords}
+            matched = [issue for issue, stems in zip(issues, summary_stems) if wanted <= stems][:limit]
+            if truncated and len(matched) < limit:
+                matched = await self._search_summary_phrases(
+                    project_key, prefilter, [' '.join(keywords)], limit
+                )
+            results.append(matched)
+        return results
+
+    async def _search_summary_phrases(self, project_key: str, prefilter: str,
+                                      phrases: List[str], limit: int) -> List[Dict[str, Any]]:
+        """Fetch recently updated issues whose summary matches any of the phrases."""
+        # JIRA matches all terms within a single summary phrase
+        clauses = ' OR '.join(f'summary ~ "{phrase}"' for phrase in phrases)
+        jql = f'project = {project_key} AND {prefilter} AND ({clauses}) ORDER BY updated DESC'
+        return await self._jql_parallel(jql, limit, fields=SIMILAR_ISSUE_FIELDS)
+
+    def _summary_search_stems(self, issue: Dict[str, Any]) -> set:
+        """Stem an issue's summary words the same way search keywords are stemmed."""
+        summary = issue.get('fields', {}).get('summary') or ''
+        return {self._stem_search_term(word) for word in re.findall(r'\w+', summary.lower())}
+
+    def _select_search_keywords(self, text: str, count: int = 3) -> List[str]:
+        """
+        Pick the most distinctive words from text for a JIRA text search.
+
+        Longer words are used as a cheap proxy for rarity (IDF). Inflections of
+        the same word ("export", "exports", "exported") count once, keeping the
+        first form seen. Words that would break out of a JQL string literal are
+        skipped.
+        """
+        words: Dict[str, str] = {}
+        for word in text.split():
+            cleaned = word.strip('.,;:!?()[]{}"\\\'').lower()
+            if (len(cleaned) > 3 and cleaned not in SEARCH_STOP_WORDS
+                    and '"' not in cleaned and '\\' not in cleaned):
+                words.setdefault(self._stem_search_term(cleaned), cleaned)
+        return sorted(words.values(), key=lambda word: (-len(word), word))[:count]
+
+    def _stem_search_term(self, word: str) -> str:
+        """Strip one common English suffix so inflections share a key."""
+        for suffix in SEARCH_STEM_SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+                return word[:-len(suffix)]
+        return word
+
     async def _create_issue_real(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create issue in JIRA."""
         try:
-            project_key = params['project_key']
-            issue_data = params['issue_data']
-
-            # Prepare issue fields
-            fields = {
-                'project': {'key': project_key},
-                'summary': issue_data.get('summary', ''),
-                'description': issue_data.get('description', ''),
-                'issuetype': issue_data.get('issuetype', {'name': 'Task'})
-            }
+            fields = self._build_issue_fields(params['project_key'], params['issue_data'])
 
             # Create the issue
-            created_issue = self._jira_client.issue_create(fields)
+            created_issue = await asyncio.to_thread(self._jira_client.issue_create, fields)
 
             return {
                 'success': True,
@@ -976,6 +1704,64 @@ class MCPJiraService(LoggerMixin):
             self.logger.error(f"Failed to create issue: {e}")
             return {'success': False, 'error': str(e)}
 
+    async def _create_issues_bulk_real(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create several issues in JIRA with one bulk request.
+
+        Returns per-issue results in input order, shaped like _create_issue_real
+        results; JIRA reports rejected issues by position and creates the rest.
+        """
+        try:
+            all_fields = [
+                self._build_issue_fields(params['project_key'], issue_data)
+                for issue_data in params['issues_data']
+            ]
+
+            response = await asyncio.to_thread(
+                self._jira_client.create_issues, [{'fields': fields} for fields in all_fields]
+            )
+
+            errors = {
+                error.get('failedElementNumber'): error.get('elementErrors', {})
+                for error in response.get('errors', [])
+            }
+            created = iter(response.get('issues', []))
+
+            results = []
+            for position, fields in enumerate(all_fields):
+                if position in errors:
+                    element_errors = errors[position]
+                    message = '; '.join(
+                        element_errors.get('errorMessages', []) +
+                        [f"{name}: {error}" for name, error in element_errors.get('errors', {}).items()]
+                    )
+                    results.append({'success': False, 'error': message or 'Issue rejected'})
+                    continue
+
+                created_issue = next(created)
+                results.append({
+                    'success': True,
+                    'issue': {
+                        'key': created_issue['key'],
+                        'summary': fields['summary'],
+                        'status': 'To Do'
+                    }
+                })
+
+            return {'success': True, 'results': results}
+        except Exception as e:
+            self.logger.error(f"Failed to bulk create issues: {e}")
+            return {'success': False, 'error': str(e)}
+
+    def _build_issue_fields(self, project_key: str, issue_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Prepare the JIRA fields payload for creating one issue."""
+        return {
+            'project': {'key': project_key},
+            'summary': issue_data.get('summary', ''),
+            'description': issue_data.get('description', ''),
+            'issuetype': issue_data.get('issuetype', {'name': 'Task'})
+        }
+
     async def _get_mock_response(self, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get mock response when no real JIRA connection available."""
         mock_responses = {
@@ -1024,6 +1810,29 @@ class MCPJiraService(LoggerMixin):
             }
         }
 
+        mock_responses['create_issues_bulk'] = {
+            'success': True,
+            'results': [
+                {
+                    'success': True,
+                    'issue': {
+                        'key': f'DEMO-{datetime.now().microsecond}-{position}',
+                        'summary': issue_data.get('summary', 'New Task (Mock)'),
+                        'status': 'To Do'
+                    }
+                }
+                for position, issue_data in enumerate(params.get('issues_data', []))
+            ]
+        }
+
+        mock_responses['get_project_context_bundle'] = {
+            'details': mock_responses['get_project_details'],
+            'sprint': mock_responses['get_active_sprint'],
+            'epics': mock_responses['get_project_epics'],
+            'metadata': mock_responses['get_project_metadata'],
+            'recent': mock_responses['get_recent_issues']
+        }
+
         return mock_responses.get(operation, {'success': False})
 
     async def _get_basic_projects(self) -> List[Dict[str, Any]]:
@@ -1043,15 +1852,39 @@ class MCPJiraService(LoggerMixin):
             }
         ]
 
-    async def _analyze_task_similarity(self, task_summary: str, task_description: str,
-                                     existing_issue: Dict[str, Any],
-                                     context: ProjectContext) -> TaskSimilarity:
-        """Analyze similarity between new task and existing issue."""
+    def _analyze_task_similarity(self, task_summary: str, task_description: str,
+                                 existing_issue: Dict[str, Any],
+                                 context: ProjectContext,
+                                 task_hash: Optional[int] = None) -> TaskSimilarity:
+        """
+        Analyze similarity between new task and existing issue.
+
+        Callers comparing one task against many issues should pass task_hash
+        from _summary_hash so the task summary is normalized only once. Scores
+        that land just below the duplicate threshold are re-checked with a fuzzy
+        match when RapidFuzz is installed.
+        """
         # Simple similarity calculation (in real implementation, use more sophisticated algorithms)
         existing_summary = existing_issue.get('fields', {}).get('summary', '')
+        context_factors = ['text_similarity']
+
+        # Identical summaries (e.g. a retried submission) need no tokenizing
+        if task_hash is None:
+            task_hash = self._summary_hash(task_summary)
+        if task_hash == self._attach_summary_hash(existing_issue) and \
+                self._normalize_summary(task_summary) == self._normalize_summary(existing_summary):
+            similarity_score = 1.0
+        else:
+            # Calculate basic text similarity
+            similarity_score = self._calculate_text_similarity(task_summary, existing_summary)
 
-        # Calculate basic text similarity
-        similarity_score = self._calculate_text_similarity(task_summary, existing_summary)
+            if RAPIDFUZZ_AVAILABLE and FUZZY_RECHECK_MIN <= similarity_score < FUZZY_RECHECK_MAX:
+                fuzzy_score = fuzz.token_set_ratio(
+                    task_summary, existing_summary, processor=default_process
+                ) / 100.0
+                if fuzzy_score > similarity_score:
+                    similarity_score = fuzzy_score
+                    context_factors.append('fuzzy_match')
 
         # Determine recommendation based on score
         if similarity_score >= 0.9:
@@ -1070,22 +1903,58 @@ class MCPJiraService(LoggerMixin):
             similarity_score=similarity_score,
             recommendation=recommendation,
             suggested_action=suggested_action,
-            context_factors=['text_similarity']
+            context_factors=context_factors
         )
 
     def _calculate_text_similarity(self, text1: str, text2: str) -> float:
         """Calculate basic text similarity."""
-        # Simple word overlap calculation
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+        return self._calculate_text_similarity_sets(
+            self._tokenize(text1)[0], self._tokenize(text2)[0]
+        )
+
+    def _bulk_similarity_scores(self, task_tokens: frozenset,
+                                issue_token_sets: List[frozenset]) -> List[float]:
+        """
+        Jaccard similarity of task_tokens against many token sets at once.
 
+        Large batches are scored with one matrix-vector product over a 0/1 token
+        incidence matrix; small batches (or no NumPy) fall back to set operations.
+        Scores match _calculate_text_similarity_sets either way.
+        """
+        if not NUMPY_AVAILABLE or len(issue_token_sets) < BULK_SIMILARITY_MIN_ISSUES:
+            return [self._calculate_text_similarity_sets(task_tokens, tokens)
+                    for tokens in issue_token_sets]
+        if not task_tokens:
+            return [0.0] * len(issue_token_sets)
+
+        vocabulary: Dict[str, int] = {}
+        rows: List[int] = []
+        columns: List[int] = []
+        for row, tokens in enumerate(issue_token_sets):
+            for token in tokens:
+                rows.append(row)
+                columns.append(vocabulary.setdefault(token, len(vocabulary)))
+        query_columns = [vocabulary.setdefault(token, len(vocabulary)) for token in task_tokens]
+
+        matrix = np.zeros((len(issue_token_sets), len(vocabulary)), dtype=np.uint8)
+        matrix[rows, columns] = 1
+        query = np.zeros(len(vocabulary), dtype=np.int32)
+        query[query_columns] = 1
+
+        intersection = matrix @ query
+        sizes = matrix.sum(axis=1, dtype=np.int32)
+        union = sizes + len(task_tokens) - intersection
+        scores = np.divide(intersection, union, out=np.zeros(len(issue_token_sets)),
+                           where=sizes > 0)
+        return scores.tolist()
+
+    def _calculate_text_similarity_sets(self, words1: frozenset, words2: frozenset) -> float:
+        """Calculate Jaccard word overlap from pre-tokenized sets."""
         if not words1 or not words2:
             return 0.0
 
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-
-        return len(intersection) / len(union) if union else 0.0
+        shared = len(words1 & words2)
+        return shared / (len(words1) + len(words2) - shared)
 
     async def _enhance_task_data(self, task_data: Dict[str, Any],
                                context: ProjectContext) -> Dict[str, Any]:
@@ -1095,38 +1964,39 @@ class MCPJiraService(LoggerMixin):
         # Set appropriate issue type based on context
         if not enhanced.get('issuetype') and context.issue_types:
             # Simple logic: use 'Task' if available, otherwise first available type
-            task_type = next((it for it in context.issue_types if it['name'] == 'Task'),
-                           context.issue_types[0] if context.issue_types else None)
-            if task_type:
-                enhanced['issuetype'] = {'id': task_type['id']}
+            task_type = context.issue_type_by_name.get('Task') or context.issue_types[0]
+            enhanced['issuetype'] = {'id': task_type.id}
 
         # Add sprint information if available
-        if context.active_sprint:
-            enhanced['sprint'] = context.active_sprint['id']
+        active_sprint = context.get_active_sprint()
+        if active_sprint:
+            enhanced['sprint'] = active_sprint.id
 
         return enhanced
 
     async def _auto_link_to_epics(self, created_task: Dict[str, Any],
                                 context: ProjectContext):
-        """Auto-link task to appropriate epic."""
-        if not context.epics:
+        """Auto-link task to every epic sharing a keyword with it, concurrently."""
+        if not context.available_epics:
             return
 
-        # Simple epic matching based on keywords
-        task_summary = created_task.get('fields', {}).get('summary', '').lower()
-
-        for epic in context.epics:
-            epic_summary = epic.get('summary', '').lower()
+        # Keyword match through the context's prebuilt epic index; created issues
+        # carry the summary at the top level, fetched issues under 'fields'
+        task_summary = created_task.get('summary') or created_task.get('fields', {}).get('summary', '')
+        epics = context.find_epics_for_text(task_summary)
+        if not epics:
+            return
 
-            # Check for keyword overlap
-            if any(word in task_summary for word in epic_summary.split() if len(word) > 3):
-                try:
-                    await self._make_mcp_call('link_issues', {
-                        'inward_issue': created_task['key'],
-                        'outward_issue': epic['key'],
-                        'link_type': 'Epic-Story Link'
-                    })
-                    self.logger.info(f"Linked {created_task['key']} to epic {epic['key']}")
-                    break
-                except Exception as e:
-                    self.logger.warning(f"Failed to link to epic: {e}")
\ No newline at end of file
+        results = await asyncio.gather(
+            *(self._make_mcp_call('link_issues', {
+                'inward_issue': created_task['key'],
+                'outward_issue': epic.key,
+                'link_type': 'Epic-Story Link'
+            }) for epic in epics),
+            return_exceptions=True
+        )
+        for epic, result in zip(epics, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Failed to link {created_task['key']} to epic {epic.key}: {result}")
+            else:
+                self.logger.info(f"Linked {created_task['key']} to epic {epic.key}")
\ No newline at end of file
@@ -1,20 +1,91 @@
 """Smart duplicate detection service with MCP-enhanced intelligence."""
 
 import asyncio
+import bisect
+import functools
+import heapq
+from collections import Counter
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from fuzzywuzzy import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 import re
 
 from .mcp_jira_service import MCPJiraService, ProjectContext, TaskSimilarity
 from ..config import AppConfig
+from ..models.project_context import EpicInfo
 from ..exceptions import DuplicateDetectionError
 from ..utils import LoggerMixin
-from .cache_service import CacheService
+from .cache_service import CacheService, AsyncTTLCache
 
+# Weights of each factor when comparing a new task against an existing JIRA issue
+CANDIDATE_WEIGHTS = {
+    'text': 0.4,
+    'semantic': 0.3,
+    'context': 0.15,
+    'temporal': 0.1,
+    'assignee': 0.05
+}
 
-@dataclass
+# Weights of text and word-overlap similarity when comparing two new tasks
+TASK_TEXT_WEIGHT = 0.6
+TASK_SEMANTIC_WEIGHT = 0.4
+
+# Words of three or more characters, minus filler words, become search terms
+SEARCH_TERM_PATTERN = re.compile(r'\b\w{3,}\b')
+SEARCH_COMMON_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'
+})
+
+# Candidates created within 7/30/90 days (or older) get these temporal scores
+TEMPORAL_AGE_BUCKETS = (7, 30, 90)
+TEMPORAL_SCORES = (1.0, 0.8, 0.6, 0.4)
+
+# Epics scoring above this are suggested as parents, best few first
+EPIC_SUGGESTION_MIN_SCORE = 0.3
+EPIC_SUGGESTION_LIMIT = 3
+
+# Upper bound on per-task JIRA duplicate searches a bulk analysis keeps in flight
+MAX_CONCURRENT_DUPLICATE_SCANS = 8
+
+# JIRA candidates found for a task are reused briefly, e.g. when a bulk run rechecks it
+CANDIDATE_CACHE_TTL = 60
+CANDIDATE_CACHE_MAXSIZE = 256
+
+# Recently normalized texts kept so a task compared against many candidates is processed once
+NORMALIZE_CACHE_SIZE = 4096
+
+# Scored text pairs kept so a candidate returned for several tasks or strategies is scored once
+PAIR_SCORE_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_text(text: str) -> str:
+    """Lowercase text and strip non-alphanumerics the way RapidFuzz's default processor does."""
+    return default_process(text)
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _meaningful_words(text: str) -> frozenset:
+    """Lowercased words longer than three characters, memoized per text."""
+    return frozenset(word.lower() for word in text.split() if len(word) > 3)
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _parse_created(value: str) -> datetime:
+    """Parse a JIRA created timestamp, memoized since candidates recur across tasks."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+@functools.lru_cache(maxsize=PAIR_SCORE_CACHE_SIZE)
+def _text_similarity(text1: str, text2: str) -> float:
+    """token_sort_ratio of two texts on a 0-1 scale, memoized per pair."""
+    return fuzz.token_sort_ratio(_normalize_text(text1), _normalize_text(text2)) / 100.0
+
+
+@dataclass(slots=True)
 class DuplicateCandidate:
     """A potential duplicate task candidate."""
 
@@ -31,7 +102,7 @@ class DuplicateCandidate:
     project_context: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ConflictResolution:
     """Resolution for a duplicate conflict."""
 
@@ -43,7 +114,7 @@ class ConflictResolution:
     auto_resolved: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class SimilarityAnalysis:
     """Comprehensive similarity analysis result."""
 
@@ -70,9 +141,11 @@ class SmartDuplicateService(LoggerMixin):
         self.config = config
         self.mcp_service = mcp_service
         self._cache_service = CacheService()
+        self._candidate_cache = AsyncTTLCache(ttl=CANDIDATE_CACHE_TTL, maxsize=CANDIDATE_CACHE_MAXSIZE)
 
     async def find_duplicates_via_mcp(self, task: Dict[str, Any], project_key: str,
-                                    include_resolved: bool = False) -> List[DuplicateCandidate]:
+                                    include_resolved: bool = False,
+                                    project_context: Optional[ProjectContext] = None) -> List[DuplicateCandidate]:
         """
         Find duplicate candidates using MCP-powered JIRA search.
 
@@ -80,6 +153,7 @@ class SmartDuplicateService(LoggerMixin):
             task: Task data to check for duplicates
             project_key: JIRA project key
             include_resolved: Whether to include resolved issues
+            project_context: Already loaded context for project_key, fetched if omitted
 
         Returns:
             List of duplicate candidates with analysis
@@ -88,41 +162,60 @@ class SmartDuplicateService(LoggerMixin):
             self.logger.info(f"Starting smart duplicate detection for project {project_key}")
 
             # Get project context for enhanced matching
-            project_context = await self.mcp_service.get_project_context(project_key)
-
-            # Search for similar tasks using multiple strategies
-            candidates = await self._search_similar_tasks_multi_strategy(
-                task, project_key, project_context, include_resolved
+            if project_context is None:
+                project_context = await self.mcp_service.get_project_context(project_key)
+
+            # Search for similar tasks using multiple strategies; tasks differing only
+            # in case or punctuation share the search
+            candidates = await self._candidate_cache.get_or_load(
+                (
+                    project_key,
+                    _normalize_text(task.get('summary', '')),
+                    _normalize_text(task.get('description', '') or ''),
+                    include_resolved
+                ),
+                lambda: self._search_similar_tasks_multi_strategy(
+                    task, project_key, project_context, include_resolved
+                )
             )
 
             # Analyze each candidate for similarity
             analyzed_candidates = []
-            for candidate in candidates:
+            threshold = self.config.jira.similarity_threshold
+            text_scores = self._score_candidate_texts(task, candidates, min_score=threshold)
+            for candidate, text_sim in zip(candidates, text_scores):
+                # Skip candidates that can't reach the threshold even if every other factor is perfect
+                if text_sim * CANDIDATE_WEIGHTS['text'] + (1 - CANDIDATE_WEIGHTS['text']) < threshold:
+                    continue
+
                 analysis = await self._analyze_comprehensive_similarity(
-                    task, candidate, project_context
+                    task, candidate, project_context, text_sim=text_sim
                 )
-
-                if analysis.overall_score >= self.config.jira.similarity_threshold:
-                    duplicate_candidate = DuplicateCandidate(
-                        issue_key=candidate.get('key', ''),
-                        summary=candidate.get('fields', {}).get('summary', ''),
-                        description=candidate.get('fields', {}).get('description', '') or '',
-                        status=candidate.get('fields', {}).get('status', {}).get('name', ''),
-                        assignee=self._get_assignee_name(candidate),
-                        created_date=candidate.get('fields', {}).get('created', ''),
-                        similarity_score=analysis.overall_score,
-                        similarity_factors=analysis.factors,
-                        recommendation=self._get_recommendation(analysis),
-                        confidence=self._calculate_confidence(analysis),
-                        project_context=self._extract_issue_context(candidate, project_context)
-                    )
-                    analyzed_candidates.append(duplicate_candidate)
-
-            # Sort by similarity score
-            analyzed_candidates.sort(key=lambda x: x.similarity_score, reverse=True)
+                if analysis.overall_score < threshold:
+                    continue
+
+                fields = candidate.get('fields', {})
+                analyzed_candidates.append(DuplicateCandidate(
+                    issue_key=candidate.get('key', ''),
+                    summary=fields.get('summary', ''),
+                    description=fields.get('description', '') or '',
+                    status=fields.get('status', {}).get('name', ''),
+                    assignee=self._get_assignee_name(candidate),
+                    created_date=fields.get('created', ''),
+                    similarity_score=analysis.overall_score,
+                    similarity_factors=analysis.factors,
+                    recommendation=self._get_recommendation(analysis),
+                    confidence=self._calculate_confidence(analysis),
+                    project_context=self._extract_issue_context(candidate, project_context)
+                ))
 
             self.logger.info(f"Found {len(analyzed_candidates)} potential duplicates")
-            return analyzed_candidates[:self.config.jira.max_search_results]
+
+            # Keep the highest scoring candidates without sorting the whole list
+            return heapq.nlargest(
+                self.config.jira.max_search_results, analyzed_candidates,
+                key=lambda x: x.similarity_score
+            )
 
         except Exception as e:
             self.logger.error(f"Duplicate detection failed: {e}")
@@ -144,28 +237,20 @@ class SmartDuplicateService(LoggerMixin):
 
             project_context = await self.mcp_service.get_project_context(project_key)
 
-            # Analyze each task for duplicates
-            all_duplicates = {}
-            cross_references = []
+            # Find duplicates in JIRA for every task concurrently
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_DUPLICATE_SCANS)
 
-            for i, task in enumerate(tasks):
-                task_id = f"task_{i}"
+            async def scan(task: Dict[str, Any]) -> List[DuplicateCandidate]:
+                async with semaphore:
+                    return await self.find_duplicates_via_mcp(
+                        task, project_key, project_context=project_context
+                    )
+
+            results = await asyncio.gather(*(scan(task) for task in tasks))
+            all_duplicates = {f"task_{i}": duplicates for i, duplicates in enumerate(results)}
 
-                # Find duplicates in JIRA
-                duplicates = await self.find_duplicates_via_mcp(task, project_key)
-                all_duplicates[task_id] = duplicates
-
-                # Check for cross-references with other tasks in the batch
-                for j, other_task in enumerate(tasks[i+1:], i+1):
-                    similarity = await self._analyze_task_to_task_similarity(task, other_task)
-                    if similarity.overall_score >= self.config.jira.similarity_threshold:
-                        cross_references.append({
-                            'task_1_id': task_id,
-                            'task_2_id': f"task_{j}",
-                            'similarity_score': similarity.overall_score,
-                            'recommendation': self._get_recommendation(similarity),
-                            'factors': similarity.factors
-                        })
+            # Check for cross-references between tasks in the batch
+            cross_references = self._find_cross_references(tasks)
 
             # Generate summary statistics
             summary = self._generate_duplicate_summary(all_duplicates, cross_references)
@@ -237,11 +322,20 @@ class SmartDuplicateService(LoggerMixin):
 
             relationships = []
 
+            # Score every task against every epic up front
+            epics = project_context.available_epics
+            epic_scores = (
+                self._score_epic_texts([self._task_text(task) for task in tasks], epics)
+                if tasks and epics else None
+            )
+
             for i, task in enumerate(tasks):
                 task_id = f"task_{i}"
 
                 # Find potential parent epics
-                epic_suggestions = await self._suggest_epic_relationships(task, project_context)
+                epic_suggestions = await self._suggest_epic_relationships(
+                    task, project_context, epic_scores[i] if epic_scores else None
+                )
 
                 # Find blocking/blocked relationships
                 blocking_suggestions = await self._suggest_blocking_relationships(task, project_context)
@@ -268,36 +362,23 @@ class SmartDuplicateService(LoggerMixin):
                                                  project_context: ProjectContext,
                                                  include_resolved: bool) -> List[Dict[str, Any]]:
         """Search for similar tasks using multiple strategies."""
-        all_candidates = []
-
-        # Strategy 1: Exact text matching
-        text_candidates = await self._search_by_text_similarity(
-            task, project_key, include_resolved
+        # Strategies run concurrently: exact text matching, keyword-based search
+        # and AI semantic search, in that order of precedence
+        strategy_results = await asyncio.gather(
+            self._search_by_text_similarity(task, project_key, include_resolved),
+            self._search_by_keywords(task, project_key, project_context, include_resolved),
+            self._search_by_semantic_similarity(task, project_key, project_context, include_resolved)
         )
-        all_candidates.extend(text_candidates)
+        all_candidates = [candidate for candidates in strategy_results for candidate in candidates]
 
-        # Strategy 2: Keyword-based search
-        keyword_candidates = await self._search_by_keywords(
-            task, project_key, project_context, include_resolved
-        )
-        all_candidates.extend(keyword_candidates)
-
-        # Strategy 3: Semantic search using AI
-        semantic_candidates = await self._search_by_semantic_similarity(
-            task, project_key, project_context, include_resolved
-        )
-        all_candidates.extend(semantic_candidates)
-
-        # Remove duplicates based on issue key
-        seen_keys = set()
-        unique_candidates = []
+        # Remove duplicates based on issue key, keeping the first strategy's match
+        unique_candidates = {}
         for candidate in all_candidates:
             key = candidate.get('key', '')
-            if key and key not in seen_keys:
-                seen_keys.add(key)
-                unique_candidates.append(candidate)
+            if key:
+                unique_candidates.setdefault(key, candidate)
 
-        return unique_candidates
+        return list(unique_candidates.values())
 
     async def _search_by_text_similarity(self, task: Dict[str, Any], project_key: str,
                                        include_resolved: bool) -> List[Dict[str, Any]]:
@@ -341,18 +422,19 @@ class SmartDuplicateService(LoggerMixin):
 
     async def _analyze_comprehensive_similarity(self, task: Dict[str, Any],
                                               candidate: Dict[str, Any],
-                                              project_context: ProjectContext) -> SimilarityAnalysis:
-        """Perform comprehensive similarity analysis."""
-        task_summary = task.get('summary', '')
-        task_description = task.get('description', '')
-        task_text = f"{task_summary} {task_description}"
+                                              project_context: ProjectContext,
+                                              text_sim: Optional[float] = None) -> SimilarityAnalysis:
+        """
+        Perform comprehensive similarity analysis.
 
-        candidate_summary = candidate.get('fields', {}).get('summary', '')
-        candidate_description = candidate.get('fields', {}).get('description', '') or ''
-        candidate_text = f"{candidate_summary} {candidate_description}"
+        text_sim may be passed in when the caller already scored the texts in bulk.
+        """
+        task_text = self._task_text(task)
+        candidate_text = self._candidate_text(candidate)
 
-        # Text similarity using fuzzywuzzy
-        text_sim = fuzz.token_sort_ratio(task_text.lower(), candidate_text.lower()) / 100.0
+        # Text similarity using RapidFuzz
+        if text_sim is None:
+            text_sim = _text_similarity(task_text, candidate_text)
 
         # Semantic similarity (mock for now)
         semantic_sim = self._calculate_semantic_similarity(task_text, candidate_text)
@@ -367,20 +449,12 @@ class SmartDuplicateService(LoggerMixin):
         assignee_sim = self._calculate_assignee_similarity(task, candidate)
 
         # Calculate weighted overall score
-        weights = {
-            'text': 0.4,
-            'semantic': 0.3,
-            'context': 0.15,
-            'temporal': 0.1,
-            'assignee': 0.05
-        }
-
         overall_score = (
-            text_sim * weights['text'] +
-            semantic_sim * weights['semantic'] +
-            context_sim * weights['context'] +
-            temporal_sim * weights['temporal'] +
-            assignee_sim * weights['assignee']
+            text_sim * CANDIDATE_WEIGHTS['text'] +
+            semantic_sim * CANDIDATE_WEIGHTS['semantic'] +
+            context_sim * CANDIDATE_WEIGHTS['context'] +
+            temporal_sim * CANDIDATE_WEIGHTS['temporal'] +
+            assignee_sim * CANDIDATE_WEIGHTS['assignee']
         )
 
         # Determine contributing factors
@@ -409,13 +483,87 @@ class SmartDuplicateService(LoggerMixin):
     async def _analyze_task_to_task_similarity(self, task1: Dict[str, Any],
                                              task2: Dict[str, Any]) -> SimilarityAnalysis:
         """Analyze similarity between two new tasks."""
-        task1_text = f"{task1.get('summary', '')} {task1.get('description', '')}"
-        task2_text = f"{task2.get('summary', '')} {task2.get('description', '')}"
+        task1_text = self._task_text(task1)
+        task2_text = self._task_text(task2)
+
+        text_sim = _text_similarity(task1_text, task2_text)
+        return self._build_task_similarity(text_sim, task1_text, task2_text)
 
-        text_sim = fuzz.token_sort_ratio(task1_text.lower(), task2_text.lower()) / 100.0
+    def _find_cross_references(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Find pairs of tasks in a batch similar enough to be duplicates of each other.
+
+        Text similarity for every pair comes from one RapidFuzz cdist call. Pairs
+        whose text score is too low to reach the threshold even with full word
+        overlap are cut off there, so only the remaining pairs are scored in Python.
+        """
+        if len(tasks) < 2:
+            return []
+
+        threshold = self.config.jira.similarity_threshold
+        texts = [self._task_text(task) for task in tasks]
+        text_cutoff = max(0.0, (threshold - TASK_SEMANTIC_WEIGHT) / TASK_TEXT_WEIGHT) * 100
+
+        normalized = [_normalize_text(text) for text in texts]
+        scores = process.cdist(
+            normalized, normalized,
+            scorer=fuzz.token_sort_ratio,
+            score_cutoff=text_cutoff,
+            dtype=np.float64,
+            workers=-1
+        )
+
+        cross_references = []
+        for i, j in np.argwhere(np.triu(scores >= text_cutoff, k=1)):
+            similarity = self._build_task_similarity(float(scores[i, j]) / 100.0, texts[i], texts[j])
+            if similarity.overall_score >= threshold:
+                cross_references.append({
+                    'task_1_id': f"task_{i}",
+                    'task_2_id': f"task_{j}",
+                    'similarity_score': similarity.overall_score,
+                    'recommendation': self._get_recommendation(similarity),
+                    'factors': similarity.factors
+                })
+
+        return cross_references
+
+    def _task_text(self, task: Dict[str, Any]) -> str:
+        """Combine a new task's summary and description for text comparison."""
+        return f"{task.get('summary', '')} {task.get('description', '')}"
+
+    def _candidate_text(self, candidate: Dict[str, Any]) -> str:
+        """Combine a JIRA issue's summary and description for text comparison."""
+        fields = candidate.get('fields', {})
+        return f"{fields.get('summary', '')} {fields.get('description', '') or ''}"
+
+    def _score_candidate_texts(self, task: Dict[str, Any], candidates: List[Dict[str, Any]],
+                               min_score: float = 0.0) -> List[float]:
+        """
+        Text similarity of a task against every candidate from one RapidFuzz cdist row.
+
+        With min_score, text scores too low for the overall score to reach it come
+        back as 0 so RapidFuzz can stop scoring those pairs early.
+        """
+        if not candidates:
+            return []
+
+        text_weight = CANDIDATE_WEIGHTS['text']
+        text_cutoff = max(0.0, (min_score - (1 - text_weight)) / text_weight) * 100
+        scores = process.cdist(
+            [_normalize_text(self._task_text(task))],
+            [_normalize_text(self._candidate_text(candidate)) for candidate in candidates],
+            scorer=fuzz.token_sort_ratio,
+            score_cutoff=text_cutoff,
+            dtype=np.float64
+        )
+        return (scores[0] / 100.0).tolist()
+
+    def _build_task_similarity(self, text_sim: float, task1_text: str,
+                               task2_text: str) -> SimilarityAnalysis:
+        """Combine text and word-overlap similarity for two new tasks."""
         semantic_sim = self._calculate_semantic_similarity(task1_text, task2_text)
 
-        overall_score = (text_sim * 0.6 + semantic_sim * 0.4)
+        overall_score = (text_sim * TASK_TEXT_WEIGHT + semantic_sim * TASK_SEMANTIC_WEIGHT)
 
         factors = []
         if text_sim > 0.8:
@@ -436,16 +584,15 @@ class SmartDuplicateService(LoggerMixin):
     def _calculate_semantic_similarity(self, text1: str, text2: str) -> float:
         """Calculate semantic similarity (simplified implementation)."""
         # Simplified semantic similarity based on common meaningful words
-        words1 = set(word.lower() for word in text1.split() if len(word) > 3)
-        words2 = set(word.lower() for word in text2.split() if len(word) > 3)
+        words1 = _meaningful_words(text1)
+        words2 = _meaningful_words(text2)
 
         if not words1 or not words2:
             return 0.0
 
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-
-        return len(intersection) / len(union) if union else 0.0
+        # Jaccard index; the union size follows from the intersection
+        intersection = len(words1 & words2)
+        return intersection / (len(words1) + len(words2) - intersection)
 
     def _calculate_context_similarity(self, task: Dict[str, Any], candidate: Dict[str, Any],
                                     project_context: ProjectContext) -> float:
@@ -466,19 +613,12 @@ class SmartDuplicateService(LoggerMixin):
             if not created_str:
                 return 0.5
 
-            created_date = datetime.fromisoformat(created_str.replace('Z', '+00:00'))
+            created_date = _parse_created(created_str)
             now = datetime.now(created_date.tzinfo)
             days_old = (now - created_date).days
 
             # More recent issues are more likely to be duplicates
-            if days_old <= 7:
-                return 1.0
-            elif days_old <= 30:
-                return 0.8
-            elif days_old <= 90:
-                return 0.6
-            else:
-                return 0.4
+            return TEMPORAL_SCORES[bisect.bisect_left(TEMPORAL_AGE_BUCKETS, days_old)]
 
         except Exception:
             return 0.5
@@ -503,9 +643,7 @@ class SmartDuplicateService(LoggerMixin):
     def _extract_search_terms(self, text: str) -> List[str]:
         """Extract meaningful search terms from text."""
         # Remove common words and extract meaningful terms
-        common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        words = re.findall(r'\b\w{3,}\b', text.lower())
-        return [word for word in words if word not in common_words]
+        return [word for word in SEARCH_TERM_PATTERN.findall(text.lower()) if word not in SEARCH_COMMON_WORDS]
 
     def _extract_keywords(self, task: Dict[str, Any], project_context: ProjectContext) -> List[str]:
         """Extract keywords considering project context."""
@@ -547,22 +685,27 @@ class SmartDuplicateService(LoggerMixin):
     def _generate_duplicate_summary(self, all_duplicates: Dict[str, List],
                                   cross_references: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate summary statistics for duplicate analysis."""
-        total_duplicates = sum(len(dups) for dups in all_duplicates.values())
-        tasks_with_duplicates = len([task_id for task_id, dups in all_duplicates.items() if dups])
+        total_duplicates = 0
+        tasks_with_duplicates = 0
+        high_confidence = 0
+        recommendations = Counter()
 
-        recommendations = {}
+        # Single pass over every candidate
         for dups in all_duplicates.values():
+            if dups:
+                tasks_with_duplicates += 1
             for dup in dups:
-                rec = dup.recommendation
-                recommendations[rec] = recommendations.get(rec, 0) + 1
+                total_duplicates += 1
+                recommendations[dup.recommendation] += 1
+                if dup.confidence > 0.8:
+                    high_confidence += 1
 
         return {
             'total_potential_duplicates': total_duplicates,
             'tasks_with_duplicates': tasks_with_duplicates,
             'cross_references_found': len(cross_references),
-            'recommendations_breakdown': recommendations,
-            'high_confidence_duplicates': sum(1 for dups in all_duplicates.values()
-                                            for dup in dups if dup.confidence > 0.8)
+            'recommendations_breakdown': dict(recommendations),
+            'high_confidence_duplicates': high_confidence
         }
 
     async def _apply_resolution(self, conflict: Dict[str, Any], resolution: Dict[str, Any]):
@@ -575,27 +718,47 @@ class SmartDuplicateService(LoggerMixin):
 
         self.logger.info(f"Applied resolution: {resolution.get('action')} for conflict")
 
-    async def _suggest_epic_relationships(self, task: Dict[str, Any],
-                                        project_context: ProjectContext) -> List[Dict[str, Any]]:
-        """Suggest epic relationships for a task."""
-        suggestions = []
+    async def _suggest_epic_relationships(self, task: Dict[str, Any], project_context: ProjectContext,
+                                        epic_scores: Optional[List[float]] = None) -> List[Dict[str, Any]]:
+        """
+        Suggest epic relationships for a task.
 
-        if project_context.epics:
-            task_text = f"{task.get('summary', '')} {task.get('description', '')}".lower()
+        epic_scores, one per available epic, may be passed in when the caller
+        already scored a batch of tasks against the epics.
+        """
+        epics = project_context.available_epics
+        if not epics:
+            return []
 
-            for epic in project_context.epics:
-                epic_text = epic.get('summary', '').lower()
-                similarity = fuzz.token_sort_ratio(task_text, epic_text) / 100.0
+        if epic_scores is None:
+            epic_scores = self._score_epic_texts([self._task_text(task)], epics)[0]
 
-                if similarity > 0.3:  # Lower threshold for epic relationships
-                    suggestions.append({
-                        'epic_key': epic.get('key', ''),
-                        'epic_summary': epic.get('summary', ''),
-                        'similarity_score': similarity,
-                        'relationship_type': 'parent_epic'
-                    })
+        # Lower threshold for epic relationships
+        scored = [
+            (similarity, epic) for similarity, epic in zip(epic_scores, epics)
+            if similarity > EPIC_SUGGESTION_MIN_SCORE
+        ]
+        return [
+            {
+                'epic_key': epic.key,
+                'epic_summary': epic.summary,
+                'similarity_score': similarity,
+                'relationship_type': 'parent_epic'
+            }
+            for similarity, epic in heapq.nlargest(EPIC_SUGGESTION_LIMIT, scored, key=lambda item: item[0])
+        ]
 
-        return suggestions[:3]  # Return top 3 suggestions
+    def _score_epic_texts(self, task_texts: List[str], epics: List[EpicInfo]) -> List[List[float]]:
+        """Text similarity of each task against each epic summary from one RapidFuzz cdist call."""
+        scores = process.cdist(
+            [_normalize_text(text) for text in task_texts],
+            [_normalize_text(epic.summary) for epic in epics],
+            scorer=fuzz.token_sort_ratio,
+            score_cutoff=EPIC_SUGGESTION_MIN_SCORE * 100,
+            dtype=np.float64,
+            workers=-1
+        )
+        return (scores / 100.0).tolist()
 
     async def _suggest_blocking_relationships(self, task: Dict[str, Any],
                                             project_context: ProjectContext) -> List[Dict[str, Any]]:
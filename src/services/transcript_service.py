@@ -1,6 +1,10 @@
 """Service for processing meeting transcripts and extracting actionable items."""
 
-from typing import Dict, List, Any, Tuple
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Tuple
 
 from ..config import AppConfig
 from ..exceptions import TranscriptError, AIServiceError
@@ -8,6 +12,17 @@ from ..utils import LoggerMixin
 from .ai_service import AIService, OllamaService
 from .cache_service import CacheService
 
+# Seconds a service status (including the AI connection probe) is reused
+SERVICE_STATUS_TTL = 5.0
+
+# Transcripts are analyzed in line-aligned chunks of at least this many characters...
+TRANSCRIPT_CHUNK_MIN_CHARS = 2000
+# ...and at most this many, unless a single line is longer
+TRANSCRIPT_CHUNK_MAX_CHARS = 8000
+# Past the minimum, a chunk ends after a line whose CRC has these bits clear, so
+# boundaries depend on content and an edit only disturbs the chunk it lands in
+TRANSCRIPT_CHUNK_BOUNDARY_MASK = 0x3
+
 
 class TranscriptAnalysisService(LoggerMixin):
     """Service for analyzing meeting transcripts and extracting tasks and Q&A."""
@@ -23,6 +38,17 @@ class TranscriptAnalysisService(LoggerMixin):
         self.config = config
         self.ai_service = ai_service or OllamaService(config)
         self._cache_service = CacheService()
+        self._status_cache: Tuple[float, Any] = (0.0, None)
+        # Bounds model calls across batch and chunk workers together, so nested
+        # pools never exceed ollama.max_concurrent_requests calls in flight
+        self._ai_slots = threading.BoundedSemaphore(max(1, config.ollama.max_concurrent_requests))
+        
+        # JIRA settings are fixed for the life of the service
+        self._jira_configured = all([
+            config.jira.base_url,
+            config.jira.username,
+            config.jira.api_token
+        ])
     
     def analyze_transcript(self, transcript: str, context: str = "") -> Dict[str, Any]:
         """
@@ -51,9 +77,8 @@ class TranscriptAnalysisService(LoggerMixin):
         self.logger.info("Starting comprehensive transcript analysis")
         
         try:
-            # Extract tasks and Q&A in parallel with context
-            tasks = self.ai_service.parse_transcript(transcript, context)
-            qa_items = self.ai_service.extract_questions(transcript, context)
+            # Extract tasks and Q&A together with context
+            tasks, qa_items = self._extract(transcript, context)
             
             result = {
                 'tasks': tasks,
@@ -63,7 +88,7 @@ class TranscriptAnalysisService(LoggerMixin):
                 'success': True
             }
             
-            self.logger.info(f"Analysis complete: {len(tasks)} tasks, {len(qa_items)} Q&A items")
+            self.logger.info("Analysis complete: %d tasks, %d Q&A items", len(tasks), len(qa_items))
             
             # Cache the complete analysis result
             self._cache_service.cache_transcript_analysis(transcript, context, result)
@@ -71,9 +96,174 @@ class TranscriptAnalysisService(LoggerMixin):
             return result
             
         except Exception as e:
-            self.logger.error(f"Transcript analysis failed: {e}")
+            self.logger.error("Transcript analysis failed: %s", e)
             raise
     
+    def analyze_transcript_stream(self, transcript: str, context: str = "") -> Iterator[Dict[str, Any]]:
+        """
+        Analyze transcript, yielding tasks as soon as they are extracted.
+        
+        Args:
+            transcript: Raw meeting transcript text
+            context: Additional context to enhance AI processing
+            
+        Yields:
+            Event dictionaries with 'event' and 'data' keys: one 'task' event
+            per task, then 'qa_items' with all Q&A items, then 'complete'
+            with the same result analyze_transcript returns
+            
+        Raises:
+            TranscriptError: If transcript is invalid
+            AIServiceError: If AI service fails
+        """
+        if not transcript.strip():
+            raise TranscriptError("Transcript cannot be empty")
+        
+        result = self._cache_service.get_transcript_analysis(transcript, context)
+        if result:
+            self.logger.info("Streaming cached transcript analysis")
+            for task in result['tasks']:
+                yield {'event': 'task', 'data': task}
+            yield {'event': 'qa_items', 'data': result['qa_items']}
+            yield {'event': 'complete', 'data': result}
+            return
+        
+        self.logger.info("Starting streamed transcript analysis")
+        
+        if self.config.chunked_transcript_analysis:
+            # Same extraction as analyze_transcript, so both return the same tasks
+            tasks, qa_items = self._extract(transcript, context)
+            for task in tasks:
+                yield {'event': 'task', 'data': task}
+        else:
+            tasks = []
+            for task in self.ai_service.parse_transcript_stream(transcript, context):
+                tasks.append(task)
+                yield {'event': 'task', 'data': task}
+            qa_items = self.ai_service.extract_questions(transcript, context)
+        
+        yield {'event': 'qa_items', 'data': qa_items}
+        
+        result = {
+            'tasks': tasks,
+            'qa_items': qa_items,
+            'tasks_count': len(tasks),
+            'qa_count': len(qa_items),
+            'success': True
+        }
+        self.logger.info("Streamed analysis complete: %d tasks, %d Q&A items", len(tasks), len(qa_items))
+        self._cache_service.cache_transcript_analysis(transcript, context, result)
+        yield {'event': 'complete', 'data': result}
+    
+    def _extract(self, transcript: str, context: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Extract tasks and Q&A in one pass, or chunk by chunk when configured."""
+        if self.config.chunked_transcript_analysis:
+            return self._extract_chunked(transcript, context)
+        return self._call_ai(self.ai_service.parse_transcript_and_questions, transcript, context)
+    
+    def _call_ai(self, method, *args):
+        """Call an AI service method once a model call slot is free."""
+        with self._ai_slots:
+            return method(*args)
+    
+    def _extract_chunked(self, transcript: str, context: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Extract tasks and Q&A chunk by chunk so unchanged chunks are reused.
+        
+        Each chunk is a separate AI call, so the AI response cache is keyed
+        per chunk and re-submitting an edited transcript only sends the
+        chunks that changed. Results are merged in order and de-duplicated.
+        Chunks skip the iterative fallback; it runs at most once, on the whole
+        transcript, when the merged result has too few tasks.
+        """
+        chunks = self._split_transcript_chunks(transcript)
+        if len(chunks) == 1:
+            return self._call_ai(self.ai_service.parse_transcript_and_questions, transcript, context)
+        
+        self.logger.info("Analyzing transcript in %d chunks", len(chunks))
+        max_workers = max(1, min(len(chunks), self.config.ollama.max_concurrent_requests))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            chunk_results = list(pool.map(
+                lambda chunk: self._call_ai(self.ai_service.parse_transcript_chunk, chunk, context), chunks
+            ))
+        
+        tasks: Dict[str, Dict[str, Any]] = {}
+        qa_items: Dict[str, Dict[str, Any]] = {}
+        for chunk_tasks, chunk_qa in chunk_results:
+            for task in chunk_tasks:
+                tasks.setdefault(task.get('summary', '').strip().lower(), task)
+            for qa in chunk_qa:
+                qa_items.setdefault(qa.get('question', '').strip().lower(), qa)
+        
+        merged_tasks = list(tasks.values())
+        if len(merged_tasks) <= 1:
+            self.logger.info("Trying iterative extraction for more tasks")
+            iterative_tasks = self._call_ai(self.ai_service.extract_tasks_iteratively, transcript, context)
+            if len(iterative_tasks) > len(merged_tasks):
+                merged_tasks = iterative_tasks
+        
+        return (merged_tasks[:self.config.max_tasks_per_transcript],
+                list(qa_items.values())[:self.config.max_questions_per_transcript])
+    
+    def _split_transcript_chunks(self, transcript: str) -> List[str]:
+        """Split transcript into content-defined, line-aligned chunks."""
+        chunks = []
+        current: List[str] = []
+        size = 0
+        
+        for line in transcript.splitlines(keepends=True):
+            current.append(line)
+            size += len(line)
+            if size >= TRANSCRIPT_CHUNK_MAX_CHARS or (
+                size >= TRANSCRIPT_CHUNK_MIN_CHARS
+                and not zlib.crc32(line.encode('utf-8')) & TRANSCRIPT_CHUNK_BOUNDARY_MASK
+            ):
+                chunks.append(''.join(current))
+                current, size = [], 0
+        
+        if current:
+            # Fold a short tail into the previous chunk rather than sending it alone
+            if chunks and size < TRANSCRIPT_CHUNK_MIN_CHARS:
+                chunks[-1] += ''.join(current)
+            else:
+                chunks.append(''.join(current))
+        
+        return [chunk for chunk in chunks if chunk.strip()] or [transcript]
+    
+    def analyze_transcripts_batch(self, items: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Analyze several transcripts concurrently.
+        
+        Each transcript goes through analyze_transcript, so results are cached
+        individually and cached entries skip the model entirely. Model calls,
+        including those for individual chunks, share one limit of
+        ollama.max_concurrent_requests in flight at once.
+        
+        Args:
+            items: List of (transcript, context) pairs
+            
+        Returns:
+            One result dictionary per item, in input order. Items that fail
+            get success False and an error message instead of raising.
+        """
+        if not items:
+            return []
+        
+        def analyze(item: Tuple[str, str]) -> Dict[str, Any]:
+            transcript, context = item
+            is_valid, error_msg = self.validate_transcript(transcript)
+            if not is_valid:
+                return {'success': False, 'error': error_msg}
+            try:
+                return self.analyze_transcript(transcript, context)
+            except (TranscriptError, AIServiceError) as e:
+                return {'success': False, 'error': str(e)}
+        
+        self.logger.info("Starting batch analysis of %d transcripts", len(items))
+        max_workers = max(1, min(len(items), self.config.ollama.max_concurrent_requests))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(analyze, items))
+    
     def extract_tasks_only(self, transcript: str, context: str = "") -> List[Dict[str, Any]]:
         """
         Extract only tasks from transcript.
@@ -118,9 +308,8 @@ class TranscriptAnalysisService(LoggerMixin):
         if len(transcript) > self.config.max_transcript_length:
             return False, f"Transcript too long (max {self.config.max_transcript_length} characters)"
         
-        # Basic content validation
-        word_count = len(transcript.split())
-        if word_count < 10:
+        # Basic content validation; only split far enough to know there are 10 words
+        if len(transcript.split(None, 9)) < 10:
             return False, "Transcript too short (minimum 10 words)"
         
         return True, ""
@@ -129,24 +318,26 @@ class TranscriptAnalysisService(LoggerMixin):
         """
         Get status of the transcript analysis service.
 
+        The result is reused for SERVICE_STATUS_TTL seconds so status polling
+        doesn't probe the AI service on every request.
+
         Returns:
             Dictionary with service status information
         """
-        ai_available = self.ai_service.test_connection()
+        checked_at, status = self._status_cache
+        if status is not None and time.monotonic() - checked_at < SERVICE_STATUS_TTL:
+            return dict(status)
 
-        # Check JIRA configuration
-        jira_configured = all([
-            self.config.jira.base_url,
-            self.config.jira.username,
-            self.config.jira.api_token
-        ])
+        ai_available = self.ai_service.test_connection()
 
-        return {
+        status = {
             'ai_service_available': ai_available,
             'ai_service_type': self.ai_service.__class__.__name__,
             'max_tasks': self.config.max_tasks_per_transcript,
             'max_questions': self.config.max_questions_per_transcript,
             'max_transcript_length': self.config.max_transcript_length,
-            'jira_configured': jira_configured,
-            'mcp_features_available': jira_configured
-        }
\ No newline at end of file
+            'jira_configured': self._jira_configured,
+            'mcp_features_available': self._jira_configured
+        }
+        self._status_cache = (time.monotonic(), status)
+        return dict(status)
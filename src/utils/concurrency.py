@@ -0,0 +1,157 @@
+"""Async concurrency helpers for coalescing and pacing outbound API calls."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple
+
+
+class AsyncBatcher:
+    """
+    Collect submissions for a short window and process each key's batch in one call.
+
+    Callers await `submit(key, item)` and get back their own result. Items queued
+    under the same key within `window` seconds (or until `max_batch` items
+    arrive) are handed to `handler(key, items)` together, which must return one
+    result per item in the same order.
+
+    Batches never span event loops: a batcher shared by threads that each run
+    their own loop batches per loop, so no caller waits on another loop's future.
+    """
+
+    def __init__(self, handler: Callable[[Hashable, List[Any]], Awaitable[List[Any]]],
+                 window: float = 0.01, max_batch: int = 20):
+        """
+        Initialize the batcher.
+
+        Args:
+            handler: Coroutine function processing a batch of items for one key
+            window: Seconds to wait for more items before flushing a batch
+            max_batch: Flush immediately once this many items are queued
+        """
+        self._handler = handler
+        self.window = window
+        self.max_batch = max_batch
+        # Pending items and flush timers are keyed by (event loop, key)
+        self._pending: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], List[Tuple[Any, asyncio.Future]]] = {}
+        self._timers: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self._tasks: set = set()
+
+    async def submit(self, key: Hashable, item: Any) -> Any:
+        """Queue an item under key and wait for its result."""
+        loop = asyncio.get_running_loop()
+        slot = (loop, key)
+        future = loop.create_future()
+        batch = self._pending.setdefault(slot, [])
+        batch.append((item, future))
+
+        if len(batch) >= self.max_batch:
+            timer = self._timers.pop(slot, None)
+            if timer is not None:
+                timer.cancel()
+            self._spawn(self._process(key, self._pending.pop(slot)))
+        elif slot not in self._timers:
+            self._timers[slot] = self._spawn(self._flush_after_window(slot))
+
+        return await future
+
+    def _spawn(self, coro) -> asyncio.Task:
+        # Keep a reference so pending batches aren't garbage collected mid-flight
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _flush_after_window(self, slot: Tuple[asyncio.AbstractEventLoop, Hashable]) -> None:
+        batch: List[Tuple[Any, asyncio.Future]] = []
+        flushed = False
+        try:
+            await asyncio.sleep(self.window)
+            flushed = True
+        finally:
+            # Runs on cancellation too (e.g. loop teardown) so no stale timer is left
+            # behind; a full batch may already have replaced this timer with a new one
+            if self._timers.get(slot) is asyncio.current_task():
+                del self._timers[slot]
+                batch = self._pending.pop(slot, None) or []
+                if not flushed:
+                    for _, future in batch:
+                        future.cancel()
+
+        if flushed and batch:
+            await self._process(slot[1], batch)
+
+    async def _process(self, key: Hashable, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = await self._handler(key, [item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch handler returned {len(results)} results for {len(batch)} items"
+                )
+        except BaseException as e:
+            # Every caller must be resolved, whatever went wrong
+            for _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket rate limiter for async callers.
+
+    Tokens refill continuously at `rate` per second up to `capacity`; each
+    acquire takes one token, waiting for a refill when the bucket is empty.
+    Usable as `async with bucket:`.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held, i.e. the allowed burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        # A thread lock, not an asyncio one, so the bucket can be shared by threads
+        # running their own event loops; it is never held across an await
+        self._lock = threading.Lock()
+        self.waits = 0
+
+    async def acquire(self) -> None:
+        """Take one token, waiting until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                self.waits += 1
+                delay = (1 - self._tokens) / self.rate
+
+            await asyncio.sleep(delay)
+
+    async def __aenter__(self) -> "AsyncTokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
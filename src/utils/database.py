@@ -1,18 +1,98 @@
 """Database schema utilities for JIRA integration tables."""
 
+import atexit
 import sqlite3
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import queue
+import secrets
+import threading
+from concurrent.futures import Future
+from itertools import count
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timezone
 from pathlib import Path
 from contextlib import contextmanager
-from dataclasses import asdict
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTANDARD_AVAILABLE = True
+except ImportError:
+    ZSTANDARD_AVAILABLE = False
 
 from ..config.settings import get_config
+from ..exceptions import DatabaseError
 
 logger = logging.getLogger(__name__)
 
+# Per-connection tuning applied once when a pooled connection is opened;
+# synchronous=NORMAL is durable across application crashes in WAL mode
+CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA wal_autocheckpoint = 1000",
+)
+
+# Latest migration; init_schema brings every database up to it
+SCHEMA_VERSION = 4
+
+# zstd level for compressed JSON columns; level 3 is fast and shrinks JSON several-fold
+JSON_BLOB_COMPRESSION_LEVEL = 3
+
+# Most queued writes the writer thread applies under a single commit
+WRITE_BATCH_SIZE = 64
+
+# Shared by the queued single-metric path and the bulk insert path
+PERFORMANCE_METRIC_INSERT = """
+    INSERT INTO performance_metrics
+    (id, operation_type, connection_id, project_key, execution_time_ms,
+     success, error_type, metadata, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# SQLite's CURRENT_TIMESTAMP format, used to stamp queued metrics when recorded
+SQLITE_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a JSON column value, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(value)
+
+
+def _loads(raw: Union[str, bytes]) -> Any:
+    """Deserialize a JSON column value written by _dumps."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _pack_json(value: Any) -> Optional[bytes]:
+    """Serialize and zstd-compress a JSON column value, or None when zstandard is unavailable."""
+    if not ZSTANDARD_AVAILABLE:
+        return None
+    raw = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS) if ORJSON_AVAILABLE else json.dumps(value).encode('utf-8')
+    return zstandard.ZstdCompressor(level=JSON_BLOB_COMPRESSION_LEVEL).compress(raw)
+
+
+def _unpack_json(blob: bytes) -> Any:
+    """Decompress and deserialize a value written by _pack_json."""
+    if not ZSTANDARD_AVAILABLE:
+        raise DatabaseError("zstandard is required to read compressed JSON columns",
+                            table_name="project_contexts", operation="read")
+    return _loads(zstandard.ZstdDecompressor().decompress(blob))
+
 
 class DatabaseManager:
     """Database manager for JIRA integration schema."""
@@ -30,32 +110,168 @@ class DatabaseManager:
         self.db_path = db_path
         self.connection_pool_size = 5
         self._initialized = False
+        self.schema_version = 0
+
+        # Metric ids are a per-instance random prefix plus a counter, unique across restarts
+        self._metric_id_prefix = secrets.token_hex(4)
+        self._metric_seq = count()
+
+        # Pooled connections are opened on first demand, up to the pool size, and
+        # then reused so the hot path never reconnects
+        self._pool: queue.Queue = queue.Queue(maxsize=self.connection_pool_size)
+        self._pool_created = 0
+        self._pool_lock = threading.Lock()
 
         # Initialize schema
         self.init_schema()
 
+        # Queued mutations are committed in batches by a writer thread, started on
+        # the first queued write
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._closed = False
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """Open a connection configured for sharing through the pool."""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=30.0,
+            check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _acquire_connection(self) -> sqlite3.Connection:
+        """Take an idle pooled connection, opening one if the pool isn't full yet."""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._pool_lock:
+            can_open = self._pool_created < self.connection_pool_size
+            if can_open:
+                self._pool_created += 1
+        if can_open:
+            try:
+                return self._create_connection()
+            except Exception:
+                with self._pool_lock:
+                    self._pool_created -= 1
+                raise
+        return self._pool.get()
+
     @contextmanager
     def get_connection(self):
-        """Get database connection with proper error handling."""
-        conn = None
+        """Borrow a pooled database connection with proper error handling."""
+        conn = self._acquire_connection()
         try:
-            conn = sqlite3.connect(
-                self.db_path,
-                timeout=30.0,
-                check_same_thread=False
-            )
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute("PRAGMA journal_mode = WAL")
             yield conn
         except Exception as e:
-            if conn:
-                conn.rollback()
+            conn.rollback()
             logger.error(f"Database connection error: {e}")
             raise
         finally:
-            if conn:
-                conn.close()
+            # Never hand the next borrower someone else's open transaction
+            if conn.in_transaction:
+                conn.rollback()
+            self._pool.put(conn)
+
+    def _enqueue_write(self, sql: str, params: Tuple) -> Future:
+        """
+        Queue a statement for the writer thread, starting it if needed.
+
+        Returns a future that resolves once the statement is committed, or
+        raises the statement's database error; callers that don't need the
+        outcome can ignore it.
+        """
+        future: Future = Future()
+        with self._writer_lock:
+            if not self._closed:
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._writer_loop, name="db-writer", daemon=True)
+                    self._writer.start()
+                self._write_queue.put((sql, params, future))
+                return future
+
+        # The writer was stopped by close(); apply the write on the caller's thread
+        try:
+            with self.get_connection() as conn:
+                conn.execute(sql, params)
+                conn.commit()
+            future.set_result(None)
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _writer_loop(self) -> None:
+        """Apply queued writes in order, committing each drained batch once."""
+        while True:
+            batch = [self._write_queue.get()]
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            statements = [item for item in batch if item is not None]
+            applied = []
+            try:
+                if statements:
+                    with self.get_connection() as conn:
+                        for sql, params, future in statements:
+                            try:
+                                conn.execute(sql, params)
+                            except sqlite3.Error as e:
+                                logger.warning(f"Queued database write failed: {e}")
+                                future.set_exception(e)
+                            else:
+                                applied.append(future)
+                        conn.commit()
+                for future in applied:
+                    future.set_result(None)
+            except Exception as e:
+                logger.error(f"Database writer failed to commit {len(applied)} writes: {e}")
+                for future in applied:
+                    future.set_exception(e)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+
+            if stop:
+                return
+
+    def flush_writes(self) -> None:
+        """Block until every queued write has been committed."""
+        if self._writer is not None and self._writer.is_alive():
+            self._write_queue.join()
+
+    def close(self) -> None:
+        """Commit queued writes and close all idle pooled connections, refreshing planner statistics first."""
+        with self._writer_lock:
+            # Later writes run on the caller's thread rather than restarting the writer
+            self._closed = True
+            writer = self._writer
+            if writer is not None and writer.is_alive():
+                self._write_queue.put(None)
+        if writer is not None:
+            writer.join()
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.debug(f"PRAGMA optimize failed: {e}")
+            conn.close()
+            with self._pool_lock:
+                self._pool_created -= 1
 
     def init_schema(self) -> None:
         """Initialize database schema for JIRA integration."""
@@ -80,10 +296,15 @@ class DatabaseManager:
                 self._apply_migration_v1(conn)
             if current_version < 2:
                 self._apply_migration_v2(conn)
+            if current_version < 3:
+                self._apply_migration_v3(conn)
+            if current_version < 4:
+                self._apply_migration_v4(conn)
 
             conn.commit()
             self._initialized = True
-            logger.info(f"Database schema initialized at version {self._get_schema_version(conn)}")
+            self.schema_version = max(current_version, SCHEMA_VERSION)
+            logger.info(f"Database schema initialized at version {self.schema_version}")
 
     def _get_schema_version(self, conn: sqlite3.Connection) -> int:
         """Get current schema version."""
@@ -260,6 +481,38 @@ class DatabaseManager:
             "INSERT INTO schema_version (version, description) VALUES (2, 'Performance metrics and user preferences')"
         )
 
+    def _apply_migration_v3(self, conn: sqlite3.Connection) -> None:
+        """Apply schema migration v3 - Composite indexes for hot lookups."""
+        logger.info("Applying database migration v3...")
+
+        # Stats filter by operation type over a time window
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_perf_op_ts ON performance_metrics(operation_type, timestamp DESC)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_enhanced_tasks_conn_proj ON enhanced_tasks(connection_id, project_key, creation_status)")
+
+        # Leading columns of the composite index and of UNIQUE(connection_id, project_key)
+        conn.execute("DROP INDEX IF EXISTS idx_performance_metrics_operation")
+        conn.execute("DROP INDEX IF EXISTS idx_project_contexts_connection")
+
+        # Record migration
+        conn.execute(
+            "INSERT INTO schema_version (version, description) VALUES (3, 'Composite lookup indexes')"
+        )
+
+    def _apply_migration_v4(self, conn: sqlite3.Connection) -> None:
+        """Apply schema migration v4 - Compressed project context payloads."""
+        logger.info("Applying database migration v4...")
+
+        try:
+            conn.execute("ALTER TABLE project_contexts ADD COLUMN context_data_blob BLOB")
+        except sqlite3.OperationalError:
+            # Column already exists
+            pass
+
+        # Record migration
+        conn.execute(
+            "INSERT INTO schema_version (version, description) VALUES (4, 'Compressed project context payloads')"
+        )
+
     # CRUD operations for JIRA connections
     def save_jira_connection(self, connection_data: Dict[str, Any]) -> str:
         """Save JIRA connection to database."""
@@ -274,7 +527,7 @@ class DatabaseManager:
                 connection_data['base_url'],
                 connection_data['encrypted_credentials'],
                 connection_data.get('is_active', True),
-                json.dumps(connection_data.get('metadata', {}))
+                _dumps(connection_data.get('metadata', {}))
             ))
             conn.commit()
             logger.info(f"Saved JIRA connection: {connection_data['name']}")
@@ -282,6 +535,7 @@ class DatabaseManager:
 
     def get_jira_connection(self, connection_id: str) -> Optional[Dict[str, Any]]:
         """Get JIRA connection by ID."""
+        self.flush_writes()
         with self.get_connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM jira_connections WHERE id = ?
@@ -297,7 +551,7 @@ class DatabaseManager:
                     'is_active': bool(row['is_active']),
                     'last_validated': row['last_validated'],
                     'validation_status': row['validation_status'],
-                    'metadata': json.loads(row['connection_metadata'] or '{}'),
+                    'metadata': _loads(row['connection_metadata'] or '{}'),
                     'created_at': row['created_at'],
                     'updated_at': row['updated_at']
                 }
@@ -305,6 +559,7 @@ class DatabaseManager:
 
     def list_active_jira_connections(self) -> List[Dict[str, Any]]:
         """List all active JIRA connections."""
+        self.flush_writes()
         with self.get_connection() as conn:
             cursor = conn.execute("""
                 SELECT id, name, base_url, validation_status, last_validated, created_at
@@ -315,39 +570,41 @@ class DatabaseManager:
 
             return [dict(row) for row in cursor.fetchall()]
 
-    def update_connection_validation(self, connection_id: str, status: str, last_validated: Optional[datetime] = None) -> None:
-        """Update connection validation status."""
+    def update_connection_validation(self, connection_id: str, status: str, last_validated: Optional[datetime] = None) -> Future:
+        """Update connection validation status; the write is queued and its future returned."""
         if last_validated is None:
             last_validated = datetime.now(timezone.utc)
 
-        with self.get_connection() as conn:
-            conn.execute("""
-                UPDATE jira_connections
-                SET validation_status = ?, last_validated = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (status, last_validated.isoformat(), connection_id))
-            conn.commit()
+        return self._enqueue_write("""
+            UPDATE jira_connections
+            SET validation_status = ?, last_validated = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """, (status, last_validated.isoformat(), connection_id))
 
     # CRUD operations for project contexts
     def save_project_context(self, context_data: Dict[str, Any]) -> str:
-        """Save project context to database."""
+        """Save project context to database, compressing the context payload when possible."""
+        context_blob = _pack_json(context_data['context_data'])
+
         with self.get_connection() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO project_contexts
-                (id, connection_id, project_key, project_name, context_data,
+                (id, connection_id, project_key, project_name, context_data, context_data_blob,
                  cached_sprints, cached_epics, cached_components, cached_issue_types,
                  cache_expires_at, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
             """, (
                 context_data['id'],
                 context_data['connection_id'],
                 context_data['project_key'],
                 context_data.get('project_name'),
-                json.dumps(context_data['context_data']),
-                json.dumps(context_data.get('cached_sprints', [])),
-                json.dumps(context_data.get('cached_epics', [])),
-                json.dumps(context_data.get('cached_components', [])),
-                json.dumps(context_data.get('cached_issue_types', [])),
+                # The TEXT column is NOT NULL; leave it empty when the blob holds the payload
+                '' if context_blob is not None else _dumps(context_data['context_data']),
+                context_blob,
+                _dumps(context_data.get('cached_sprints', [])),
+                _dumps(context_data.get('cached_epics', [])),
+                _dumps(context_data.get('cached_components', [])),
+                _dumps(context_data.get('cached_issue_types', [])),
                 context_data.get('cache_expires_at')
             ))
             conn.commit()
@@ -369,11 +626,13 @@ class DatabaseManager:
                     'connection_id': row['connection_id'],
                     'project_key': row['project_key'],
                     'project_name': row['project_name'],
-                    'context_data': json.loads(row['context_data']),
-                    'cached_sprints': json.loads(row['cached_sprints'] or '[]'),
-                    'cached_epics': json.loads(row['cached_epics'] or '[]'),
-                    'cached_components': json.loads(row['cached_components'] or '[]'),
-                    'cached_issue_types': json.loads(row['cached_issue_types'] or '[]'),
+                    'context_data': (_unpack_json(row['context_data_blob'])
+                                     if row['context_data_blob'] is not None
+                                     else _loads(row['context_data'])),
+                    'cached_sprints': _loads(row['cached_sprints'] or '[]'),
+                    'cached_epics': _loads(row['cached_epics'] or '[]'),
+                    'cached_components': _loads(row['cached_components'] or '[]'),
+                    'cached_issue_types': _loads(row['cached_issue_types'] or '[]'),
                     'last_updated': row['last_updated'],
                     'cache_expires_at': row['cache_expires_at']
                 }
@@ -382,6 +641,7 @@ class DatabaseManager:
     # CRUD operations for enhanced tasks
     def save_enhanced_task(self, task_data: Dict[str, Any]) -> str:
         """Save enhanced task to database."""
+        # Written synchronously so a foreign key violation reaches the caller
         with self.get_connection() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO enhanced_tasks
@@ -390,10 +650,10 @@ class DatabaseManager:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 task_data['id'],
-                json.dumps(task_data['original_task_data']),
+                _dumps(task_data['original_task_data']),
                 task_data['project_key'],
                 task_data.get('connection_id'),
-                json.dumps(task_data.get('suggestions', {})),
+                _dumps(task_data.get('suggestions', {})),
                 task_data.get('project_context_score', 0.0),
                 task_data.get('confidence_score', 0.0),
                 task_data.get('extracted_from', ''),
@@ -403,55 +663,50 @@ class DatabaseManager:
             logger.info(f"Saved enhanced task: {task_data['id']}")
             return task_data['id']
 
-    def update_task_jira_info(self, task_id: str, jira_issue_key: str, jira_url: str, status: str = 'created') -> None:
-        """Update task with JIRA issue information."""
-        with self.get_connection() as conn:
-            conn.execute("""
-                UPDATE enhanced_tasks
-                SET jira_issue_key = ?, jira_url = ?, creation_status = ?, processed_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (jira_issue_key, jira_url, status, task_id))
-            conn.commit()
+    def update_task_jira_info(self, task_id: str, jira_issue_key: str, jira_url: str, status: str = 'created') -> Future:
+        """Update task with JIRA issue information; the write is queued and its future returned."""
+        return self._enqueue_write("""
+            UPDATE enhanced_tasks
+            SET jira_issue_key = ?, jira_url = ?, creation_status = ?, processed_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """, (jira_issue_key, jira_url, status, task_id))
 
     # Performance tracking
     def record_performance_metric(self, operation_type: str, execution_time_ms: int,
                                  success: bool, connection_id: Optional[str] = None,
                                  project_key: Optional[str] = None, error_type: Optional[str] = None,
-                                 metadata: Optional[Dict[str, Any]] = None) -> None:
-        """Record performance metric."""
-        metric_id = f"{operation_type}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
-
-        with self.get_connection() as conn:
-            conn.execute("""
-                INSERT INTO performance_metrics
-                (id, operation_type, connection_id, project_key, execution_time_ms,
-                 success, error_type, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                metric_id, operation_type, connection_id, project_key, execution_time_ms,
-                success, error_type, json.dumps(metadata or {})
-            ))
-            conn.commit()
+                                 metadata: Optional[Dict[str, Any]] = None) -> Future:
+        """Record performance metric; the write is queued and its future returned."""
+        metric_id = f"{operation_type}_{self._metric_id_prefix}_{next(self._metric_seq)}"
+        timestamp = datetime.now(timezone.utc).strftime(SQLITE_TIMESTAMP_FORMAT)
+        return self._enqueue_write(PERFORMANCE_METRIC_INSERT, (
+            metric_id, operation_type, connection_id, project_key, execution_time_ms,
+            success, error_type, _dumps(metadata or {}), timestamp
+        ))
 
     def get_performance_stats(self, operation_type: Optional[str] = None,
                             hours: int = 24) -> Dict[str, Any]:
         """Get performance statistics."""
+        self.flush_writes()
+        query = """
+            SELECT
+                COUNT(*) as total_operations,
+                AVG(execution_time_ms) as avg_time_ms,
+                MIN(execution_time_ms) as min_time_ms,
+                MAX(execution_time_ms) as max_time_ms,
+                SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as success_count,
+                SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as error_count
+            FROM performance_metrics
+            WHERE timestamp >= datetime('now', ?)
+        """
+        params: Tuple = (f'-{int(hours)} hours',)
+        if operation_type:
+            # A plain equality lets SQLite range-scan idx_perf_op_ts
+            query += " AND operation_type = ?"
+            params += (operation_type,)
+
         with self.get_connection() as conn:
-            where_clause = "WHERE timestamp >= datetime('now', '-{} hours')".format(hours)
-            if operation_type:
-                where_clause += f" AND operation_type = '{operation_type}'"
-
-            cursor = conn.execute(f"""
-                SELECT
-                    COUNT(*) as total_operations,
-                    AVG(execution_time_ms) as avg_time_ms,
-                    MIN(execution_time_ms) as min_time_ms,
-                    MAX(execution_time_ms) as max_time_ms,
-                    SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as success_count,
-                    SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as error_count
-                FROM performance_metrics
-                {where_clause}
-            """)
+            cursor = conn.execute(query, params)
 
             result = cursor.fetchone()
             if result:
@@ -480,21 +735,22 @@ class DatabaseManager:
 
     def cleanup_old_data(self, days: int = 30) -> Dict[str, int]:
         """Clean up old data beyond specified days."""
+        self.flush_writes()
         with self.get_connection() as conn:
-            cutoff_date = f"datetime('now', '-{days} days')"
+            cutoff = f'-{int(days)} days'
 
             # Clean performance metrics
-            cursor = conn.execute(f"""
+            cursor = conn.execute("""
                 DELETE FROM performance_metrics
-                WHERE timestamp < {cutoff_date}
-            """)
+                WHERE timestamp < datetime('now', ?)
+            """, (cutoff,))
             performance_deleted = cursor.rowcount
 
             # Clean completed sessions
-            cursor = conn.execute(f"""
+            cursor = conn.execute("""
                 DELETE FROM processing_sessions
-                WHERE completed_at IS NOT NULL AND completed_at < {cutoff_date}
-            """)
+                WHERE completed_at IS NOT NULL AND completed_at < datetime('now', ?)
+            """, (cutoff,))
             sessions_deleted = cursor.rowcount
 
             conn.commit()
@@ -507,6 +763,7 @@ class DatabaseManager:
 
     def get_database_stats(self) -> Dict[str, Any]:
         """Get database statistics."""
+        self.flush_writes()
         with self.get_connection() as conn:
             stats = {}
 
@@ -514,29 +771,42 @@ class DatabaseManager:
             tables = ['jira_connections', 'project_contexts', 'enhanced_tasks',
                      'duplicate_analyses', 'performance_metrics', 'processing_sessions']
 
-            for table in tables:
-                try:
-                    cursor = conn.execute(f"SELECT COUNT(*) FROM {table}")
-                    stats[f"{table}_count"] = cursor.fetchone()[0]
-                except sqlite3.OperationalError:
-                    stats[f"{table}_count"] = 0
+            try:
+                cursor = conn.execute(" UNION ALL ".join(
+                    f"SELECT '{table}', COUNT(*) FROM {table}" for table in tables
+                ))
+                stats.update((f"{table}_count", row_count) for table, row_count in cursor.fetchall())
+            except sqlite3.OperationalError:
+                # A table is missing; count the rest one by one
+                for table in tables:
+                    try:
+                        cursor = conn.execute(f"SELECT COUNT(*) FROM {table}")
+                        stats[f"{table}_count"] = cursor.fetchone()[0]
+                    except sqlite3.OperationalError:
+                        stats[f"{table}_count"] = 0
 
             # Database file size
             stats['db_file_size_bytes'] = Path(self.db_path).stat().st_size if Path(self.db_path).exists() else 0
             stats['db_file_size_mb'] = round(stats['db_file_size_bytes'] / (1024 * 1024), 2)
 
             # Schema version
-            stats['schema_version'] = self._get_schema_version(conn)
+            stats['schema_version'] = self.schema_version
 
             return stats
 
 
 # Global database manager instance
 _db_manager = None
+_db_manager_lock = threading.Lock()
 
 def get_database_manager() -> DatabaseManager:
-    """Get global database manager instance."""
+    """Get global database manager instance, creating it exactly once."""
     global _db_manager
     if _db_manager is None:
-        _db_manager = DatabaseManager()
-    return _db_manager
\ No newline at end of file
+        with _db_manager_lock:
+            if _db_manager is None:
+                _db_manager = DatabaseManager()
+                # The writer thread is a daemon, so drain its queue before the
+                # interpreter exits or queued writes would be lost
+                atexit.register(_db_manager.close)
+    return _db_manager
@@ -1,12 +1,84 @@
 """Secure credential encryption utilities for JIRA API tokens."""
 
 import os
+import re
+import json
 import base64
+import logging
+from functools import lru_cache
 from typing import Optional
 from cryptography.fernet import Fernet
+from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+try:
+    from rfernet import Fernet as RFernet
+    RFERNET_AVAILABLE = True
+except ImportError:
+    RFERNET_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# AES-NI capability bit in the first word of OpenSSL's OPENSSL_ia32cap mask
+OPENSSL_AESNI_CAPABILITY_BIT = 1 << 57
+
+# Atlassian API tokens are long runs of base64/url-safe characters
+TOKEN_FORMAT_PATTERN = re.compile(r'^[A-Za-z0-9+/=_-]{20,}$')
+
+# Salt used when deriving keys from a password without an explicit one
+DEFAULT_KDF_SALT = b"ai_transcript_to_jira_salt_2024"
+
+# PBKDF2-HMAC-SHA256 rounds for password-derived keys
+PBKDF2_ITERATIONS = 100000
+
+# Derived keys kept in memory; each repeat derivation would otherwise cost ~50ms.
+# The cache also keeps the passwords themselves for the life of the process.
+DERIVED_KEY_CACHE_SIZE = 16
+
+
+def _use_rfernet() -> bool:
+    """Whether the Rust Fernet implementation is installed and enabled with USE_RFERNET=1."""
+    return RFERNET_AVAILABLE and os.getenv('USE_RFERNET') == '1'
+
+
+def _create_fernet(key: bytes):
+    """Build the active Fernet implementation; both produce interchangeable tokens."""
+    if _use_rfernet():
+        return RFernet(key.decode())
+    return Fernet(key)
+
+
+@lru_cache(maxsize=1)
+def _check_crypto_acceleration() -> None:
+    """Log the OpenSSL build once and warn if AES-NI has been masked off."""
+    logger.debug(f"Credential encryption using {default_backend().openssl_version_text()}")
+
+    # "~0x..." clears capability bits; AES-NI off means table-based AES for every token
+    capability_mask = os.getenv('OPENSSL_ia32cap', '').split(':')[0].strip()
+    if capability_mask.startswith('~'):
+        try:
+            cleared = int(capability_mask[1:], 0)
+        except ValueError:
+            return
+        if cleared & OPENSSL_AESNI_CAPABILITY_BIT:
+            logger.warning(
+                "OPENSSL_ia32cap disables AES-NI; credential encryption will use "
+                "software AES and run several times slower"
+            )
+
+
+@lru_cache(maxsize=DERIVED_KEY_CACHE_SIZE)
+def _derive_pbkdf2_key(password: str, salt: bytes) -> bytes:
+    """Derive a Fernet key with PBKDF2-HMAC-SHA256."""
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=PBKDF2_ITERATIONS,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(password.encode()))
+
 
 class CredentialEncryption:
     """Secure encryption/decryption for JIRA credentials."""
@@ -18,7 +90,8 @@ class CredentialEncryption:
         else:
             self._key = self._get_or_generate_key()
 
-        self._fernet = Fernet(self._key)
+        self._fernet = _create_fernet(self._key)
+        _check_crypto_acceleration()
 
     def _get_or_generate_key(self) -> bytes:
         """Get encryption key from environment or generate new one."""
@@ -28,7 +101,7 @@ class CredentialEncryption:
             try:
                 # Validate key format
                 key_bytes = env_key.encode()
-                Fernet(key_bytes)  # This will raise an exception if invalid
+                _create_fernet(key_bytes)  # This will raise an exception if invalid
                 return key_bytes
             except Exception:
                 raise ValueError(
@@ -64,13 +137,11 @@ class CredentialEncryption:
 
     def encrypt_credential_dict(self, credentials: dict) -> bytes:
         """Encrypt a dictionary of credentials."""
-        import json
         credentials_json = json.dumps(credentials)
         return self._fernet.encrypt(credentials_json.encode())
 
     def decrypt_credential_dict(self, encrypted_credentials: bytes) -> dict:
         """Decrypt a dictionary of credentials."""
-        import json
         try:
             credentials_json = self._fernet.decrypt(encrypted_credentials).decode()
             return json.loads(credentials_json)
@@ -84,9 +155,7 @@ class CredentialEncryption:
 
         # Basic format validation for Atlassian API tokens
         # They are typically alphanumeric with some special characters
-        import re
-        pattern = r'^[A-Za-z0-9+/=_-]{20,}$'
-        return bool(re.match(pattern, token.strip()))
+        return bool(TOKEN_FORMAT_PATTERN.match(token.strip()))
 
     @staticmethod
     def generate_key() -> str:
@@ -95,18 +164,26 @@ class CredentialEncryption:
 
     @staticmethod
     def derive_key_from_password(password: str, salt: Optional[bytes] = None) -> bytes:
-        """Derive encryption key from password (alternative to random key)."""
-        if salt is None:
-            salt = b"ai_transcript_to_jira_salt_2024"  # Use consistent salt
+        """
+        Derive encryption key from password (alternative to random key).
+
+        Repeat derivations are served from an in-process cache, which holds the
+        plaintext password until it is evicted or the process exits. Only call
+        this from trusted, in-process code; don't pass passwords that must not
+        outlive the call.
+        """
+        return _derive_pbkdf2_key(password, salt if salt is not None else DEFAULT_KDF_SALT)
+
+
+@lru_cache(maxsize=4)
+def _shared_encryption(encryption_key: Optional[str]) -> CredentialEncryption:
+    """Process-wide CredentialEncryption per resolved key."""
+    return CredentialEncryption(encryption_key)
+
 
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-        return key
+def get_encryption(encryption_key: Optional[str] = None) -> CredentialEncryption:
+    """Get a shared CredentialEncryption for the given key, or ENCRYPTION_KEY from the environment."""
+    return _shared_encryption(encryption_key or os.getenv('ENCRYPTION_KEY'))
 
 
 class SecureCredentialManager:
@@ -114,7 +191,7 @@ class SecureCredentialManager:
 
     def __init__(self, encryption: Optional[CredentialEncryption] = None):
         """Initialize with encryption instance."""
-        self.encryption = encryption or CredentialEncryption()
+        self.encryption = encryption or get_encryption()
 
     def store_jira_credentials(self, username: str, api_token: str, base_url: str) -> bytes:
         """Store JIRA credentials securely."""
@@ -204,14 +281,14 @@ def generate_encryption_key() -> str:
 
 def encrypt_jira_token_cli(token: str, key: Optional[str] = None) -> str:
     """CLI utility to encrypt a JIRA token."""
-    encryption = CredentialEncryption(key)
+    encryption = get_encryption(key)
     encrypted_token = encryption.encrypt_token(token)
     return base64.b64encode(encrypted_token).decode()
 
 
 def decrypt_jira_token_cli(encrypted_token_b64: str, key: Optional[str] = None) -> str:
     """CLI utility to decrypt a JIRA token."""
-    encryption = CredentialEncryption(key)
+    encryption = get_encryption(key)
     encrypted_token = base64.b64decode(encrypted_token_b64.encode())
     return encryption.decrypt_token(encrypted_token)
 
@@ -0,0 +1,129 @@
+"""Unit tests for AI service."""
+
+import json
+import pytest
+from unittest.mock import Mock, patch
+
+from src.services.ai_service import OllamaService, _iter_json_stream_items
+from src.config import AppConfig
+from src.exceptions import AIServiceError
+
+
+def _fragments(text: str, size: int = 7):
+    """Split text into fixed-size fragments, like a streamed model response."""
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class TestJSONStreamItems:
+    """Test cases for the incremental JSON stream parser."""
+
+    TASKS = [
+        {'summary': 'Fix login', 'labels': ['auth', 'bug']},
+        {'summary': 'Write docs, then "review" them', 'description': '[draft] {notes}'}
+    ]
+
+    def test_top_level_array(self):
+        """Test array items are yielded across fragment boundaries."""
+        assert list(_iter_json_stream_items(_fragments(json.dumps(self.TASKS)))) == self.TASKS
+
+    def test_object_wrapping_array(self):
+        """Test a {"tasks": [...]} wrapper yields the tasks, not the wrapper."""
+        text = json.dumps({'tasks': self.TASKS})
+
+        assert list(_iter_json_stream_items(_fragments(text))) == self.TASKS
+
+    def test_single_object(self):
+        """Test a lone task object is yielded whole, including its list fields."""
+        text = json.dumps(self.TASKS[0])
+
+        assert list(_iter_json_stream_items(_fragments(text, size=3))) == [self.TASKS[0]]
+
+    def test_single_object_number_split_across_fragments(self):
+        """Test a number value isn't cut short at a fragment boundary."""
+        assert list(_iter_json_stream_items(['{"summary": "Fix", "points": 1', '3}'])) == [
+            {'summary': 'Fix', 'points': 13}
+        ]
+
+    def test_markdown_fence(self):
+        """Test a fenced array is parsed."""
+        text = "```json\n" + json.dumps(self.TASKS) + "\n```"
+
+        assert list(_iter_json_stream_items(_fragments(text))) == self.TASKS
+
+    def test_items_are_yielded_before_stream_ends(self):
+        """Test each item is available as soon as it is complete."""
+        def stream():
+            yield '[{"summary": "First"},'
+            raise AssertionError("read past the first item")
+
+        assert next(_iter_json_stream_items(stream())) == {'summary': 'First'}
+
+    def test_truncated_stream_keeps_complete_items(self):
+        """Test parsing stops quietly at a truncated item."""
+        text = '{"tasks": [{"summary": "First"}, {"summary": "Sec'
+
+        assert list(_iter_json_stream_items(_fragments(text))) == [{'summary': 'First'}]
+
+
+class TestOllamaServiceStream:
+    """Test cases for streamed task extraction."""
+
+    @pytest.fixture
+    def service(self):
+        """Create Ollama service with an always-missing response cache."""
+        service = OllamaService(AppConfig())
+        service._cache_service = Mock()
+        service._cache_service.get_ai_response.return_value = None
+        return service
+
+    def test_wrapped_stream_yields_tasks(self, service):
+        """Test tasks inside a wrapper object reach the caller."""
+        text = json.dumps({'tasks': [{'summary': 'Fix login'}, {'summary': 'Write docs'}]})
+
+        with patch.object(service, '_call_ollama_stream', return_value=_fragments(text)):
+            tasks = list(service.parse_transcript_stream("Alice: fix login and write docs"))
+
+        assert [task['summary'] for task in tasks] == ['Fix login', 'Write docs']
+
+    def test_empty_stream_falls_back_to_iterative_extraction(self, service):
+        """Test a stream with no usable tasks still returns the iterative result."""
+        fallback = [{'summary': 'Fix login'}]
+
+        with patch.object(service, '_call_ollama_stream', return_value=['{"result": "none"}']), \
+             patch.object(service, '_extract_tasks_iteratively', return_value=fallback) as iterative:
+            tasks = list(service.parse_transcript_stream("Alice: fix login"))
+
+        assert tasks == fallback
+        iterative.assert_called_once()
+
+
+class TestOllamaServiceCombined:
+    """Test cases for combined task and Q&A extraction."""
+
+    @pytest.fixture
+    def service(self):
+        """Create Ollama service."""
+        return OllamaService(AppConfig())
+
+    def test_unparseable_response_falls_back_to_separate_calls(self, service):
+        """Test a combined response that isn't valid JSON is retried as separate calls."""
+        tasks = [{'summary': 'Fix login'}]
+
+        with patch.object(service, '_call_ollama', return_value='not json'), \
+             patch.object(service, '_extract_tasks_single_call', return_value=tasks) as single, \
+             patch.object(service, 'extract_questions', return_value=[]) as questions:
+            result = service._extract_combined("Alice: fix login", "")
+
+        assert result == (tasks, [])
+        single.assert_called_once()
+        questions.assert_called_once()
+
+    def test_connection_error_is_not_retried(self, service):
+        """Test a failed Ollama call propagates without falling back to more calls."""
+        with patch.object(service, '_call_ollama', side_effect=AIServiceError("timed out")) as call, \
+             patch.object(service, '_extract_tasks_single_call') as single:
+            with pytest.raises(AIServiceError):
+                service._extract_combined("Alice: fix login", "")
+
+        call.assert_called_once()
+        single.assert_not_called()
@@ -1,11 +1,13 @@
 """Tests for the CacheService class."""
 
+import asyncio
+import threading
 import pytest
 import tempfile
 import shutil
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
-from src.services.cache_service import CacheService
+from src.services.cache_service import CacheService, AsyncTTLCache
 
 
 class TestCacheService:
@@ -240,6 +242,21 @@ class TestCacheService:
             memory_backends = [b for b in stats['backends'] if b['type'] == 'memory']
             assert len(memory_backends) == 1
     
+    def test_redis_values_round_trip(self):
+        """Test values written to Redis are serialized and read back intact."""
+        stored = {}
+        redis_client = MagicMock()
+        redis_client.setex.side_effect = lambda key, ttl, raw: stored.__setitem__(key, raw)
+        redis_client.get.side_effect = lambda key: stored.get(key)
+        self.cache_service._redis_client = redis_client
+        value = {'tasks': [{'summary': 'Test task', 'priority': 1}], 'counts': {1: 'one'}}
+
+        self.cache_service.set("redis_test", value)
+
+        assert self.cache_service.get("redis_test") == {
+            'tasks': [{'summary': 'Test task', 'priority': 1}], 'counts': {'1': 'one'}
+        }
+
     def test_cache_decorator_simulation(self):
         """Test the caching decorator concept."""
         # Simulate the cached_ai_response decorator behavior
@@ -259,3 +276,139 @@ class TestCacheService:
         # Second call - cache hit, should return cached value
         cached = self.cache_service.get_ai_response(transcript, context, response_type)
         assert cached == expected_response  # Cache hit
+
+
+class TestAsyncTTLCache:
+    """Test cases for AsyncTTLCache."""
+
+    def test_set_and_get(self):
+        """Test basic set/get and default on miss."""
+        cache = AsyncTTLCache(ttl=60)
+        cache.set('key', {'value': 1})
+
+        assert cache.get('key') == {'value': 1}
+        assert cache.get('missing', 'default') == 'default'
+
+    def test_expired_entries_are_dropped(self):
+        """Test entries past their TTL are treated as misses."""
+        cache = AsyncTTLCache(ttl=60)
+        cache.set('key', 'value', ttl=0)
+
+        assert cache.get('key') is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted when full."""
+        cache = AsyncTTLCache(ttl=60, maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_coalesces_concurrent_misses(self):
+        """Test concurrent misses for one key run the loader once."""
+        cache = AsyncTTLCache(ttl=60)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'loaded'
+
+        results = await asyncio.gather(*(cache.get_or_load('key', loader) for _ in range(5)))
+
+        assert results == ['loaded'] * 5
+        assert len(calls) == 1
+        assert cache._locks == {}
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_does_not_cache_errors(self):
+        """Test a failing loader leaves no entry behind."""
+        cache = AsyncTTLCache(ttl=60)
+
+        async def failing_loader():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load('key', failing_loader)
+
+        assert cache.get('key') is None
+        assert await cache.get_or_load('key', AsyncMock(return_value='ok')) == 'ok'
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_keeps_lock_while_callers_wait(self):
+        """Test a caller arriving after a failed load waits on the retry instead of loading again."""
+        cache = AsyncTTLCache(ttl=60)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return 'loaded'
+
+        first = asyncio.create_task(cache.get_or_load('key', loader))
+        second = asyncio.create_task(cache.get_or_load('key', loader))
+        with pytest.raises(RuntimeError):
+            await first
+
+        # The second caller now holds the lock and is loading
+        assert await cache.get_or_load('key', loader) == 'loaded'
+        assert await second == 'loaded'
+        assert len(calls) == 2
+        assert cache._locks == {}
+
+    def test_expiry_and_eviction_from_threads(self):
+        """Test concurrent threads expiring and evicting the same keys don't raise."""
+        cache = AsyncTTLCache(ttl=60, maxsize=4)
+        errors = []
+
+        def worker():
+            try:
+                for n in range(2000):
+                    cache.set(n % 8, n, ttl=0 if n % 2 else 60)
+                    cache.get(n % 8)
+                    cache.get((n + 1) % 8)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert errors == []
+
+    def test_get_or_load_from_threads_with_own_loops(self):
+        """Test concurrent misses from different event loops don't share a loop-bound lock."""
+        cache = AsyncTTLCache(ttl=60)
+        start = threading.Barrier(2)
+        results = []
+
+        async def loader():
+            await asyncio.sleep(0.05)
+            return 'loaded'
+
+        def worker():
+            async def run():
+                await asyncio.sleep(0)
+                start.wait()
+                # Hold the key's lock while the other thread's loop contends on it
+                return await asyncio.gather(*(cache.get_or_load('key', loader) for _ in range(2)))
+            results.extend(asyncio.run(run()))
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=2)
+
+        assert results == ['loaded'] * 4
+        assert cache._locks == {}
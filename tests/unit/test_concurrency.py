@@ -0,0 +1,159 @@
+"""Tests for async concurrency helpers."""
+
+import asyncio
+import threading
+import pytest
+
+from src.utils.concurrency import AsyncBatcher, AsyncTokenBucket
+
+
+class TestAsyncBatcher:
+    """Test cases for AsyncBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_submissions_within_window_share_one_call(self):
+        """Test items submitted together are handled in one batch per key."""
+        calls = []
+
+        async def handler(key, items):
+            calls.append((key, list(items)))
+            return [f"{key}:{item}" for item in items]
+
+        batcher = AsyncBatcher(handler, window=0.01)
+        results = await asyncio.gather(
+            batcher.submit('A', 1),
+            batcher.submit('A', 2),
+            batcher.submit('B', 3)
+        )
+
+        assert results == ['A:1', 'A:2', 'B:3']
+        assert sorted(calls) == [('A', [1, 2]), ('B', [3])]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_immediately(self):
+        """Test reaching max_batch flushes without waiting for the window."""
+        calls = []
+
+        async def handler(key, items):
+            calls.append(list(items))
+            return items
+
+        batcher = AsyncBatcher(handler, window=10, max_batch=2)
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit('A', 1), batcher.submit('A', 2)), timeout=1
+        )
+
+        assert results == [1, 2]
+        assert calls == [[1, 2]]
+
+    @pytest.mark.asyncio
+    async def test_handler_error_reaches_every_caller(self):
+        """Test a failing batch raises in each waiting caller."""
+        async def handler(key, items):
+            raise RuntimeError("batch failed")
+
+        batcher = AsyncBatcher(handler, window=0.01)
+        results = await asyncio.gather(
+            batcher.submit('A', 1), batcher.submit('A', 2), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_result_count_mismatch_fails_every_caller(self):
+        """Test a handler returning too few results doesn't leave callers hanging."""
+        async def handler(key, items):
+            return items[:1]
+
+        batcher = AsyncBatcher(handler, window=0.01)
+        results = await asyncio.wait_for(asyncio.gather(
+            batcher.submit('A', 1), batcher.submit('A', 2), return_exceptions=True
+        ), timeout=1)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    def test_threads_with_own_loops_are_batched_separately(self):
+        """Test callers on different event loops never share a batch."""
+        calls = []
+        start = threading.Barrier(2)
+
+        async def handler(key, items):
+            calls.append(list(items))
+            return items
+
+        batcher = AsyncBatcher(handler, window=0.05)
+        results = {}
+
+        def worker(item):
+            async def run():
+                start.wait()
+                return await asyncio.wait_for(batcher.submit('A', item), timeout=1)
+            results[item] = asyncio.run(run())
+
+        threads = [threading.Thread(target=worker, args=(item,)) for item in (1, 2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=2)
+
+        assert results == {1: 1, 2: 2}
+        assert sorted(calls) == [[1], [2]]
+
+    def test_cancelled_loop_leaves_no_stale_timer(self):
+        """Test a loop torn down mid-window doesn't block later submissions."""
+        async def handler(key, items):
+            return items
+
+        batcher = AsyncBatcher(handler, window=10)
+
+        async def abandoned():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(batcher.submit('A', 1), timeout=0.01)
+
+        asyncio.run(abandoned())
+        batcher.window = 0.01
+
+        assert asyncio.run(asyncio.wait_for(batcher.submit('A', 2), timeout=1)) == 2
+        assert batcher._timers == {}
+        assert batcher._pending == {}
+
+
+class TestAsyncTokenBucket:
+    """Test cases for AsyncTokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_immediate(self):
+        """Test acquires up to capacity don't wait."""
+        bucket = AsyncTokenBucket(rate=1, capacity=3)
+
+        for _ in range(3):
+            await asyncio.wait_for(bucket.acquire(), timeout=0.1)
+
+        assert bucket.waits == 0
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill_when_empty(self):
+        """Test an empty bucket makes the next caller wait for a token."""
+        bucket = AsyncTokenBucket(rate=50, capacity=1)
+        loop = asyncio.get_running_loop()
+
+        async with bucket:
+            pass
+        start = loop.time()
+        async with bucket:
+            pass
+
+        assert loop.time() - start >= 0.015
+        assert bucket.waits >= 1
+
+    def test_shared_across_event_loops(self):
+        """Test one bucket keeps working when used from successive event loops."""
+        bucket = AsyncTokenBucket(rate=100, capacity=1)
+
+        async def burst():
+            await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+        asyncio.run(burst())
+        asyncio.run(asyncio.wait_for(burst(), timeout=1))
+
+        assert bucket.waits >= 2
@@ -0,0 +1,185 @@
+"""Unit tests for the JIRA integration database manager."""
+
+import sqlite3
+import threading
+import pytest
+from unittest.mock import patch
+
+from src.utils import database
+from src.utils.database import DatabaseManager, SCHEMA_VERSION
+
+
+class TestDatabaseManager:
+    """Test cases for DatabaseManager."""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        """Create a database manager on a temporary file."""
+        manager = DatabaseManager(str(tmp_path / "test.db"))
+        yield manager
+        manager.close()
+
+    @pytest.fixture
+    def connection_id(self, db):
+        """Save a JIRA connection for foreign keys to reference."""
+        return db.save_jira_connection({
+            'id': 'conn-1',
+            'name': 'Test',
+            'base_url': 'https://test.atlassian.net',
+            'encrypted_credentials': b'secret'
+        })
+
+    def _task(self, task_id, connection_id):
+        return {
+            'id': task_id,
+            'original_task_data': {'summary': 'Fix login'},
+            'project_key': 'TEST',
+            'connection_id': connection_id
+        }
+
+    def test_pool_opens_connections_on_demand_and_reuses_them(self, db):
+        """Test idle connections are reused and the pool never exceeds its size."""
+        with db.get_connection() as first:
+            pass
+        with db.get_connection() as second:
+            pass
+
+        assert first is second
+        assert db._pool_created == 1
+        assert db._writer is None
+
+        borrowed = [db._acquire_connection() for _ in range(db.connection_pool_size)]
+        assert db._pool_created == db.connection_pool_size
+        for conn in borrowed:
+            db._pool.put(conn)
+
+    def test_pool_blocks_when_every_connection_is_borrowed(self, db):
+        """Test a borrower waits for a connection to be returned rather than opening more."""
+        borrowed = [db._acquire_connection() for _ in range(db.connection_pool_size)]
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(db._acquire_connection()))
+        waiter.start()
+        waiter.join(timeout=0.1)
+        assert acquired == []
+
+        db._pool.put(borrowed[0])
+        waiter.join(timeout=1)
+
+        assert acquired == [borrowed[0]]
+        for conn in borrowed[1:] + acquired:
+            db._pool.put(conn)
+
+    def test_flush_writes_commits_queued_writes_in_order(self, db, connection_id):
+        """Test queued writes are visible after a flush and applied in submission order."""
+        db.save_enhanced_task(self._task('task-1', connection_id))
+        db.update_task_jira_info('task-1', 'TEST-1', 'https://jira/TEST-1', status='pending')
+        db.update_task_jira_info('task-1', 'TEST-2', 'https://jira/TEST-2', status='created')
+        db.flush_writes()
+
+        with db.get_connection() as conn:
+            row = conn.execute(
+                "SELECT jira_issue_key, creation_status FROM enhanced_tasks WHERE id = 'task-1'"
+            ).fetchone()
+
+        assert tuple(row) == ('TEST-2', 'created')
+
+    def test_queued_write_reports_its_own_failure(self, db, connection_id):
+        """Test a failing queued write fails its future without dropping the rest of the batch."""
+        bad = db._enqueue_write("INSERT INTO no_such_table VALUES (?)", (1,))
+        good = db.record_performance_metric('op', 5, True, connection_id=connection_id)
+
+        with pytest.raises(sqlite3.OperationalError):
+            bad.result(timeout=2)
+        assert good.result(timeout=2) is None
+        assert db.get_performance_stats('op')['total_operations'] == 1
+
+    def test_save_enhanced_task_raises_foreign_key_violation(self, db):
+        """Test a task referencing an unknown connection fails for the caller."""
+        with pytest.raises(sqlite3.IntegrityError):
+            db.save_enhanced_task(self._task('task-1', 'nope'))
+
+    def test_close_commits_queued_writes_and_later_writes_run_inline(self, db):
+        """Test close drains the writer and writes after it still land."""
+        db.record_performance_metric('op', 5, True)
+        db.close()
+
+        assert not db._writer.is_alive()
+        db.record_performance_metric('op', 7, True).result(timeout=2)
+        assert db.get_performance_stats('op')['total_operations'] == 2
+
+    def test_migrations_upgrade_v2_database(self, tmp_path):
+        """Test a v2 database gets the v3 indexes and the v4 blob column."""
+        path = str(tmp_path / "old.db")
+        old = DatabaseManager.__new__(DatabaseManager)
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE schema_version (version INTEGER PRIMARY KEY, "
+                     "applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, description TEXT)")
+        old._apply_migration_v1(conn)
+        old._apply_migration_v2(conn)
+        conn.commit()
+        conn.close()
+
+        db = DatabaseManager(path)
+        try:
+            with db.get_connection() as conn:
+                indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(project_contexts)")}
+                versions = [row[0] for row in conn.execute("SELECT version FROM schema_version ORDER BY version")]
+        finally:
+            db.close()
+
+        assert db.schema_version == SCHEMA_VERSION
+        assert versions == [1, 2, 3, 4]
+        assert {'idx_perf_op_ts', 'idx_enhanced_tasks_conn_proj'} <= indexes
+        assert 'idx_performance_metrics_operation' not in indexes
+        assert 'context_data_blob' in columns
+
+    def _context(self, connection_id):
+        return {
+            'id': 'ctx-1',
+            'connection_id': connection_id,
+            'project_key': 'TEST',
+            'project_name': 'Test Project',
+            'context_data': {'epics': [{'key': 'TEST-1', 'summary': 'Payments'}], 'count': 3},
+            'cached_epics': [{'key': 'TEST-1'}]
+        }
+
+    def test_project_context_round_trip_without_compression(self, db, connection_id, monkeypatch):
+        """Test context data is stored as JSON text when zstandard is unavailable."""
+        monkeypatch.setattr(database, 'ZSTANDARD_AVAILABLE', False)
+        db.save_project_context(self._context(connection_id))
+
+        loaded = db.get_project_context(connection_id, 'TEST')
+
+        assert loaded['context_data'] == self._context(connection_id)['context_data']
+        assert loaded['cached_epics'] == [{'key': 'TEST-1'}]
+
+    def test_project_context_round_trip_with_compression(self, db, connection_id):
+        """Test context data round-trips through the compressed blob column."""
+        pytest.importorskip('zstandard')
+        db.save_project_context(self._context(connection_id))
+
+        with db.get_connection() as conn:
+            row = conn.execute("SELECT context_data, context_data_blob FROM project_contexts").fetchone()
+        loaded = db.get_project_context(connection_id, 'TEST')
+
+        assert row['context_data'] == ''
+        assert row['context_data_blob'] is not None
+        assert loaded['context_data'] == self._context(connection_id)['context_data']
+
+
+class TestGetDatabaseManager:
+    """Test cases for the global database manager."""
+
+    def test_global_manager_closes_at_exit(self, tmp_path, monkeypatch):
+        """Test the global manager is closed at exit so queued writes are committed."""
+        monkeypatch.setattr(database, '_db_manager', None)
+        with patch.object(database, 'DatabaseManager', lambda: DatabaseManager(str(tmp_path / "test.db"))), \
+             patch.object(database.atexit, 'register') as register:
+            manager = database.get_database_manager()
+            assert database.get_database_manager() is manager
+
+        register.assert_called_once_with(manager.close)
+        manager.record_performance_metric('op', 5, True)
+        register.call_args.args[0]()
+        assert DatabaseManager(str(tmp_path / "test.db")).get_performance_stats('op')['total_operations'] == 1
@@ -2,15 +2,18 @@
 
 import pytest
 import asyncio
+import threading
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from src.services.mcp_jira_service import (
     MCPJiraService,
     ProjectContext,
     TaskSimilarity
 )
-from src.exceptions import JiraIntegrationError
+from src.models.project_context import EpicInfo, IssueTypeInfo
+from src.exceptions import JiraAPIError, JiraConnectionError, JiraIntegrationError
+from src.utils.concurrency import AsyncTokenBucket
 from src.config import AppConfig, JiraConfig, MCPConfig
 
 
@@ -75,6 +78,56 @@ class TestMCPJiraService:
             assert mcp_service._jira_client is not None
             assert len(mcp_service._connection_pool) == 1
     
+    @pytest.mark.asyncio
+    async def test_authenticate_via_mcp_reuses_recent_client(self, mcp_service):
+        """Test re-authenticating with the same credentials skips the JIRA round trip."""
+        with patch('src.services.mcp_jira_service.Jira') as mock_jira_class:
+            mock_jira_class.return_value.myself.return_value = {'displayName': 'Test User'}
+
+            await mcp_service.authenticate_via_mcp("https://test.atlassian.net", "user", "token")
+            await mcp_service.authenticate_via_mcp("https://test.atlassian.net", "user", "token")
+            assert mock_jira_class.return_value.myself.call_count == 1
+
+            await mcp_service.authenticate_via_mcp("https://test.atlassian.net", "user", "new_token")
+            assert mock_jira_class.return_value.myself.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_authenticate_via_mcp_prunes_expired_clients(self, mcp_service):
+        """Test pooled clients older than the max age are evicted on the next auth."""
+        stale = datetime.now() - timedelta(hours=2)
+        mcp_service._connection_pool['https://old.atlassian.net:user'] = {
+            'api_token': 'token', 'client': MagicMock(),
+            'authenticated_at': stale, 'last_used': stale
+        }
+
+        with patch('src.services.mcp_jira_service.Jira') as mock_jira_class:
+            mock_jira_class.return_value.myself.return_value = {'displayName': 'Test User'}
+            await mcp_service.authenticate_via_mcp("https://test.atlassian.net", "user", "token")
+
+        assert list(mcp_service._connection_pool) == ['https://test.atlassian.net:user']
+
+    @pytest.mark.asyncio
+    async def test_user_info_cached_until_unauthorized(self, mcp_service):
+        """Test /myself lookups are reused per credentials and dropped on a 401."""
+        with patch('src.services.mcp_jira_service.Jira') as mock_jira_class:
+            mock_client = mock_jira_class.return_value
+            mock_client.myself.return_value = {'displayName': 'Test User'}
+
+            await mcp_service.authenticate_via_mcp("https://test.atlassian.net", "user", "token")
+            mcp_service._connection_pool.clear()
+            await mcp_service.authenticate_via_mcp("https://test.atlassian.net", "user", "token")
+            assert mock_client.myself.call_count == 1
+            assert mcp_service._current_pool_key == "https://test.atlassian.net:user"
+
+            unauthorized = Exception("Unauthorized")
+            unauthorized.response = MagicMock(status_code=401)
+            with patch.object(mcp_service, '_route_mcp_call', AsyncMock(side_effect=unauthorized)):
+                await mcp_service._make_mcp_call('get_project_details', {'project_key': 'TEST'})
+
+            assert mcp_service._connection_pool == {}
+            await mcp_service.authenticate_via_mcp("https://test.atlassian.net", "user", "token")
+            assert mock_client.myself.call_count == 2
+
     @pytest.mark.asyncio
     async def test_authenticate_via_mcp_failure(self, mcp_service):
         """Test JIRA authentication failure."""
@@ -109,7 +162,63 @@ class TestMCPJiraService:
                 assert len(result) > 0
                 assert 'key' in result[0]
                 assert 'name' in result[0]
-    
+
+    @pytest.mark.asyncio
+    async def test_get_enriched_projects_coalesces_concurrent_misses(self, mcp_service):
+        """Test concurrent cache misses share a single MCP request."""
+        mcp_service._current_connection_id = "conn_test"
+
+        async def slow_call(operation, params):
+            await asyncio.sleep(0.01)
+            return {'projects': [{'key': 'TEST', 'name': 'Test Project'}]}
+
+        with patch.object(mcp_service._cache_service, 'get', return_value=None):
+            with patch.object(mcp_service._cache_service, 'set'):
+                with patch.object(mcp_service, '_make_mcp_call', side_effect=slow_call) as mock_call:
+                    results = await asyncio.gather(
+                        *(mcp_service.get_enriched_projects() for _ in range(5))
+                    )
+
+        assert mock_call.call_count == 1
+        assert all(result == results[0] for result in results)
+        assert results[0][0]['key'] == 'TEST'
+        assert mcp_service._inflight == {}
+
+    def test_get_enriched_projects_coalesces_across_event_loops(self, mcp_service):
+        """Test refreshes from request threads with their own loops share one MCP request."""
+        mcp_service._current_connection_id = "conn_test"
+        started = threading.Event()
+        calls = []
+
+        async def slow_call(operation, params):
+            calls.append(operation)
+            started.set()
+            await asyncio.sleep(0.05)
+            return {'projects': [{'key': 'TEST', 'name': 'Test Project'}]}
+
+        results = []
+
+        def first_request():
+            results.append(asyncio.run(mcp_service.get_enriched_projects()))
+
+        def second_request():
+            started.wait(timeout=1)
+            results.append(asyncio.run(mcp_service.get_enriched_projects()))
+
+        with patch.object(mcp_service._cache_service, 'get', return_value=None), \
+             patch.object(mcp_service._cache_service, 'set'), \
+             patch.object(mcp_service, '_make_mcp_call', side_effect=slow_call):
+            threads = [threading.Thread(target=first_request), threading.Thread(target=second_request)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=2)
+
+        assert calls == ['get_projects_enriched']
+        assert len(results) == 2
+        assert results[0] == results[1]
+        assert mcp_service._inflight == {}
+
     @pytest.mark.asyncio
     async def test_get_project_context_success(self, mcp_service):
         """Test successful project context retrieval."""
@@ -149,6 +258,35 @@ class TestMCPJiraService:
             assert context.key == project_key
             assert context.name == 'Test Project'
     
+    @pytest.mark.asyncio
+    async def test_get_project_context_reuses_in_memory_instance(self, mcp_service):
+        """Test a live cached context is returned as-is without touching the database."""
+        mcp_service._current_connection_id = 'conn-1'
+        context = ProjectContext(project_key='TEST', project_name='Test Project')
+        mcp_service._context_cache.set(('conn-1', 'TEST'), context)
+
+        with patch.object(mcp_service._db_manager, 'get_project_context') as db_read:
+            result = await mcp_service.get_project_context('TEST')
+
+        assert result is context
+        db_read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_project_context_raises_instead_of_caching_mock_data(self, mcp_service):
+        """Test a failed bundle fetch raises and leaves the database and memory caches alone."""
+        mcp_service._current_connection_id = 'conn-1'
+        mcp_service._jira_client = MagicMock()
+
+        with patch.object(mcp_service._db_manager, 'get_project_context', return_value=None), \
+             patch.object(mcp_service._db_manager, 'save_project_context') as db_save, \
+             patch.object(mcp_service, '_get_project_context_bundle_real',
+                          AsyncMock(side_effect=JiraAPIError("JIRA unavailable"))):
+            with pytest.raises(JiraConnectionError):
+                await mcp_service.get_project_context('TEST')
+
+        db_save.assert_not_called()
+        assert mcp_service._context_cache.get(('conn-1', 'TEST')) is None
+
     @pytest.mark.asyncio
     async def test_search_similar_tasks_success(self, mcp_service):
         """Test successful similar task search."""
@@ -223,7 +361,380 @@ class TestMCPJiraService:
                 
                 # Should return some results based on similarity
                 assert isinstance(results, list)
-    
+
+    @pytest.mark.asyncio
+    async def test_search_similar_tasks_keeps_same_title_with_different_description(self, mcp_service):
+        """Test every returned issue is scored, so a same-titled issue isn't dropped early."""
+        mcp_service._current_connection_id = 'conn-1'
+        context = ProjectContext(project_key='TEST', project_name='Test Project')
+        issue = {'key': 'TEST-7', 'fields': {
+            'summary': 'Add retry to payment webhook',
+            'description': ' '.join(f'existing{n}' for n in range(40)),
+            'status': {'name': 'Open'},
+            'issuetype': {'name': 'Task'},
+            'created': '2024-01-01T00:00:00.000+0000'
+        }}
+
+        with patch.object(mcp_service, 'get_project_context', AsyncMock(return_value=context)), \
+             patch.object(mcp_service, '_make_mcp_call', AsyncMock(return_value={'issues': [issue]})):
+            analysis = await mcp_service.search_similar_tasks(
+                'task-1', 'TEST', 'Add retry to payment webhook',
+                ' '.join(f'new{n}' for n in range(40))
+            )
+
+        assert [similar.issue_key for similar in analysis.similar_issues] == ['TEST-7']
+
+    @pytest.mark.asyncio
+    async def test_search_similar_issues_real_uses_single_clause(self, mcp_service):
+        """Test similar issue search sends one summary clause with a field projection."""
+        mcp_service._jira_client = MagicMock()
+
+        issue = {'key': 'TEST-1', 'fields': {'summary': 'Implement authentication handling'}}
+        with patch.object(mcp_service, '_search_issues_page',
+                          return_value={'issues': [issue]}) as search_page:
+            result = await mcp_service._search_similar_issues_real({
+                'project_key': 'TEST',
+                'summary': 'Implement user authentication',
+                'description': 'Add "secure" login with session handling',
+                'limit': 25
+            })
+
+        assert result == {'issues': [issue], 'pre_filtered': False}
+        jql, fields, start, limit = search_page.call_args.args
+        assert ' OR ' not in jql
+        assert jql.count('summary ~') == 1
+        assert 'authentication' in jql
+        assert limit == 25
+        assert 'renderedFields' not in fields
+        assert 'comment' not in fields
+        assert 'summary' in fields
+
+    @pytest.mark.asyncio
+    async def test_search_similar_issues_real_filters_in_jql(self, mcp_service):
+        """Test issue type, age and component filters are pushed into the JQL."""
+        mcp_service._jira_client = MagicMock()
+
+        with patch.object(mcp_service, '_search_issues_page',
+                          return_value={'issues': []}) as search_page:
+            result = await mcp_service._search_similar_issues_real({
+                'project_key': 'TEST',
+                'summary': 'Implement user authentication',
+                'issue_types': ['Story', 'Task'],
+                'components': ['Backend']
+            })
+
+        jql = search_page.call_args.args[0]
+        assert result['pre_filtered'] is True
+        assert 'created >= -90d' in jql
+        assert 'issuetype in ("Story", "Task")' in jql
+        assert 'component in ("Backend")' in jql
+
+    def test_calculate_context_similarity_trusts_pre_filtered_results(self, mcp_service):
+        """Test pre-filtered issues get the type and age bonuses without lookups."""
+        context = ProjectContext(project_key='TEST', project_name='Test Project')
+        issue = {'key': 'TEST-1', 'fields': {'created': '2024-01-01T00:00:00.000+0000'}}
+        created_ts = datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+
+        score = mcp_service._calculate_context_similarity(
+            issue, context, now_ts=created_ts + 86400 * 120, pre_filtered=True
+        )
+
+        assert score == pytest.approx(0.5)
+
+    def test_select_search_keywords_folds_inflections_and_stop_words(self, mcp_service):
+        """Test search terms drop stop words and count inflections of a word once."""
+        keywords = mcp_service._select_search_keywords(
+            "Exports should export invoices; exported invoice about billing"
+        )
+
+        assert keywords == ['invoices', 'billing', 'exports']
+
+    def test_create_jira_client_sizes_connection_pool(self, mcp_service):
+        """Test the JIRA client's session can keep a connection per concurrent call."""
+        from src.services.mcp_jira_service import JIRA_HTTP_POOL_SIZE
+
+        client = mcp_service._create_jira_client('https://test.atlassian.net', 'user', 'token')
+
+        adapter = client._session.get_adapter('https://test.atlassian.net')
+        assert adapter._pool_maxsize == JIRA_HTTP_POOL_SIZE
+        assert client._session.auth == ('user', 'token')
+
+    def test_search_issues_page_decodes_raw_response(self, mcp_service):
+        """Test search pages are fetched as raw bytes and decoded locally."""
+        mcp_service._jira_client = MagicMock()
+        mcp_service._jira_client.resource_url.return_value = 'rest/api/2/search'
+        mcp_service._jira_client.get.return_value = b'{"issues": [{"key": "TEST-1"}], "total": 1}'
+
+        with patch('src.services.mcp_jira_service.ORJSON_AVAILABLE', True):
+            result = mcp_service._search_issues_page('project = TEST', 'summary', 0, 10)
+
+        assert result == {'issues': [{'key': 'TEST-1'}], 'total': 1}
+        kwargs = mcp_service._jira_client.get.call_args.kwargs
+        assert kwargs['not_json_response'] is True
+        assert kwargs['params'] == {
+            'jql': 'project = TEST', 'fields': 'summary', 'startAt': 0, 'maxResults': 10
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_project_context_bundle_real_degrades_optional_parts(self, mcp_service):
+        """Test the context bundle keeps details and defaults failed optional parts."""
+        details = {'name': 'Test Project', 'description': '', 'projectTypeKey': 'software', 'lead': {}}
+
+        with patch.object(mcp_service, '_get_project_details_real', AsyncMock(return_value=details)), \
+             patch.object(mcp_service, '_get_active_sprint_real', AsyncMock(return_value={'sprint': None})), \
+             patch.object(mcp_service, '_get_project_epics_real', AsyncMock(side_effect=Exception("boom"))), \
+             patch.object(mcp_service, '_get_project_metadata_real', AsyncMock(return_value={'issue_types': []})), \
+             patch.object(mcp_service, '_get_recent_issues_real', AsyncMock(return_value={'issues': []})) as recent:
+            bundle = await mcp_service._get_project_context_bundle_real('TEST', 20)
+
+        assert bundle['details'] == details
+        assert bundle['epics'] == {'epics': []}
+        assert bundle['sprint'] == {'sprint': None}
+        recent.assert_awaited_once_with('TEST', 20)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_similar_searches_share_one_query(self, mcp_service):
+        """Test concurrent searches for a project are merged and split per caller."""
+        mcp_service._jira_client = MagicMock()
+        page = {'issues': [
+            {'key': 'TEST-1', 'fields': {'summary': 'Authentication timeout on login'}},
+            {'key': 'TEST-2', 'fields': {'summary': 'Invoice export broken'}}
+        ]}
+
+        with patch.object(mcp_service, '_search_issues_page', return_value=page) as search_page:
+            auth, invoice = await asyncio.gather(
+                mcp_service._search_similar_issues_real(
+                    {'project_key': 'TEST', 'summary': 'Authentication timeout', 'limit': 10}
+                ),
+                mcp_service._search_similar_issues_real(
+                    {'project_key': 'TEST', 'summary': 'Invoice export', 'limit': 10}
+                )
+            )
+
+        assert search_page.call_count == 1
+        assert ' OR ' in search_page.call_args.args[0]
+        assert [issue['key'] for issue in auth['issues']] == ['TEST-1']
+        assert [issue['key'] for issue in invoice['issues']] == ['TEST-2']
+
+    @pytest.mark.asyncio
+    async def test_lone_search_keeps_every_issue_jira_matched(self, mcp_service):
+        """Test an unbatched search isn't narrowed by the local term match."""
+        mcp_service._jira_client = MagicMock()
+        page = {'issues': [
+            {'key': 'TEST-1', 'fields': {'summary': 'Login timeouts'}},
+            {'key': 'TEST-2', 'fields': {'summary': 'Logging timeout'}}
+        ]}
+
+        with patch.object(mcp_service, '_search_issues_page', return_value=page):
+            result = await mcp_service._search_similar_issues_real(
+                {'project_key': 'TEST', 'summary': 'Logging timeout', 'limit': 10}
+            )
+
+        assert [issue['key'] for issue in result['issues']] == ['TEST-1', 'TEST-2']
+
+    @pytest.mark.asyncio
+    async def test_batched_search_requires_all_terms(self, mcp_service):
+        """Test a batched search keeps only issues matching all of its own terms."""
+        mcp_service._jira_client = MagicMock()
+        page = {'issues': [
+            {'key': 'TEST-1', 'fields': {'summary': 'Authentication timeouts on login/logout'}},
+            {'key': 'TEST-2', 'fields': {'summary': 'Authentication page redesign'}},
+            {'key': 'TEST-3', 'fields': {'summary': 'Invoice export broken'}}
+        ]}
+
+        with patch.object(mcp_service, '_search_issues_page', return_value=page) as search_page:
+            auth, invoice = await asyncio.gather(
+                mcp_service._search_similar_issues_real(
+                    {'project_key': 'TEST', 'summary': 'Authentication login timeout', 'limit': 10}
+                ),
+                mcp_service._search_similar_issues_real(
+                    {'project_key': 'TEST', 'summary': 'Invoice export', 'limit': 10}
+                )
+            )
+
+        assert search_page.call_count == 1
+        assert [issue['key'] for issue in auth['issues']] == ['TEST-1']
+        assert [issue['key'] for issue in invoice['issues']] == ['TEST-3']
+
+    @pytest.mark.asyncio
+    async def test_batched_search_reruns_request_crowded_out_of_shared_result(self, mcp_service):
+        """Test a request short of its limit in a truncated combined result is searched alone."""
+        auth = [{'key': f'TEST-{i}', 'fields': {'summary': 'Authentication timeout'}} for i in range(4)]
+        invoice = {'key': 'TEST-9', 'fields': {'summary': 'Invoice export broken'}}
+
+        async def fake_search(project_key, prefilter, phrases, limit):
+            if len(phrases) > 1:
+                return auth[:limit]
+            return [invoice] if 'invoice' in phrases[0] else auth[:limit]
+
+        with patch.object(mcp_service, '_search_summary_phrases', side_effect=fake_search) as search:
+            auth_result, invoice_result = await mcp_service._run_similar_search_batch(
+                ('TEST', 'created >= -90d'), [(['authentication', 'timeout'], 2), (['invoice', 'export'], 2)]
+            )
+
+        assert [issue['key'] for issue in auth_result] == ['TEST-0', 'TEST-1']
+        assert invoice_result == [invoice]
+        assert search.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_recent_issues_and_epics_request_only_used_fields(self, mcp_service):
+        """Test recent-issue and epic lookups project fields instead of fetching all."""
+        epic = {'key': 'TEST-100', 'fields': {'summary': 'Auth epic', 'status': {'name': 'Open'}}}
+
+        with patch.object(mcp_service, '_search_issues_page',
+                          return_value={'total': 1, 'issues': [epic]}) as search_page:
+            epics = await mcp_service._get_project_epics_real('TEST')
+            await mcp_service._get_recent_issues_real('TEST', 50)
+
+        epic_fields = search_page.call_args_list[0].args[1]
+        recent_fields = search_page.call_args_list[1].args[1]
+        assert epics == {'epics': [{'key': 'TEST-100', 'summary': 'Auth epic', 'status': 'Open'}]}
+        assert epic_fields == 'summary,status'
+        assert '*all' not in recent_fields
+        assert 'description' not in recent_fields
+
+    @pytest.mark.asyncio
+    async def test_get_projects_enriched_real_keeps_project_order(self, mcp_service):
+        """Test enriched projects come back in the order JIRA listed them."""
+        mcp_service._jira_client = MagicMock()
+        mcp_service._jira_client.projects.return_value = [
+            {'key': f'P{i}', 'name': f'Project {i}'} for i in range(8)
+        ]
+
+        result = await mcp_service._get_projects_enriched_real()
+
+        assert [p['key'] for p in result['projects']] == [f'P{i}' for i in range(8)]
+        assert result['projects'][0]['projectTypeKey'] == 'software'
+
+    @pytest.mark.asyncio
+    async def test_jql_parallel_fetches_remaining_pages(self, mcp_service):
+        """Test JQL pagination reads the total once then fetches the other windows."""
+        all_issues = [{'key': f'TEST-{i}'} for i in range(250)]
+
+        def fake_page(jql, fields, start, limit):
+            return {'issues': all_issues[start:start + limit], 'total': len(all_issues)}
+
+        with patch.object(mcp_service, '_search_issues_page', side_effect=fake_page) as search_page:
+            issues = await mcp_service._jql_parallel('project = TEST', 220, page=100)
+
+        assert issues == all_issues[:220]
+        starts = sorted(call.args[2] for call in search_page.call_args_list)
+        assert starts == [0, 100, 200]
+
+    @pytest.mark.asyncio
+    async def test_cacheable_operations_hit_api_once(self, mcp_service):
+        """Test slow-changing lookups are served from the TTL cache until cleared."""
+        mcp_service._jira_client = MagicMock()
+        metadata = {'issue_types': [{'id': '1', 'name': 'Task'}]}
+
+        with patch.object(mcp_service, '_get_project_metadata_real', AsyncMock(return_value=metadata)) as real:
+            first = await mcp_service._make_mcp_call('get_project_metadata', {'project_key': 'TEST'})
+            second = await mcp_service._make_mcp_call('get_project_metadata', {'project_key': 'TEST'})
+            assert real.await_count == 1
+
+            mcp_service.clear_cache()
+            await mcp_service._make_mcp_call('get_project_metadata', {'project_key': 'TEST'})
+            assert real.await_count == 2
+
+        assert first == second == metadata
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_call_is_retried_with_backoff(self, mcp_service):
+        """Test a 429 from JIRA is retried after backing off instead of falling back."""
+        mcp_service._jira_client = MagicMock()
+        rate_limited = Exception("Too Many Requests")
+        rate_limited.response = MagicMock(status_code=429)
+        details = {'name': 'Test Project'}
+
+        with patch.object(mcp_service, '_get_project_details_real',
+                          AsyncMock(side_effect=[rate_limited, details])), \
+             patch('src.services.mcp_jira_service.asyncio.sleep', AsyncMock()) as mock_sleep:
+            result = await mcp_service._make_mcp_call('get_project_details', {'project_key': 'TEST'})
+
+        assert result == details
+        mock_sleep.assert_awaited_once()
+        assert mcp_service.metrics()['rate_limited'] == 1
+        assert mcp_service.metrics()['misses'] == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_in_swallowing_handler_is_retried(self, mcp_service):
+        """Test a 429 inside a handler that defaults on errors still backs off and retries."""
+        mcp_service._jira_client = MagicMock()
+        rate_limited = Exception("Too Many Requests")
+        rate_limited.response = MagicMock(status_code=429)
+        epic = {'key': 'TEST-1', 'fields': {'summary': 'Payments', 'status': {'name': 'Open'}}}
+
+        with patch.object(mcp_service, '_jql_parallel', AsyncMock(side_effect=[rate_limited, [epic]])), \
+             patch('src.services.mcp_jira_service.asyncio.sleep', AsyncMock()):
+            result = await mcp_service._make_mcp_call('get_project_epics', {'project_key': 'TEST'})
+
+        assert result == {'epics': [{'key': 'TEST-1', 'summary': 'Payments', 'status': 'Open'}]}
+        assert mcp_service.metrics()['rate_limited'] == 1
+
+    @pytest.mark.asyncio
+    async def test_programming_error_is_not_masked_as_mock_data(self, mcp_service):
+        """Test only JIRA API failures fall back to mock data."""
+        mcp_service._jira_client = MagicMock()
+
+        with patch.object(mcp_service, '_get_project_details_real',
+                          AsyncMock(side_effect=RuntimeError("bound to a different event loop"))):
+            with pytest.raises(RuntimeError, match="different event loop"):
+                await mcp_service._make_mcp_call('get_project_details', {'project_key': 'TEST'})
+
+    def test_rate_limiter_and_semaphore_survive_new_event_loops(self, mcp_service):
+        """Test a service shared across asyncio.run calls keeps making real calls."""
+        mcp_service._jira_client = MagicMock()
+        mcp_service._jira_client.project.return_value = {'name': 'Real Project'}
+        mcp_service._rate_limiter = AsyncTokenBucket(rate=1000, capacity=2)
+
+        async def burst():
+            mcp_service.clear_cache()
+            return await asyncio.gather(*(
+                mcp_service._make_mcp_call('get_project_context_bundle', {'project_key': f'P{i}'})
+                for i in range(10)
+            ))
+
+        asyncio.run(burst())
+        results = asyncio.run(burst())
+
+        assert all(bundle['details']['name'] == 'Real Project' for bundle in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_epics_lookup_is_not_cached(self, mcp_service):
+        """Test a transient epics failure defaults once and is retried on the next bundle."""
+        mcp_service._jira_client = MagicMock()
+        mcp_service._jira_client.project.return_value = {'name': 'Test Project'}
+        mcp_service._jira_client.project_issue_types.return_value = []
+        epic = {'key': 'TEST-1', 'fields': {'summary': 'Payments', 'status': {'name': 'Open'}}}
+
+        epic_results = iter([JiraAPIError("boom"), [epic]])
+
+        async def jql_parallel(jql, total_cap, fields='*all'):
+            if 'issuetype = Epic' not in jql:
+                return []
+            result = next(epic_results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with patch.object(mcp_service, '_jql_parallel', side_effect=jql_parallel):
+            first = await mcp_service._get_project_context_bundle_real('TEST')
+            second = await mcp_service._get_project_context_bundle_real('TEST')
+
+        assert first['epics'] == {'epics': []}
+        assert second['epics']['epics'][0]['key'] == 'TEST-1'
+
+    @pytest.mark.asyncio
+    async def test_get_project_context_bundle_real_requires_details(self, mcp_service):
+        """Test the context bundle re-raises a project details failure."""
+        with patch.object(mcp_service, '_get_project_details_real', AsyncMock(side_effect=ValueError("missing"))), \
+             patch.object(mcp_service, '_get_active_sprint_real', AsyncMock(return_value={})), \
+             patch.object(mcp_service, '_get_project_epics_real', AsyncMock(return_value={})), \
+             patch.object(mcp_service, '_get_project_metadata_real', AsyncMock(return_value={})), \
+             patch.object(mcp_service, '_get_recent_issues_real', AsyncMock(return_value={})):
+            with pytest.raises(ValueError, match="missing"):
+                await mcp_service._get_project_context_bundle_real('TEST')
+
     @pytest.mark.asyncio
     async def test_create_context_aware_task_success(self, mcp_service):
         """Test successful context-aware task creation."""
@@ -294,6 +805,58 @@ class TestMCPJiraService:
                     context
                 )
     
+    @pytest.mark.asyncio
+    async def test_create_context_aware_tasks_share_bulk_request(self, mcp_service):
+        """Test concurrent task creates are sent as one bulk create."""
+        context = ProjectContext(project_key='TEST', project_name='Test Project')
+        bulk_result = {'success': True, 'results': [
+            {'success': True, 'issue': {'key': 'TEST-1', 'summary': 'First', 'status': 'To Do'}},
+            {'success': False, 'error': 'summary: Field required'}
+        ]}
+
+        with patch.object(mcp_service, '_make_mcp_call', AsyncMock(return_value=bulk_result)) as mcp_call:
+            first, second = await mcp_service.create_context_aware_tasks(
+                'TEST', [{'summary': 'First'}, {'summary': ''}], context
+            )
+
+        mcp_call.assert_awaited_once()
+        assert mcp_call.call_args.args[0] == 'create_issues_bulk'
+        assert first['key'] == 'TEST-1'
+        assert isinstance(second, JiraIntegrationError)
+
+    @pytest.mark.asyncio
+    async def test_create_issues_bulk_real_maps_errors_by_position(self, mcp_service):
+        """Test bulk create results line up with inputs around rejected issues."""
+        mcp_service._jira_client = MagicMock()
+        mcp_service._jira_client.create_issues.return_value = {
+            'issues': [{'key': 'TEST-1'}, {'key': 'TEST-3'}],
+            'errors': [{
+                'failedElementNumber': 1,
+                'elementErrors': {'errorMessages': [], 'errors': {'summary': 'Field required'}}
+            }]
+        }
+
+        result = await mcp_service._create_issues_bulk_real({
+            'project_key': 'TEST',
+            'issues_data': [{'summary': 'One'}, {'summary': ''}, {'summary': 'Three'}]
+        })
+
+        payload = mcp_service._jira_client.create_issues.call_args.args[0]
+        assert payload[2]['fields']['project'] == {'key': 'TEST'}
+        assert [r['success'] for r in result['results']] == [True, False, True]
+        assert result['results'][2]['issue']['key'] == 'TEST-3'
+        assert result['results'][2]['issue']['summary'] == 'Three'
+        assert 'Field required' in result['results'][1]['error']
+
+    def test_tokenize_memoizes_repeated_text(self, mcp_service):
+        """Test the same text is split once and its token sets reused."""
+        first = mcp_service._tokenize("Implement User authentication")
+        second = mcp_service._tokenize("Implement User authentication")
+
+        assert first is second
+        assert first[0] == frozenset({'implement', 'user', 'authentication'})
+        assert first[1] == frozenset({'implement', 'authentication'})
+
     def test_calculate_text_similarity_identical(self, mcp_service):
         """Test text similarity calculation for identical texts."""
         text1 = "This is a test"
@@ -330,9 +893,66 @@ class TestMCPJiraService:
         assert similarity1 == 0.0
         assert similarity2 == 0.0
         assert similarity3 == 0.0
-    
-    @pytest.mark.asyncio
-    async def test_analyze_task_similarity(self, mcp_service):
+
+    def test_attach_token_sets_tokenizes_once(self, mcp_service):
+        """Test issue token sets are cached on the issue and match string scorers."""
+        issue = {'key': 'TEST-1', 'fields': {'summary': 'Fix Login page', 'description': None}}
+
+        token_sets = mcp_service._attach_token_sets(issue)
+
+        assert issue['_tokens'] is token_sets
+        assert mcp_service._attach_token_sets(issue) is token_sets
+        assert token_sets['summary'] == frozenset({'fix', 'login', 'page'})
+        assert token_sets['description'] == frozenset()
+
+        task_sets = mcp_service._build_token_sets("fix login bug", "")
+        assert mcp_service._calculate_text_similarity_sets(
+            task_sets['summary'], token_sets['summary']
+        ) == mcp_service._calculate_text_similarity("fix login bug", "Fix Login page")
+
+    def test_bulk_similarity_scores_match_set_scores(self, mcp_service):
+        """Test the matrix scoring path agrees with pairwise set scoring."""
+        task_tokens = frozenset({'fix', 'login', 'bug', 'page'})
+        issue_token_sets = [
+            frozenset({'fix', 'login'}),
+            frozenset(),
+            frozenset({'payment', 'page', 'bug'}),
+            frozenset({'unrelated'})
+        ] * 5
+
+        scores = mcp_service._bulk_similarity_scores(task_tokens, issue_token_sets)
+
+        assert scores == [
+            mcp_service._calculate_text_similarity_sets(task_tokens, tokens)
+            for tokens in issue_token_sets
+        ]
+
+    def test_calculate_context_similarity_uses_cached_created_ts(self, mcp_service):
+        """Test created dates are parsed once and scored against a shared now_ts."""
+        context = ProjectContext(
+            project_key='TEST',
+            project_name='Test Project',
+            issue_types=[IssueTypeInfo(id='1', name='Task', description='', is_subtask=False)]
+        )
+        issue = {
+            'key': 'TEST-1',
+            'fields': {
+                'issuetype': {'name': 'Task'},
+                'created': '2024-01-01T00:00:00.000+0000'
+            }
+        }
+        created_ts = datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+
+        recent = mcp_service._calculate_context_similarity(issue, context, now_ts=created_ts + 86400 * 10)
+        older = mcp_service._calculate_context_similarity(issue, context, now_ts=created_ts + 86400 * 60)
+        stale = mcp_service._calculate_context_similarity(issue, context, now_ts=created_ts + 86400 * 365)
+
+        assert issue['_created_ts'] == created_ts
+        assert recent == pytest.approx(0.7)
+        assert older == pytest.approx(0.5)
+        assert stale == pytest.approx(0.3)
+
+    def test_analyze_task_similarity(self, mcp_service):
         """Test task similarity analysis."""
         task_summary = "Implement login feature"
         task_description = "Add user authentication"
@@ -358,7 +978,7 @@ class TestMCPJiraService:
             recent_issues=[]
         )
         
-        result = await mcp_service._analyze_task_similarity(
+        result = mcp_service._analyze_task_similarity(
             task_summary,
             task_description,
             existing_issue,
@@ -369,7 +989,47 @@ class TestMCPJiraService:
         assert result.existing_issue_key == 'TEST-123'
         assert 0.0 <= result.similarity_score <= 1.0
         assert result.recommendation in ['duplicate', 'related', 'unique']
-    
+
+    def test_analyze_task_similarity_fuzzy_recheck(self, mcp_service):
+        """Test near-threshold scores are lifted by the fuzzy match for word-form variants."""
+        pytest.importorskip('rapidfuzz')
+        existing_issue = {'key': 'TEST-123', 'fields': {'summary': 'App crashes on login page'}}
+
+        result = mcp_service._analyze_task_similarity(
+            "app crash on login page", "", existing_issue, None
+        )
+
+        assert result.similarity_score > 0.9
+        assert result.recommendation == 'duplicate'
+        assert 'fuzzy_match' in result.context_factors
+
+    def test_analyze_task_similarity_fuzzy_recheck_ignores_case(self, mcp_service):
+        """Test the fuzzy re-check compares summaries case-insensitively."""
+        pytest.importorskip('rapidfuzz')
+        existing_issue = {'key': 'TEST-123', 'fields': {'summary': 'App crashes on login page'}}
+
+        result = mcp_service._analyze_task_similarity(
+            "APP CRASH ON LOGIN PAGE", "", existing_issue, None
+        )
+
+        assert result.recommendation == 'duplicate'
+        assert 'fuzzy_match' in result.context_factors
+
+    def test_analyze_task_similarity_exact_summary_short_circuits(self, mcp_service):
+        """Test identical summaries match via the cached hash without tokenizing."""
+        existing_issue = {'key': 'TEST-123', 'fields': {'summary': 'Implement  Login feature '}}
+        task_hash = mcp_service._summary_hash("implement login feature")
+
+        with patch.object(mcp_service, '_calculate_text_similarity') as text_similarity:
+            result = mcp_service._analyze_task_similarity(
+                "implement login feature", "", existing_issue, None, task_hash=task_hash
+            )
+
+        text_similarity.assert_not_called()
+        assert existing_issue['_sum_hash'] == task_hash
+        assert result.similarity_score == 1.0
+        assert result.recommendation == 'duplicate'
+
     @pytest.mark.asyncio
     async def test_enhance_task_data(self, mcp_service):
         """Test task data enhancement with context."""
@@ -433,6 +1093,49 @@ class TestMCPJiraService:
             # The actual call might not happen if keywords don't match perfectly
             pass  # Test passes if no exception is raised
     
+    @pytest.mark.asyncio
+    async def test_auto_link_to_epics_uses_created_issue_summary(self, mcp_service):
+        """Test newly created issues are matched to epics through the keyword index."""
+        created_task = {'key': 'TEST-456', 'summary': 'Implement authentication feature', 'status': 'To Do'}
+        context = ProjectContext(
+            project_key='TEST',
+            project_name='Test Project',
+            available_epics=[
+                EpicInfo(key='TEST-100', summary='User Authentication Epic'),
+                EpicInfo(key='TEST-200', summary='Payment Processing Epic')
+            ]
+        )
+
+        with patch.object(mcp_service, '_make_mcp_call', AsyncMock(return_value={})) as mock_call:
+            await mcp_service._auto_link_to_epics(created_task, context)
+
+        mock_call.assert_awaited_once()
+        assert mock_call.call_args.args[1]['outward_issue'] == 'TEST-100'
+
+    @pytest.mark.asyncio
+    async def test_auto_link_to_epics_links_every_match(self, mcp_service):
+        """Test all matching epics are linked and one failed link doesn't stop the rest."""
+        created_task = {'key': 'TEST-456', 'summary': 'Payment authentication fix'}
+        context = ProjectContext(
+            project_key='TEST',
+            project_name='Test Project',
+            available_epics=[
+                EpicInfo(key='TEST-100', summary='User Authentication Epic'),
+                EpicInfo(key='TEST-200', summary='Payment Processing Epic')
+            ]
+        )
+
+        async def link(operation, params):
+            if params['outward_issue'] == 'TEST-200':
+                raise JiraAPIError("link failed")
+            return {}
+
+        with patch.object(mcp_service, '_make_mcp_call', AsyncMock(side_effect=link)) as mock_call:
+            await mcp_service._auto_link_to_epics(created_task, context)
+
+        linked = sorted(c.args[1]['outward_issue'] for c in mock_call.call_args_list)
+        assert linked == ['TEST-100', 'TEST-200']
+
     @pytest.mark.asyncio
     async def test_get_mock_response(self, mcp_service):
         """Test mock response generation."""
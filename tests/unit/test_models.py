@@ -5,6 +5,7 @@ from datetime import datetime
 
 from src.models.task import JiraTask
 from src.models.qa_item import QAItem
+from src.models.project_context import ProjectContext, EpicInfo, IssueTypeInfo, ComponentInfo
 
 
 class TestJiraTask:
@@ -206,4 +207,71 @@ class TestQAItem:
             'status': 'answered'
         }
         
-        assert result == expected
\ No newline at end of file
+        assert result == expected
+
+class TestProjectContext:
+    """Test cases for ProjectContext model."""
+
+    def _context(self):
+        return ProjectContext(
+            project_key="TEST",
+            project_name="Test Project",
+            available_epics=[
+                EpicInfo(key="TEST-100", summary="User Authentication Epic"),
+                EpicInfo(key="TEST-200", summary="Payment Processing Epic")
+            ]
+        )
+
+    def test_epic_keyword_index_built_on_init(self):
+        """Test epic summary words longer than 3 characters are indexed."""
+        context = self._context()
+
+        assert [e.key for e in context.epic_keyword_index['authentication']] == ["TEST-100"]
+        assert [e.key for e in context.epic_keyword_index['epic']] == ["TEST-100", "TEST-200"]
+        assert 'user' in context.epic_keyword_index
+        assert 'to_dict' not in context.epic_keyword_index
+
+    def test_find_epics_for_text_returns_each_match_once(self):
+        """Test all keyword-sharing epics are returned once, in order of first match."""
+        context = self._context()
+
+        assert [e.key for e in context.find_epics_for_text("Payment authentication fix")] == [
+            "TEST-200", "TEST-100"
+        ]
+        assert [e.key for e in context.find_epics_for_text("payment processing")] == ["TEST-200"]
+        assert context.find_epics_for_text("Unrelated work") == []
+
+    def test_find_epics_for_text_ignores_punctuation_and_suffixes(self):
+        """Test keywords match through punctuation and longer word forms."""
+        context = ProjectContext(
+            project_key="TEST",
+            project_name="Test Project",
+            available_epics=[EpicInfo(key="TEST-200", summary="Payment processing")]
+        )
+
+        for text in ("Fix payment.", "Refund payments", "payment: retry webhook"):
+            assert [e.key for e in context.find_epics_for_text(text)] == ["TEST-200"], text
+        assert context.find_epics_for_text("Fix pay flow") == []
+
+    def test_rebuild_epic_index(self):
+        """Test the index reflects epics added after construction once rebuilt."""
+        context = self._context()
+        context.available_epics.append(EpicInfo(key="TEST-300", summary="Reporting dashboard"))
+
+        assert context.find_epics_for_text("New dashboard") == []
+        context.rebuild_epic_index()
+        assert [e.key for e in context.find_epics_for_text("New dashboard")] == ["TEST-300"]
+
+    def test_name_lookups_built_on_init(self):
+        """Test issue type and component lookups by name are precomputed."""
+        context = ProjectContext(
+            project_key="TEST",
+            project_name="Test Project",
+            issue_types=[IssueTypeInfo(id="1", name="Task", description="", is_subtask=False)],
+            components=[ComponentInfo(id="10", name="Backend")]
+        )
+
+        assert context.issue_type_names == frozenset({"Task"})
+        assert context.component_names == frozenset({"Backend"})
+        assert context.issue_type_by_name["Task"].id == "1"
+        assert context.component_by_name["Backend"].id == "10"
@@ -9,9 +9,12 @@ from src.services.smart_duplicate_service import (
     SmartDuplicateService,
     DuplicateCandidate,
     ConflictResolution,
-    SimilarityAnalysis
+    SimilarityAnalysis,
+    _normalize_text,
+    _text_similarity
 )
 from src.services.mcp_jira_service import ProjectContext
+from src.models.project_context import EpicInfo
 from src.exceptions import DuplicateDetectionError
 from src.config import AppConfig, JiraConfig
 
@@ -336,7 +339,196 @@ class TestSmartDuplicateService:
         
         assert isinstance(analysis, SimilarityAnalysis)
         assert analysis.overall_score < 0.7  # Should be low similarity
-    
+
+    @pytest.mark.asyncio
+    async def test_analyze_bulk_duplicates_loads_project_context_once(self, test_config):
+        """Test every task in a bulk analysis reuses one project context lookup."""
+        mcp_service = AsyncMock()
+        service = SmartDuplicateService(test_config, mcp_service)
+        tasks = [{'summary': f'Task {i}', 'description': ''} for i in range(3)]
+
+        with patch.object(service, '_search_similar_tasks_multi_strategy', return_value=[]):
+            await service.analyze_bulk_duplicates(tasks, 'TEST')
+
+        mcp_service.get_project_context.assert_awaited_once_with('TEST')
+
+    def test_score_candidate_texts_matches_pairwise_scores(self, test_config):
+        """Test the batched text scores equal scoring each candidate on its own."""
+        service = SmartDuplicateService(test_config, AsyncMock())
+        task = {'summary': 'Implement login', 'description': 'Add authentication'}
+        candidates = [
+            {'fields': {'summary': 'Implement user login', 'description': 'Add authentication feature'}},
+            {'fields': {'summary': 'Update billing page', 'description': None}},
+            {'fields': {}},
+        ]
+
+        scores = service._score_candidate_texts(task, candidates)
+
+        assert scores == [
+            pytest.approx(_text_similarity(service._task_text(task), service._candidate_text(c)))
+            for c in candidates
+        ]
+        assert service._score_candidate_texts(task, []) == []
+
+    @pytest.mark.asyncio
+    async def test_find_duplicates_via_mcp_skips_unreachable_candidates(self, test_config):
+        """Test candidates whose text score caps them below the threshold are never analyzed."""
+        service = SmartDuplicateService(test_config, AsyncMock())
+        task = {'summary': 'Implement login', 'description': 'Add authentication'}
+        candidates = [
+            {'key': 'TEST-1', 'fields': {'summary': 'Implement login', 'description': 'Add authentication'}},
+            {'key': 'TEST-2', 'fields': {'summary': 'Update billing page', 'description': 'Invoices'}},
+        ]
+
+        with patch.object(service, '_search_similar_tasks_multi_strategy', return_value=candidates), \
+             patch.object(service, '_analyze_comprehensive_similarity',
+                          wraps=service._analyze_comprehensive_similarity) as analyze:
+            await service.find_duplicates_via_mcp(task, 'TEST', project_context=Mock())
+
+        assert [call.args[1]['key'] for call in analyze.await_args_list] == ['TEST-1']
+
+    @pytest.mark.asyncio
+    async def test_suggest_task_relationships_ranks_epics_per_task(self, test_config):
+        """Test batched epic scoring suggests each task's best epics above the cutoff."""
+        service = SmartDuplicateService(test_config, AsyncMock())
+        context = ProjectContext(
+            project_key='TEST',
+            project_name='Test Project',
+            available_epics=[
+                EpicInfo(key='TEST-100', summary='Payment processing'),
+                EpicInfo(key='TEST-200', summary='User authentication'),
+                EpicInfo(key='TEST-300', summary='Zzz qqq'),
+            ]
+        )
+        tasks = [
+            {'summary': 'User authentication', 'description': ''},
+            {'summary': 'Payment processing', 'description': 'refunds'},
+        ]
+
+        relationships = await service.suggest_task_relationships(tasks, context)
+
+        suggested = {r['task_id']: [s['epic_key'] for s in r['epic_suggestions']] for r in relationships}
+        assert suggested['task_0'][0] == 'TEST-200'
+        assert suggested['task_1'][0] == 'TEST-100'
+        assert all('TEST-300' not in keys for keys in suggested.values())
+
+        single = await service._suggest_epic_relationships(tasks[0], context)
+        assert [s['epic_key'] for s in single] == suggested['task_0']
+
+    def test_calculate_temporal_similarity_buckets_by_age(self, test_config):
+        """Test each age boundary maps to its temporal score."""
+        service = SmartDuplicateService(test_config, AsyncMock())
+        now = datetime.now().astimezone()
+
+        def score(days_old):
+            created = (now - timedelta(days=days_old, hours=1)).isoformat()
+            return service._calculate_temporal_similarity({}, {'fields': {'created': created}})
+
+        assert [score(d) for d in (0, 7, 8, 30, 31, 90, 91)] == [1.0, 1.0, 0.8, 0.8, 0.6, 0.6, 0.4]
+        assert service._calculate_temporal_similarity({}, {'fields': {'created': 'not a date'}}) == 0.5
+
+    @pytest.mark.asyncio
+    async def test_search_strategies_merge_in_precedence_order(self, test_config):
+        """Test concurrent strategies merge by issue key with earlier strategies winning."""
+        service = SmartDuplicateService(test_config, AsyncMock())
+        text_hit = {'key': 'TEST-1', 'source': 'text'}
+
+        with patch.object(service, '_search_by_text_similarity', return_value=[text_hit]), \
+             patch.object(service, '_search_by_keywords',
+                          return_value=[{'key': 'TEST-1', 'source': 'keyword'}, {'key': 'TEST-2'}]), \
+             patch.object(service, '_search_by_semantic_similarity',
+                          return_value=[{'key': ''}, {'key': 'TEST-3'}]):
+            candidates = await service._search_similar_tasks_multi_strategy(
+                {'summary': 'Login'}, 'TEST', Mock(), False
+            )
+
+        assert [c['key'] for c in candidates] == ['TEST-1', 'TEST-2', 'TEST-3']
+        assert candidates[0] is text_hit
+
+    @pytest.mark.asyncio
+    async def test_find_duplicates_via_mcp_reuses_recent_candidates(self, test_config):
+        """Test rechecking the same task text, up to case and punctuation, reuses its candidates."""
+        service = SmartDuplicateService(test_config, AsyncMock())
+        task = {'summary': 'Implement login', 'description': 'Add authentication'}
+
+        with patch.object(service, '_search_similar_tasks_multi_strategy', return_value=[]) as search:
+            await service.find_duplicates_via_mcp(task, 'TEST')
+            await service.find_duplicates_via_mcp(
+                {'summary': 'implement LOGIN.', 'description': 'Add authentication!'}, 'TEST'
+            )
+            await service.find_duplicates_via_mcp(task, 'TEST', include_resolved=True)
+
+        assert search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_analyze_bulk_duplicates_scans_tasks_concurrently(self, test_config):
+        """Test per-task JIRA scans overlap and results stay keyed by task position."""
+        service = SmartDuplicateService(test_config, AsyncMock())
+        tasks = [{'summary': f'Task {i}', 'description': ''} for i in range(4)]
+        in_flight = 0
+        peak = 0
+
+        async def fake_find(task, project_key, include_resolved=False, project_context=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [Mock(issue_key=task['summary'], recommendation='link', confidence=0.5)]
+
+        with patch.object(service, 'find_duplicates_via_mcp', side_effect=fake_find):
+            result = await service.analyze_bulk_duplicates(tasks, 'TEST')
+
+        assert peak == len(tasks)
+        assert {
+            task_id: [dup.issue_key for dup in dups] for task_id, dups in result['duplicates_found'].items()
+        } == {f'task_{i}': [f'Task {i}'] for i in range(4)}
+
+    def test_normalize_text_memoizes_repeated_text(self):
+        """Test task text is normalized once and the processed string reused."""
+        first = _normalize_text("Fix the Login-Bug!")
+        second = _normalize_text("Fix the Login-Bug!")
+
+        assert first == "fix the login bug"
+        assert first is second
+
+    def test_text_similarity_memoizes_repeated_pairs(self):
+        """Test a task/candidate text pair is scored once and then served from cache."""
+        _text_similarity.cache_clear()
+
+        first = _text_similarity("Fix login bug", "Login bug fix")
+        second = _text_similarity("Fix login bug", "Login bug fix")
+
+        assert first == second == 1.0
+        assert _text_similarity.cache_info().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_find_cross_references_matches_pairwise_scoring(self, test_config):
+        """Test the batched cross-reference pass finds the same pairs as pairwise scoring."""
+        service = SmartDuplicateService(test_config, AsyncMock())
+        tasks = [
+            {'summary': 'Implement user authentication', 'description': 'Add login feature'},
+            {'summary': 'Update billing page', 'description': 'New invoice layout'},
+            {'summary': 'implement user authentication!', 'description': 'add login feature'},
+            {'summary': 'Implement user authentication', 'description': 'Add login feature'},
+        ]
+
+        expected = []
+        for i in range(len(tasks)):
+            for j in range(i + 1, len(tasks)):
+                analysis = await service._analyze_task_to_task_similarity(tasks[i], tasks[j])
+                if analysis.overall_score >= test_config.jira.similarity_threshold:
+                    expected.append((f"task_{i}", f"task_{j}", pytest.approx(analysis.overall_score)))
+
+        cross_references = service._find_cross_references(tasks)
+
+        assert [
+            (ref['task_1_id'], ref['task_2_id'], ref['similarity_score']) for ref in cross_references
+        ] == expected
+        assert [(ref[0], ref[1]) for ref in expected] == [
+            ('task_0', 'task_2'), ('task_0', 'task_3'), ('task_2', 'task_3')
+        ]
+
     @pytest.mark.asyncio
     async def test_analyze_task_to_task_similarity(self, duplicate_service):
         """Test similarity analysis between two new tasks."""
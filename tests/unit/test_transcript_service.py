@@ -0,0 +1,162 @@
+"""Unit tests for transcript analysis service."""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+
+from src.services.transcript_service import (
+    TranscriptAnalysisService,
+    TRANSCRIPT_CHUNK_MIN_CHARS,
+    TRANSCRIPT_CHUNK_MAX_CHARS
+)
+from src.config import AppConfig
+
+
+def _transcript(lines: int, prefix: str = "Speaker") -> str:
+    """Build a transcript of numbered, distinct lines."""
+    return ''.join(
+        f"{prefix} {n}: we discussed item number {n} and agreed on next steps\n"
+        for n in range(lines)
+    )
+
+
+class TestTranscriptAnalysisService:
+    """Test cases for TranscriptAnalysisService."""
+
+    @pytest.fixture
+    def ai_service(self):
+        """Create mock AI service."""
+        return Mock()
+
+    @pytest.fixture
+    def service(self, ai_service):
+        """Create transcript analysis service with a mock AI service."""
+        return TranscriptAnalysisService(AppConfig(), ai_service=ai_service)
+
+    def test_split_single_line_is_one_chunk(self, service):
+        """Test a transcript without newlines is never split, however long."""
+        transcript = "word " * (TRANSCRIPT_CHUNK_MAX_CHARS // 2)
+
+        assert service._split_transcript_chunks(transcript) == [transcript]
+
+    def test_split_keeps_text_and_folds_short_tail(self, service):
+        """Test chunks cover the transcript exactly and none after the first is undersized."""
+        transcript = _transcript(400)
+        chunks = service._split_transcript_chunks(transcript)
+
+        assert len(chunks) > 1
+        assert ''.join(chunks) == transcript
+        assert all(chunk.endswith('\n') for chunk in chunks)
+        assert all(len(chunk) >= TRANSCRIPT_CHUNK_MIN_CHARS for chunk in chunks)
+
+    def test_split_boundaries_survive_an_edit(self, service):
+        """Test editing one line only changes the chunk containing it."""
+        transcript = _transcript(400)
+        original = service._split_transcript_chunks(transcript)
+
+        lines = transcript.splitlines(keepends=True)
+        lines[200] = "Speaker 200: we changed our minds about this one\n"
+        edited = service._split_transcript_chunks(''.join(lines))
+
+        changed = [i for i, (a, b) in enumerate(zip(original, edited)) if a != b]
+        assert len(original) == len(edited)
+        assert len(changed) == 1
+        assert "changed our minds" in edited[changed[0]]
+
+    def test_chunked_extraction_defers_iterative_fallback(self, service, ai_service):
+        """Test chunks skip the iterative fallback when the merged result has enough tasks."""
+        transcript = _transcript(400)
+        chunk_count = len(service._split_transcript_chunks(transcript))
+        ai_service.parse_transcript_chunk.side_effect = lambda chunk, context: (
+            [{'summary': chunk.splitlines()[0]}], []
+        )
+
+        tasks, qa_items = service._extract_chunked(transcript, "")
+
+        assert ai_service.parse_transcript_chunk.call_count == chunk_count
+        assert len(tasks) == min(chunk_count, service.config.max_tasks_per_transcript)
+        ai_service.parse_transcript_and_questions.assert_not_called()
+        ai_service.extract_tasks_iteratively.assert_not_called()
+
+    def test_chunked_extraction_runs_iterative_fallback_once(self, service, ai_service):
+        """Test too few merged tasks trigger one iterative pass over the whole transcript."""
+        transcript = _transcript(400)
+        ai_service.parse_transcript_chunk.return_value = ([{'summary': 'Same task'}], [])
+        ai_service.extract_tasks_iteratively.return_value = [
+            {'summary': 'First task'}, {'summary': 'Second task'}
+        ]
+
+        tasks, _ = service._extract_chunked(transcript, "")
+
+        ai_service.extract_tasks_iteratively.assert_called_once_with(transcript, "")
+        assert [task['summary'] for task in tasks] == ['First task', 'Second task']
+
+    def test_analysis_is_single_pass_by_default(self, service, ai_service):
+        """Test a long transcript goes to the model whole unless chunking is enabled."""
+        transcript = _transcript(400)
+        service._cache_service = Mock()
+        service._cache_service.get_transcript_analysis.return_value = None
+        ai_service.parse_transcript_and_questions.return_value = ([{'summary': 'Fix login'}], [])
+
+        result = service.analyze_transcript(transcript)
+
+        assert result['tasks'] == [{'summary': 'Fix login'}]
+        ai_service.parse_transcript_and_questions.assert_called_once_with(transcript, "")
+        ai_service.parse_transcript_chunk.assert_not_called()
+
+    def test_chunked_stream_matches_chunked_analysis(self, service, ai_service):
+        """Test with chunking enabled the streamed and one-shot results are the same."""
+        transcript = _transcript(400)
+        service.config.chunked_transcript_analysis = True
+        service._cache_service = Mock()
+        service._cache_service.get_transcript_analysis.return_value = None
+        ai_service.parse_transcript_chunk.side_effect = lambda chunk, context: (
+            [{'summary': chunk.splitlines()[0]}], []
+        )
+
+        result = service.analyze_transcript(transcript)
+        events = list(service.analyze_transcript_stream(transcript))
+
+        assert [e['data'] for e in events if e['event'] == 'task'] == result['tasks']
+        assert events[-1]['data'] == result
+        ai_service.parse_transcript_stream.assert_not_called()
+
+    def test_batch_shares_model_call_limit_with_chunks(self, service, ai_service):
+        """Test batch and chunk workers together stay within the model call limit."""
+        service.config.chunked_transcript_analysis = True
+        service._cache_service = Mock()
+        service._cache_service.get_transcript_analysis.return_value = None
+        limit = service.config.ollama.max_concurrent_requests
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def parse_chunk(chunk, context):
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.pop()
+            return [{'summary': chunk.splitlines()[0]}], []
+
+        ai_service.parse_transcript_chunk.side_effect = parse_chunk
+        transcripts = [(_transcript(400, prefix=f"Person{n}"), "") for n in range(limit)]
+
+        results = service.analyze_transcripts_batch(transcripts)
+
+        assert all(result['success'] for result in results)
+        assert max(peak) <= limit
+
+    def test_batch_reports_invalid_transcripts_per_item(self, service, ai_service):
+        """Test an invalid transcript fails its own item without calling the model."""
+        service._cache_service = Mock()
+        service._cache_service.get_transcript_analysis.return_value = None
+        ai_service.parse_transcript_and_questions.return_value = ([{'summary': 'Fix login'}], [])
+
+        ok, short = service.analyze_transcripts_batch([(_transcript(3), ""), ("too short", "")])
+
+        assert ok['tasks'] == [{'summary': 'Fix login'}]
+        assert short == {'success': False, 'error': 'Transcript too short (minimum 10 words)'}
+        ai_service.parse_transcript_and_questions.assert_called_once()